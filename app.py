@@ -1,11 +1,9 @@
 import streamlit as st
-from utils.data_loader import load_data
-from utils.feature_engineering import add_primary_genre
+from utils.prefetch import start_prefetch
 
-if "df" not in st.session_state:
-    df = load_data()
-    df = add_primary_genre(df)
-    st.session_state["df"] = df
+# Warm every page's caches in the background while the landing page is
+# read; sessions share the results instead of recomputing them
+prefetcher = start_prefetch()
 
 # =========================
 # Global Page Config
@@ -44,6 +42,25 @@ st.sidebar.markdown(
 st.sidebar.markdown("---")
 st.sidebar.caption("Built with Streamlit • Plotly • Pandas")
 
+
+# =========================
+# Page Warm-Up Progress
+# =========================
+def render_prefetch_status():
+    finished, total = prefetcher.progress()
+    st.progress(finished / total, text=f"Preparing pages: {finished}/{total} tasks")
+    with st.expander("Warm-up tasks"):
+        st.dataframe(prefetcher.status(), hide_index=True, use_container_width=True)
+
+
+with st.sidebar:
+    # Re-run just this block every second while tasks are still running
+    finished, total = prefetcher.progress()
+    if finished < total:
+        st.fragment(render_prefetch_status, run_every=1)()
+    else:
+        render_prefetch_status()
+
 # =========================
 # Main Landing Page
 # =========================
@@ -0,0 +1,63 @@
+"""
+Segmented median kernel vs pandas `groupby().median()`.
+
+Run from the repository root:
+    python -m benchmarks.bench_median
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.kernels import segmented_median
+
+SIZES = [65_000, 1_000_000, 10_000_000]
+
+# Roughly the developer cardinality of the real catalog, capped for small runs
+MAX_GROUPS = 50_000
+
+
+def _best_of(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(sizes=SIZES, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+
+    for n in sizes:
+        n_groups = min(n // 3, MAX_GROUPS)
+        codes = rng.integers(0, n_groups, n)
+        # Long-tailed engagement, like recommendations
+        values = (rng.pareto(1.2, n) * 10).astype("uint32")
+
+        pandas_time, expected = _best_of(
+            lambda: pd.Series(values).groupby(codes).median()
+        )
+        kernel_time, actual = _best_of(
+            lambda: segmented_median(codes, values, n_groups)
+        )
+
+        expected = expected.reindex(range(n_groups)).to_numpy()
+        assert np.allclose(expected, actual, equal_nan=True)
+
+        rows.append(
+            {
+                "rows": n,
+                "groups": n_groups,
+                "pandas_s": round(pandas_time, 4),
+                "kernel_s": round(kernel_time, 4),
+                "speedup": round(pandas_time / kernel_time, 1),
+            }
+        )
+
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    print(run().to_string(index=False))
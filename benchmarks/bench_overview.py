@@ -0,0 +1,107 @@
+"""
+NumPy KPI kernel (`compute_overview_metrics`) vs the previous pandas
+implementation (nunique, groupby and a full sort of recommendations).
+
+Run from the repository root:
+    python -m benchmarks.bench_overview
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.metrics import compute_overview_metrics
+
+SIZES = [65_000, 1_000_000, 5_000_000]
+
+GENRES = [
+    "Action", "Adventure", "Casual", "Indie", "Puzzle", "Racing",
+    "RPG", "Simulation", "Sports", "Strategy", "Unknown",
+]
+
+
+def _best_of(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def pandas_overview(df):
+    metrics = {}
+
+    metrics["total_games"] = df["appid"].nunique()
+    metrics["total_recommendations"] = int(df["recommendations"].sum())
+    metrics["avg_price"] = round(df["price"].mean(), 2)
+    metrics["free_pct"] = round((df["price"] == 0).mean() * 100, 1)
+
+    genre_reco = (
+        df.groupby("primary_genre", observed=True)["recommendations"]
+        .sum()
+        .sort_values(ascending=False)
+    )
+    metrics["top_genre"] = genre_reco.index[0] if not genre_reco.empty else "N/A"
+
+    top_20_pct_cutoff = int(len(df) * 0.2)
+    sorted_reco = df["recommendations"].sort_values(ascending=False)
+    metrics["top_20_share"] = round(
+        sorted_reco.head(top_20_pct_cutoff).sum() / sorted_reco.sum() * 100, 1
+    )
+
+    # The summary's second pass
+    metrics["releases_by_year"] = df.groupby("release_year").size()
+    return metrics
+
+
+def _frame(n, rng):
+    recommendations = np.floor(rng.pareto(1.2, n) * 10)
+    recommendations[rng.random(n) < 0.01] = np.nan
+    price = rng.choice([0, 199, 499, 999, 1999], n).astype("float64")
+
+    return pd.DataFrame(
+        {
+            "appid": rng.permutation(3 * n)[:n].astype("uint32"),
+            "recommendations": recommendations,
+            "price": price,
+            "primary_genre": pd.Categorical(rng.choice(GENRES, n), categories=GENRES),
+            "release_year": rng.integers(2006, 2026, n).astype("int16"),
+        }
+    )
+
+
+def run(sizes=SIZES, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+
+    for n in sizes:
+        df = _frame(n, rng)
+
+        pandas_time, expected = _best_of(lambda: pandas_overview(df))
+        kernel_time, actual = _best_of(lambda: compute_overview_metrics(df))
+
+        for key in ["total_games", "free_pct", "top_genre"]:
+            assert expected[key] == actual[key], (key, expected[key], actual[key])
+        # Same float64 values, summed in another order
+        assert abs(expected["total_recommendations"] - actual["total_recommendations"]) <= (
+            1e-6 * actual["total_recommendations"]
+        )
+        assert abs(expected["avg_price"] - actual["avg_price"]) <= 0.01
+        assert abs(expected["top_20_share"] - actual["top_20_share"]) <= 0.1
+        assert expected["releases_by_year"].to_numpy().tolist() == actual["releases_by_year"].to_numpy().tolist()
+
+        rows.append(
+            {
+                "rows": n,
+                "pandas_s": round(pandas_time, 4),
+                "kernel_s": round(kernel_time, 4),
+                "speedup": round(pandas_time / kernel_time, 1),
+            }
+        )
+
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    print(run().to_string(index=False))
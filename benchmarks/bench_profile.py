@@ -0,0 +1,151 @@
+"""
+Column profile (`profile_chunks`: one chunked pass computing nulls,
+distinct counts, ranges, quantiles and top values) vs pandas. `health_s`
+is the previous Dataset Health scans alone (`isna` over the frame three
+times, a groupby per year, separate median / mean / value_counts scans);
+`pandas_profile_s` adds the per-column statistics of the profile table,
+each its own pandas scan. All three derive the same health tables.
+
+Run from the repository root:
+    python -m benchmarks.bench_profile
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.aggregation import clear_memo
+from utils.dataset import stamp_version
+from utils.feature_engineering import yearly_coverage
+from utils.profiling import PROFILE_CHUNK_ROWS, profile_chunks
+
+SIZES = [65_000, 1_000_000]
+
+GENRES = [
+    "Action", "Adventure", "Casual", "Indie", "Puzzle", "Racing",
+    "RPG", "Simulation", "Sports", "Strategy",
+]
+
+
+def _best_of(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def pandas_health(df):
+    missing = (
+        df.isna()
+        .mean()
+        .mul(100)
+        .round(2)
+        .reset_index()
+        .rename(columns={"index": "column", 0: "missing_pct"})
+    )
+    yearly = (
+        df.groupby("release_year")["appid"]
+        .count()
+        .reset_index(name="records")
+        .sort_values("release_year")
+    )
+
+    # calculate_dataset_health_score and generate_dataset_health_summary
+    missing_share = df.isna().mean().mean()
+    df.isna().mean().mean()
+    skewed = df["recommendations"].median() < df["recommendations"].mean() / 3
+    df["recommendations"].median() < df["recommendations"].mean() / 3
+    df["publisher"].value_counts()
+
+    return missing, yearly, missing_share, skewed
+
+
+def pandas_profile(df):
+    result = pandas_health(df)
+    for column in df.columns:
+        values = df[column]
+        values.isna().sum()
+        values.nunique()
+        values.value_counts().head(5)
+        if values.dtype.kind in "iuf":
+            values.min(), values.max(), values.mean()
+            values.quantile([0.25, 0.5, 0.75])
+    return result
+
+
+def profile_health(df):
+    profile = profile_chunks(
+        df.iloc[start:start + PROFILE_CHUNK_ROWS] for start in range(0, len(df), PROFILE_CHUNK_ROWS)
+    )
+    skewed = profile.quantiles([0.5]).at["recommendations", 0.5] < profile.mean("recommendations") / 3
+    # Coverage counts appids per year; timed as a memo miss
+    clear_memo()
+    return (
+        profile.missing_value_summary(),
+        yearly_coverage(df),
+        profile.missing_share(),
+        skewed,
+    )
+
+
+def _frame(n, rng):
+    genre_lists = [
+        ",".join(rng.choice(GENRES, rng.integers(1, 4), replace=False)) for _ in range(2_000)
+    ]
+    genres = pd.Categorical(rng.choice(genre_lists, n))
+    publisher = pd.Categorical(rng.integers(0, n // 20, n).astype(str))
+
+    df = pd.DataFrame(
+        {
+            "appid": rng.permutation(3 * n)[:n].astype("uint32"),
+            "name": pd.array([f"game {i}" for i in range(n)], dtype="str"),
+            "genres": genres,
+            "publisher": publisher,
+            "developer": pd.Categorical(rng.integers(0, n // 3, n).astype(str)),
+            "price": rng.choice([0, 199, 499, 999, 1999], n).astype("float64"),
+            "recommendations": np.floor(rng.pareto(1.2, n) * 10),
+            "release_year": rng.integers(2006, 2026, n).astype("int16"),
+        }
+    )
+    df.loc[rng.random(n) < 0.02, "genres"] = np.nan
+    df.loc[rng.random(n) < 0.03, "publisher"] = np.nan
+    df.loc[rng.random(n) < 0.01, "recommendations"] = np.nan
+    return df
+
+
+def run(sizes=SIZES, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+
+    for n in sizes:
+        # Stamped like the loader's frames, so memo keys skip hashing rows
+        df = stamp_version(_frame(n, rng), f"bench-{n}")
+
+        health_time, expected = _best_of(lambda: pandas_health(df))
+        pandas_time, _ = _best_of(lambda: pandas_profile(df))
+        profile_time, actual = _best_of(lambda: profile_health(df))
+
+        pd.testing.assert_frame_equal(actual[0], expected[0])
+        pd.testing.assert_frame_equal(
+            actual[1].astype("int64"), expected[1].reset_index(drop=True).astype("int64")
+        )
+        assert abs(actual[2] - expected[2]) < 1e-12
+        assert actual[3] == expected[3]
+
+        rows.append(
+            {
+                "rows": n,
+                "health_s": round(health_time, 3),
+                "pandas_profile_s": round(pandas_time, 3),
+                "profile_s": round(profile_time, 3),
+                "speedup": round(pandas_time / profile_time, 1),
+            }
+        )
+
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    print(run().to_string(index=False))
@@ -0,0 +1,120 @@
+"""
+Incremental refresh (`carry_forward`: diff by appid, then apply the
+delta to the cached cubes) vs rebuilding the cubes from every row, after
+changing 1% of the catalog. As in the loader, the previous version's row
+digests come from its column store; the new version is hashed in the
+timed section.
+
+Run from the repository root:
+    python -m benchmarks.bench_refresh
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.changes import row_digests
+from utils.features import _feature_key, carry_forward, compute_feature, get_feature
+from utils.result_cache import ResultCache
+import utils.features as features
+
+SIZES = [250_000, 1_000_000]
+
+CHANGED_SHARE = 0.01
+
+# Features carried across versions by delta
+CUBES = ["cube", "genre_cube"]
+
+GENRES = [
+    "Action", "Adventure", "Casual", "Indie", "Puzzle", "Racing",
+    "RPG", "Simulation", "Sports", "Strategy",
+]
+
+
+def _frame(n, rng, version):
+    genre_lists = [
+        ",".join(rng.choice(GENRES, rng.integers(1, 4), replace=False)) for _ in range(2_000)
+    ]
+    df = pd.DataFrame(
+        {
+            "appid": rng.permutation(3 * n)[:n].astype("uint32"),
+            "genres": pd.Categorical(rng.choice(genre_lists, n)),
+            "publisher": pd.Categorical(rng.integers(0, n // 20, n).astype(str)),
+            "developer": pd.Categorical(rng.integers(0, n // 3, n).astype(str)),
+            "price": rng.choice([0, 199, 499, 999, 1999], n).astype("float64"),
+            "recommendations": np.floor(rng.pareto(1.2, n) * 10),
+            "release_year": rng.integers(2006, 2026, n).astype("int16"),
+        }
+    )
+    df.attrs["dataset_version"] = version
+    return df
+
+
+def _next_version(df, rng, version):
+    n = len(df)
+    changed = int(n * CHANGED_SHARE)
+
+    # A third each: removed, modified, added
+    keep = np.ones(n, dtype=bool)
+    keep[rng.choice(n, changed // 3, replace=False)] = False
+    current = df[keep].reset_index(drop=True)
+
+    recommendations = current["recommendations"].to_numpy().copy()
+    recommendations[rng.choice(len(current), changed // 3, replace=False)] += 5
+    current["recommendations"] = recommendations
+
+    added = df.sample(changed // 3, random_state=0).reset_index(drop=True)
+    added["appid"] = (np.arange(len(added)) + 3 * n).astype("uint32")
+
+    current = pd.concat([current, added], ignore_index=True)
+    current.attrs["dataset_version"] = version
+    return current
+
+
+def run(sizes=SIZES, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+
+    for n in sizes:
+        previous = _frame(n, rng, f"v1-{n}")
+        current = _next_version(previous, rng, f"v2-{n}")
+
+        # A memory-only cache, so the disk tier does not skew the timings
+        features.result_cache = ResultCache(1 << 40)
+        for name in CUBES:
+            get_feature(previous, name)
+        previous_digests = row_digests(previous)
+
+        start = time.perf_counter()
+        carry_forward(previous, current, previous_digests, row_digests(current))
+        incremental = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rebuilt = {name: compute_feature(current, name) for name in CUBES}
+        full = time.perf_counter() - start
+
+        for name in CUBES:
+            carried = features.result_cache.get(_feature_key(current, name))
+            keys = carried.dimensions[:1]
+            expected = rebuilt[name].metrics(keys).sort_values(keys).reset_index(drop=True)
+            actual = carried.metrics(keys).sort_values(keys).reset_index(drop=True)
+            for key in keys:
+                expected[key] = expected[key].astype(str)
+                actual[key] = actual[key].astype(str)
+            pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+        rows.append(
+            {
+                "rows": n,
+                "changed_rows": int(n * CHANGED_SHARE),
+                "rebuild_s": round(full, 3),
+                "incremental_s": round(incremental, 3),
+                "speedup": round(full / incremental, 1),
+            }
+        )
+
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    print(run().to_string(index=False))
@@ -0,0 +1,48 @@
+"""
+Precomputes every page's aggregates into one snapshot file.
+
+    python materialize.py [--source data/steam_games.csv] [--output PATH]
+
+Pages read the snapshot while it matches the CSV (content hash and dtype
+plan); rerun this after the data changes.
+"""
+import argparse
+import time
+from pathlib import Path
+
+from utils.data_loader import (
+    DATA_PATH,
+    current_source_signature,
+    load_columnar,
+    snapshot_path,
+)
+from utils.schema import SCHEMA_VERSION
+from utils.snapshot import materialize, write_snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", type=Path, default=DATA_PATH)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    output = args.output or snapshot_path(args.source)
+
+    start = time.perf_counter()
+    df = load_columnar(args.source)
+    signature = current_source_signature(args.source)
+
+    write_snapshot(
+        materialize(df),
+        output,
+        source={**signature, "schema_version": SCHEMA_VERSION},
+    )
+
+    print(
+        f"Wrote {output} ({output.stat().st_size / 1e3:.1f} kB) "
+        f"from {len(df):,} rows in {time.perf_counter() - start:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,36 @@
+import numpy as np
+import pandas as pd
 import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
 
 from utils.metrics import (
     compute_overview_metrics,
     generate_overview_summary
 )
 
-from utils.feature_engineering import add_primary_genre
+from utils.binning import histogram
+from utils.box_stats import tier_box_stats
+from utils.features import get_feature, with_features
+from utils.filters import filtered_data, sidebar_filters
 
 
 # ===============================
 # Data
 # ===============================
-from utils.data_loader import load_data
+from utils.data_loader import load_aggregates
 
-df = load_data()
-df = add_primary_genre(df)
+filters = sidebar_filters()
+
+# Snapshot or streamed partials when available (and unfiltered),
+# raw rows otherwise
+aggregates = None if filters else load_aggregates()
+precomputed = aggregates is not None
+
+if precomputed:
+    df = None
+else:
+    df = with_features(filtered_data(filters), "primary_genre")
 
 st.title("Steam Market Intelligence — Executive Overview")
 st.caption(
@@ -25,7 +40,7 @@ st.caption(
 # ===============================
 # KPI ROW
 # ===============================
-metrics = compute_overview_metrics(df)
+metrics = aggregates.overview_metrics() if precomputed else compute_overview_metrics(df)
 
 col1, col2, col3, col4, col5 = st.columns(5)
 
@@ -44,8 +59,8 @@ col1, col2 = st.columns(2)
 
 with col1:
     releases = (
-        df.groupby("release_year")
-        .size()
+        metrics["releases_by_year"]
+        .rename_axis("release_year")
         .reset_index(name="games_released")
     )
 
@@ -60,13 +75,21 @@ with col1:
     st.plotly_chart(fig, use_container_width=True)
 
 with col2:
-    fig = px.histogram(
-        df,
-        x="recommendations",
-        nbins=60,
+    # Binned on the server: only edges and counts reach the browser
+    if precomputed:
+        bins = aggregates.histogram(nbins=60)
+    else:
+        bins = histogram(df, "recommendations", nbins=60)
+
+    fig = px.bar(
+        bins,
+        x=(bins["bin_start"] + bins["bin_end"]) / 2,
+        y="games",
         log_y=True,
+        hover_data=["bin_start", "bin_end"],
         title="Distribution of Player Recommendations (Long-Tail Effect)"
     )
+    fig.update_traces(width=bins["bin_end"] - bins["bin_start"])
     fig.update_layout(
         xaxis_title="Number of Recommendations",
         yaxis_title="Number of Games"
@@ -81,14 +104,37 @@ st.markdown("---")
 col1, col2 = st.columns(2)
 
 with col1:
-    df["price_type"] = df["price"].apply(lambda x: "Free" if x == 0 else "Paid")
-
-    fig = px.box(
-        df,
-        x="price_type",
-        y="recommendations",
-        log_y=True,
-        title="Player Engagement: Free vs Paid Games"
+    # Summary statistics only: the payload is constant in the number of games
+    if precomputed:
+        box = aggregates.box_stats("pricing_type")
+    else:
+        box = tier_box_stats(df, "recommendations")
+
+    fig = go.Figure(
+        go.Box(
+            x=box["category"],
+            q1=box["q1"],
+            median=box["median"],
+            q3=box["q3"],
+            lowerfence=box["lowerfence"],
+            upperfence=box["upperfence"],
+            boxpoints=False,
+            name="Recommendations",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=np.repeat(box["category"].to_numpy(), box["outliers"].map(len)),
+            y=np.concatenate(box["outliers"].to_list()),
+            mode="markers",
+            marker={"size": 4},
+            name="Outliers (sample)",
+        )
+    )
+    fig.update_layout(
+        title="Player Engagement: Free vs Paid Games",
+        yaxis_type="log",
+        showlegend=False,
     )
     fig.update_layout(
         xaxis_title="Game Type",
@@ -97,13 +143,21 @@ with col1:
     st.plotly_chart(fig, use_container_width=True)
 
 with col2:
-    genre_reco = (
-        df.groupby("primary_genre")["recommendations"]
-        .sum()
-        .sort_values(ascending=False)
-        .head(10)
-        .reset_index()
-    )
+    if precomputed:
+        genre_reco = (
+            aggregates.metrics("primary_genre")
+            .rename(columns={"total_recommendations": "recommendations"})
+            .sort_values("recommendations", ascending=False)
+            .head(10)[["primary_genre", "recommendations"]]
+        )
+    else:
+        genre_reco = (
+            get_feature(df, "cube")
+            .metrics(["primary_genre"], ("total_recommendations",))
+            .rename(columns={"total_recommendations": "recommendations"})
+            .sort_values("recommendations", ascending=False)
+            .head(10)
+        )
 
     fig = px.bar(
         genre_reco,
@@ -120,6 +174,54 @@ with col2:
 
 st.markdown("---")
 
+# ===============================
+# ROW 4 — Market Concentration
+# ===============================
+concentration = aggregates.concentration() if precomputed else get_feature(df, "concentration")
+games = concentration["games"]
+publishers = concentration["publishers"]
+
+col1, col2, col3, col4 = st.columns(4)
+
+col1.metric("Gini (Games)", f"{games['gini']:.2f}")
+col2.metric("Top 1% Games Share", f"{games['top_1pct_share']:.1%}")
+col3.metric("Publisher HHI", f"{publishers['hhi']:,.0f}")
+col4.metric("Top 5 Publishers Share", f"{publishers['top_5_share']:.1%}")
+
+lorenz = pd.concat(
+    [
+        concentration[dimension]["lorenz"].assign(dimension=dimension.title())
+        for dimension in ["games", "publishers", "developers", "genres"]
+    ],
+    ignore_index=True,
+)
+
+fig = px.line(
+    lorenz,
+    x="population_share",
+    y="value_share",
+    color="dimension",
+    title="Lorenz Curves of Player Recommendations"
+)
+fig.add_trace(
+    go.Scatter(
+        x=[0, 1],
+        y=[0, 1],
+        mode="lines",
+        line={"dash": "dot", "color": "gray"},
+        name="Equal Share",
+    )
+)
+fig.update_layout(
+    xaxis_title="Share of Games / Entities (smallest first)",
+    yaxis_title="Share of Recommendations",
+    xaxis_tickformat=".0%",
+    yaxis_tickformat=".0%",
+)
+st.plotly_chart(fig, use_container_width=True)
+
+st.markdown("---")
+
 # ===============================
 # AUTO-GENERATED SUMMARY
 # ===============================
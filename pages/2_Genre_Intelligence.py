@@ -2,8 +2,12 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
-from utils.data_loader import load_data
-from utils.feature_engineering import explode_genres
+from utils.data_loader import (
+    load_aggregates,
+)
+from utils.cube import cube_genre_metrics, cube_genre_yearly_totals
+from utils.features import get_feature
+from utils.filters import filtered_data, sidebar_filters
 from utils.metrics import generate_genre_summary
 
 st.set_page_config(layout="wide")
@@ -19,28 +23,24 @@ st.caption(
 # =========================
 # Load Data
 # =========================
-df = load_data()
+filters = sidebar_filters()
 
-df = df.dropna(subset=["genres", "recommendations"])
-df = df[df["recommendations"] > 0]
+# Snapshot or streamed partials when available (and unfiltered),
+# raw rows otherwise
+aggregates = None if filters else load_aggregates()
+precomputed = aggregates is not None
 
-# =========================
-# Feature Engineering
-# =========================
-df_genres = explode_genres(df)
+if not precomputed:
+    # One fact per engaged game and listed genre, rolled up per chart
+    genre_cube = get_feature(filtered_data(filters), "genre_cube")
 
 # =========================
 # Genre Metrics
 # =========================
-genre_stats = (
-    df_genres.groupby("genres")
-    .agg(
-        game_count=("appid", "count"),
-        total_recommendations=("recommendations", "sum"),
-        avg_recommendations=("recommendations", "mean"),
-    )
-    .reset_index()
-)
+if precomputed:
+    genre_stats = aggregates.genre_metrics()
+else:
+    genre_stats = cube_genre_metrics(genre_cube)
 
 # =========================
 # ROW 1 — Metric Toggle
@@ -98,12 +98,10 @@ top_genres = (
     .head(6)["genres"]
 )
 
-genre_yearly = (
-    df_genres[df_genres["genres"].isin(top_genres)]
-    .groupby(["release_year", "genres"])["recommendations"]
-    .sum()
-    .reset_index()
-)
+if precomputed:
+    genre_yearly = aggregates.genre_yearly_totals(top_genres)
+else:
+    genre_yearly = cube_genre_yearly_totals(genre_cube, top_genres)
 
 fig_trend = px.area(
     genre_yearly,
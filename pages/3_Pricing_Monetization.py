@@ -2,8 +2,9 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
-from utils.data_loader import load_data
-from utils.feature_engineering import add_price_buckets
+from utils.data_loader import load_aggregates
+from utils.features import cube_metrics
+from utils.filters import filtered_data, sidebar_filters
 from utils.metrics import generate_pricing_summary
 
 st.set_page_config(layout="wide")
@@ -19,28 +20,15 @@ st.caption(
 # =========================
 # Load Data
 # =========================
-df = load_data()
-
-df = df.dropna(subset=["price", "recommendations"])
-
-# =========================
-# Feature Engineering
-# =========================
-df = add_price_buckets(df)
-
-# =========================
-# Pricing Metrics
-# =========================
-pricing_stats = (
-    df.groupby("price_bucket")
-    .agg(
-        game_count=("appid", "count"),
-        total_recommendations=("recommendations", "sum"),
-        avg_recommendations=("recommendations", "mean"),
-        median_recommendations=("recommendations", "median"),
-    )
-    .reset_index()
-)
+filters = sidebar_filters()
+aggregates = None if filters else load_aggregates()
+
+if aggregates is not None:
+    pricing_stats = aggregates.metrics("price_bucket")
+else:
+    # Price tiers are a cube dimension: this is a roll-up of its cells,
+    # with exact medians from the rows
+    pricing_stats = cube_metrics(filtered_data(filters), ["price_bucket"])
 
 # =========================
 # ROW 1 — Price Distribution
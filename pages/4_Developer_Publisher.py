@@ -1,8 +1,10 @@
 import streamlit as st
 import plotly.express as px
 
-from utils.data_loader import load_data
-from utils.feature_engineering import entity_metrics
+from utils.data_loader import load_aggregates
+from utils.feature_engineering import entity_metrics, top_entity_metrics
+from utils.features import get_feature
+from utils.filters import filtered_data, sidebar_filters
 from utils.metrics import generate_entity_summary
 
 st.set_page_config(layout="wide")
@@ -18,8 +20,18 @@ st.caption(
 # =========================
 # Load Data
 # =========================
-df = load_data()
-df = df.dropna(subset=["developer", "publisher", "recommendations"])
+filters = sidebar_filters()
+
+# Snapshot or streamed partials when available (and unfiltered),
+# raw rows otherwise
+aggregates = None if filters else load_aggregates()
+precomputed = aggregates is not None
+
+if not precomputed:
+    rows = filtered_data(filters)
+    df = rows.dropna(subset=["developer", "publisher", "recommendations"])
+
+concentration = aggregates.concentration() if precomputed else get_feature(rows, "concentration")
 
 # =========================
 # Entity Selection
@@ -35,15 +47,31 @@ entity_col = "publisher" if entity_type == "Publisher" else "developer"
 # =========================
 # Feature Engineering
 # =========================
-entity_stats = entity_metrics(df, entity_col)
+TOP_K = 15
 
-top_entities = entity_stats.head(15)
+if precomputed:
+    entity_stats = aggregates.metrics(entity_col).sort_values(
+        "total_recommendations", ascending=False
+    )
+    top_entities = entity_stats.head(TOP_K)
+else:
+    # Medians only for the leaders; the long tail is computed on request
+    entity_stats = None
+    top_entities = top_entity_metrics(df, entity_col, TOP_K)
 
 # =========================
 # ROW 1 — Dominance
 # =========================
 st.subheader(f"Top {entity_type}s by Total Engagement")
 
+profile = concentration[f"{entity_col}s"]
+
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Gini", f"{profile['gini']:.2f}")
+col2.metric("HHI", f"{profile['hhi']:,.0f}")
+col3.metric(f"Top 5 {entity_type}s Share", f"{profile['top_5_share']:.1%}")
+col4.metric(f"Top 10% of {entity_type}s Share", f"{profile['top_10pct_share']:.1%}")
+
 fig_total = px.bar(
     top_entities,
     x="total_recommendations",
@@ -99,5 +127,16 @@ st.plotly_chart(fig_median, use_container_width=True)
 # =========================
 st.subheader("Key Takeaways")
 
-summary = generate_entity_summary(entity_stats, entity_type)
+summary = generate_entity_summary(top_entities, entity_type)
 st.info(summary)
+
+# =========================
+# ROW 5 — Full Table
+# =========================
+with st.expander(f"All {entity_type}s"):
+    if st.checkbox(f"Load every {entity_type.lower()}", key="load_all_entities"):
+        if entity_stats is None:
+            entity_stats = entity_metrics(df, entity_col).sort_values(
+                "total_recommendations", ascending=False
+            )
+        st.dataframe(entity_stats, use_container_width=True, hide_index=True)
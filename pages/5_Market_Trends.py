@@ -1,8 +1,12 @@
 import streamlit as st
 import plotly.express as px
 
-from utils.data_loader import load_data
-from utils.feature_engineering import yearly_metrics, explode_genres
+from utils.data_loader import (
+    load_aggregates,
+)
+from utils.cube import cube_genre_metrics, cube_genre_yearly_totals
+from utils.features import cube_metrics, get_feature
+from utils.filters import filtered_data, sidebar_filters
 from utils.metrics import generate_market_trends_summary
 
 st.set_page_config(layout="wide")
@@ -18,13 +22,26 @@ st.caption(
 # =========================
 # Load Data
 # =========================
-df = load_data()
-df = df.dropna(subset=["release_year", "recommendations"])
+filters = sidebar_filters()
+
+# Snapshot or streamed partials when available (and unfiltered),
+# raw rows otherwise
+aggregates = None if filters else load_aggregates()
+precomputed = aggregates is not None
+
+if not precomputed:
+    # Roll-ups of cube cells (exact medians from the rows); the rows are
+    # scanned once per dataset version
+    df = filtered_data(filters)
+    genre_cube = get_feature(df, "genre_cube")
 
 # =========================
 # Feature Engineering
 # =========================
-yearly_stats = yearly_metrics(df)
+if precomputed:
+    yearly_stats = aggregates.metrics("release_year")
+else:
+    yearly_stats = cube_metrics(df, ["release_year"])
 
 # =========================
 # ROW 1 — Market Growth
@@ -85,22 +102,24 @@ st.plotly_chart(fig_median, use_container_width=True)
 # =========================
 st.subheader("Genre Contribution to Engagement")
 
-df_genres = explode_genres(df)
-
-top_genres = (
-    df_genres.groupby("genres")["recommendations"]
-    .sum()
-    .sort_values(ascending=False)
-    .head(5)
-    .index
-)
-
-genre_yearly = (
-    df_genres[df_genres["genres"].isin(top_genres)]
-    .groupby(["release_year", "genres"])["recommendations"]
-    .sum()
-    .reset_index()
-)
+if precomputed:
+    all_genre_yearly = aggregates.genre_yearly_totals()
+    top_genres = (
+        all_genre_yearly.groupby("genres")["recommendations"]
+        .sum()
+        .sort_values(ascending=False)
+        .head(5)
+        .index
+    )
+    genre_yearly = all_genre_yearly[all_genre_yearly["genres"].isin(top_genres)]
+else:
+    top_genres = (
+        cube_genre_metrics(genre_cube)
+        .sort_values("total_recommendations", ascending=False)
+        .head(5)["genres"]
+    )
+
+    genre_yearly = cube_genre_yearly_totals(genre_cube, top_genres)
 
 fig_genre = px.area(
     genre_yearly,
@@ -1,9 +1,18 @@
 import streamlit as st
 import plotly.express as px
 
-from utils.data_loader import load_data
-from utils.feature_engineering import missing_value_summary, yearly_coverage
+from utils.data_loader import (
+    load_aggregates,
+    load_last_change,
+    load_memory_report,
+)
+from utils.feature_engineering import yearly_coverage
+from utils.features import get_feature
+from utils.filters import filtered_data, sidebar_filters
 from utils.metrics import calculate_health_score, generate_health_summary
+from utils.profiling import profile_frame
+from utils.disk_cache import DISK_CACHE_BUDGET_ENV
+from utils.result_cache import CACHE_BUDGET_ENV, cache_stats, disk_cache_stats
 
 st.set_page_config(layout="wide")
 
@@ -18,20 +27,41 @@ st.caption(
 # =========================
 # Load Data
 # =========================
-df = load_data()
+filters = sidebar_filters()
+aggregates = None if filters else load_aggregates()
 
-# =========================
-# Feature Engineering
-# =========================
-missing_df = missing_value_summary(df)
-yearly_df = yearly_coverage(df)
+if aggregates is not None:
+    missing_df = aggregates.missing_value_summary()
+    yearly_df = aggregates.yearly_coverage()
+    profile_df = aggregates.column_profile()
+    concentration = aggregates.concentration()
+else:
+    df = filtered_data(filters)
+
+    # =========================
+    # Column Profile
+    # =========================
+    # One chunked pass over every column; the tables below read from it
+    profile = profile_frame(df)
+    missing_df = profile.missing_value_summary()
+    yearly_df = yearly_coverage(df)
+    profile_df = profile.summary()
+    concentration = get_feature(df, "concentration")
 
 # =========================
 # Health Score
 # =========================
 health_score = calculate_health_score(missing_df, yearly_df)
 
-st.metric("Dataset Health Score", f"{health_score}/100")
+catalogs = concentration["publisher_catalogs"]
+
+col1, col2 = st.columns(2)
+col1.metric("Dataset Health Score", f"{health_score}/100")
+col2.metric(
+    "Top 10 Publishers' Share of Titles",
+    f"{catalogs['top_10_share']:.1%}",
+    help=f"Catalog HHI {catalogs['hhi']:,.0f} across {catalogs['entities']:,} publishers",
+)
 
 # =========================
 # ROW 1 — Missing Values
@@ -70,7 +100,65 @@ fig_yearly = px.line(
 st.plotly_chart(fig_yearly, use_container_width=True)
 
 # =========================
-# ROW 3 — Auto Summary
+# ROW 3 — Column Profile
+# =========================
+st.subheader("Column Profile")
+st.caption(
+    "Distinct counts are estimated once a column has many values; quartiles "
+    "and top values come from the same single pass over the rows."
+)
+st.dataframe(profile_df, use_container_width=True, hide_index=True)
+
+# =========================
+# ROW 4 — Memory Footprint
+# =========================
+memory_df = load_memory_report()
+
+if memory_df is not None:
+    st.subheader("In-Memory Footprint")
+
+    total = memory_df.iloc[-1]
+    st.caption(
+        f"Typed columns use {total['after_bytes'] / 1e6:.1f} MB versus "
+        f"{total['before_bytes'] / 1e6:.1f} MB as parsed from CSV "
+        f"({total['saving_pct']}% smaller)."
+    )
+    st.dataframe(memory_df, use_container_width=True, hide_index=True)
+
+last_change = load_last_change()
+
+if last_change is not None:
+    st.caption(
+        f"Last refresh against the previous CSV: {last_change['added']:,} games added, "
+        f"{last_change['removed']:,} removed and {last_change['modified']:,} modified."
+    )
+
+# =========================
+# ROW 5 — Result Cache
+# =========================
+stats = cache_stats()
+
+with st.expander("Result Cache"):
+    st.caption(
+        f"{stats['entries']} cached results using {stats['bytes'] / 1e6:.1f} MB of "
+        f"{stats['budget_bytes'] / 1e6:.0f} MB (set {CACHE_BUDGET_ENV} to change the budget)."
+    )
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Hit Rate", f"{stats['hit_rate']}%")
+    col2.metric("Hits", f"{stats['hits']:,}")
+    col3.metric("Misses", f"{stats['misses']:,}")
+    col4.metric("Evictions", f"{stats['evictions']:,}")
+
+    disk = disk_cache_stats()
+    if disk is not None:
+        st.caption(
+            f"Disk tier: {disk['entries']} results using {disk['bytes'] / 1e6:.1f} MB of "
+            f"{disk['budget_bytes'] / 1e6:.0f} MB (set {DISK_CACHE_BUDGET_ENV}), "
+            f"{disk['hit_rate']}% hit rate and {disk['evictions']:,} evictions in this process."
+        )
+
+# =========================
+# ROW 6 — Auto Summary
 # =========================
 st.subheader("Credibility Assessment")
 
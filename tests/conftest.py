@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Keep test results out of the on-disk result cache
+os.environ.setdefault("STEAM_DASHBOARD_DISK_CACHE_MB", "0")
+
+GENRES = ["Action", "Adventure", "Indie", "RPG", "Strategy", "Casual"]
+
+
+def raw_games(seed=0, n=3_000):
+    """
+    A frame shaped like the source CSV (before the dtype plan), with
+    missing values in every column the pages drop or group on.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "AppID": rng.permutation(10 * n)[:n],
+            "Name": [f"game {i}" for i in range(n)],
+            "Genres": [
+                ",".join(rng.choice(GENRES, rng.integers(1, 4), replace=False))
+                for _ in range(n)
+            ],
+            "Publisher": np.char.add("publisher ", rng.integers(0, n // 7, n).astype(str)),
+            "Developer": np.char.add("developer ", rng.integers(0, n // 4, n).astype(str)),
+            "Price": rng.choice([0, 199, 499, 500, 999, 1000, 1999], n).astype(float),
+            "Recommendations": np.floor(rng.pareto(1.1, n) * 20),
+            "Release_Year": rng.integers(2006, 2026, n).astype(float),
+        }
+    )
+    for column, share in [
+        ("Release_Year", 0.05),
+        ("Recommendations", 0.05),
+        ("Publisher", 0.03),
+        ("Developer", 0.03),
+        ("Genres", 0.02),
+    ]:
+        df.loc[rng.random(n) < share, column] = np.nan
+    return df
+
+
+@pytest.fixture
+def games():
+    """
+    The synthetic games with lower-cased columns and the dtype plan applied.
+    """
+    from utils.schema import apply_schema
+
+    df = raw_games()
+    df.columns = df.columns.str.lower()
+    return apply_schema(df)
+
+
+@pytest.fixture
+def source_csv(tmp_path, monkeypatch):
+    """
+    Path of a synthetic source CSV, with the loader's cache directory
+    redirected into the test's temporary directory.
+    """
+    from utils import data_loader
+
+    monkeypatch.setattr(data_loader, "CACHE_DIR", tmp_path / ".cache")
+    path = tmp_path / "steam_games.csv"
+    raw_games().to_csv(path, index=False)
+    return path
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from utils.aggregation import aggregate, aggregate_quantiles, top_groups
+
+
+def _entities(seed=0, n=20_000):
+    rng = np.random.default_rng(seed)
+    developers = pd.Categorical(rng.integers(0, n // 3, n).astype(str))
+    values = np.floor(rng.pareto(1.1, n) * 50)
+    values[rng.random(n) < 0.05] = np.nan
+    return pd.DataFrame(
+        {"appid": np.arange(n), "developer": developers, "recommendations": values}
+    )
+
+
+def test_medians_match_pandas():
+    df = _entities()
+
+    result = aggregate(df, ["developer"]).set_index("developer")["median_recommendations"]
+    expected = df.groupby("developer", observed=True)["recommendations"].median()
+
+    pd.testing.assert_series_equal(result, expected, check_names=False, check_index_type=False)
+
+
+def test_top_groups_agree_with_the_full_table():
+    df = _entities()
+
+    top = top_groups(df, "developer", 15).set_index("developer")
+    full = aggregate(df, ["developer"]).set_index("developer").loc[top.index]
+
+    pd.testing.assert_frame_equal(top, full, check_index_type=False)
+
+
+def test_quantiles_match_pandas():
+    df = _entities()
+
+    result = aggregate_quantiles(df, ["developer"], [0.25, 0.75])
+    grouped = df.groupby("developer", observed=True)["recommendations"]
+
+    for q in [0.25, 0.75]:
+        pd.testing.assert_series_equal(
+            result[q], grouped.quantile(q), check_names=False, check_index_type=False
+        )
+
+
+def test_sketch_medians_reuse_one_scan_per_frame(games, monkeypatch):
+    from utils import aggregation
+    from utils.features import with_features
+
+    monkeypatch.setattr(aggregation, "QUANTILE_METHOD", "sketch")
+    scans = []
+    build_sketch = aggregation.build_sketch
+
+    def counting(*args, **kwargs):
+        scans.append(args)
+        return build_sketch(*args, **kwargs)
+
+    monkeypatch.setattr(aggregation, "build_sketch", counting)
+    df = with_features(games, "primary_genre", "price_bucket", "pricing_type")
+
+    for keys in (["primary_genre"], ["release_year", "primary_genre"], ["pricing_type"]):
+        result = aggregate(df, keys).set_index(keys)["median_recommendations"]
+        expected = df.groupby(keys, observed=True)["recommendations"].median()
+
+        np.testing.assert_allclose(result, expected.loc[result.index], rtol=0.01, atol=0.5)
+
+    assert len(scans) == 1
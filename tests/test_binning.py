@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.binning import bin_counts, histogram
+
+
+def _values(seed=0, n=20_000):
+    rng = np.random.default_rng(seed)
+    values = np.floor(rng.pareto(1.1, n) * 50)
+    values[rng.random(n) < 0.05] = np.nan
+    return values
+
+
+def test_linear_bins_match_numpy_histogram():
+    values = _values()
+    kept = values[~np.isnan(values)]
+
+    result = bin_counts(values, nbins=60)
+    counts, edges = np.histogram(kept, bins=60, range=(0, kept.max()))
+
+    np.testing.assert_array_equal(result["games"], counts)
+    np.testing.assert_allclose(result["bin_start"], edges[:-1])
+    np.testing.assert_allclose(result["bin_end"], edges[1:])
+
+
+def test_log_bins_keep_zeros_in_their_own_bin():
+    values = _values()
+    kept = values[~np.isnan(values)]
+
+    result = bin_counts(values, nbins=30, scale="log")
+    edges = np.append(result["bin_start"].to_numpy(), result["bin_end"].iloc[-1])
+
+    assert result["bin_start"].iloc[0] == 0 and result["bin_end"].iloc[0] == 1
+    assert result["games"].iloc[0] == (kept < 1).sum()
+    np.testing.assert_array_equal(result["games"], np.histogram(kept, bins=edges)[0])
+
+
+def test_empty_and_constant_columns():
+    assert bin_counts(np.array([np.nan, np.nan]), nbins=5)["games"].sum() == 0
+
+    constant = bin_counts(np.zeros(7), nbins=5)
+    assert constant["games"].sum() == 7
+
+
+def test_histogram_is_memoized_per_frame():
+    df = pd.DataFrame({"recommendations": _values()})
+
+    first = histogram(df, nbins=20)
+    first.loc[0, "games"] = -1
+
+    assert histogram(df, nbins=20)["games"].iloc[0] >= 0
+
+
+def test_unknown_scale_raises():
+    with pytest.raises(ValueError):
+        bin_counts(np.arange(5.0), scale="sqrt")
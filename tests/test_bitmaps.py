@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.bitmaps import (
+    bitmap_and,
+    bitmap_count,
+    bitmap_or,
+    bitmap_rows,
+    build_bitmap_index,
+    rows_to_bitmap,
+)
+from utils.feature_engineering import price_bucket
+from utils.filters import apply_filters
+
+
+def test_bitmaps_round_trip_row_sets():
+    rng = np.random.default_rng(0)
+    n = 1_003
+    left = np.sort(rng.choice(n, 400, replace=False))
+    right = np.sort(rng.choice(n, 300, replace=False))
+    a, b = rows_to_bitmap(left, n), rows_to_bitmap(right, n)
+
+    np.testing.assert_array_equal(bitmap_rows(a, n), left)
+    assert bitmap_count(a) == 400
+    np.testing.assert_array_equal(bitmap_rows(bitmap_and(a, b), n), np.intersect1d(left, right))
+    np.testing.assert_array_equal(bitmap_rows(bitmap_or(a, b), n), np.union1d(left, right))
+
+
+def test_index_selects_the_rows_holding_any_value(games):
+    index = build_bitmap_index(games["release_year"])
+
+    assert index.values == sorted(games["release_year"].dropna().unique())
+    selected = bitmap_rows(index.any_of([2010.0, 2015.0, 1900.0]), len(games))
+    expected = np.flatnonzero(games["release_year"].isin([2010.0, 2015.0]).to_numpy())
+    np.testing.assert_array_equal(selected, expected)
+    assert bitmap_count(index.any_of([])) == 0
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"release_year": (2012, 2018)},
+        {"genres": ["RPG", "Strategy"]},
+        {"price_bucket": ["Free", "High (₹1000+)"], "pricing_type": ["Free"]},
+        {"release_year": (2010, 2020), "genres": ["Indie"], "pricing_type": ["Paid"]},
+    ],
+)
+def test_filters_match_boolean_masks(games, filters):
+    tiers = price_bucket(games["price"])
+    mask = pd.Series(True, index=games.index)
+    for column, allowed in filters.items():
+        if column == "release_year":
+            mask &= games["release_year"].between(*allowed)
+        elif column == "genres":
+            listed = games["genres"].astype("object").str.split(",")
+            mask &= listed.apply(lambda genres: isinstance(genres, list) and bool(set(genres) & set(allowed)))
+        elif column == "price_bucket":
+            mask &= tiers.isin(allowed)
+        else:
+            mask &= np.where(games["price"] > 0, "Paid", "Free") == allowed[0]
+
+    pd.testing.assert_frame_equal(apply_filters(games, filters), games[mask])
+
+
+def test_no_filters_return_the_frame_itself(games):
+    assert apply_filters(games, {}) is games
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from utils.box_stats import MAX_OUTLIERS, box_stats_from_codes, tier_box_stats
+
+
+def _reference(values):
+    # Plotly's box statistics, computed with pandas
+    q1, median, q3 = values.quantile([0.25, 0.5, 0.75])
+    low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    inside = values[(values >= low) & (values <= high)]
+    return {
+        "count": len(values),
+        "lowerfence": inside.min(),
+        "q1": q1,
+        "median": median,
+        "q3": q3,
+        "upperfence": inside.max(),
+        "outliers": np.sort(values[(values < low) | (values > high)].to_numpy()),
+    }
+
+
+def test_tier_box_stats_match_pandas_per_tier(games):
+    result = tier_box_stats(games, "recommendations").set_index("category")
+
+    tiers = np.where(games["price"] > 0, "Paid", "Free")
+    for tier, values in games.groupby(tiers)["recommendations"]:
+        expected = _reference(values.dropna())
+        row = result.loc[tier]
+        for name in ["count", "lowerfence", "q1", "median", "q3", "upperfence"]:
+            assert row[name] == expected[name], (tier, name)
+        # A capped sample of the outliers, from the lowest to the highest
+        outliers = expected["outliers"]
+        assert len(row["outliers"]) == min(len(outliers), MAX_OUTLIERS)
+        assert np.isin(row["outliers"], outliers).all()
+        assert row["outliers"][[0, -1]].tolist() == outliers[[0, -1]].tolist()
+
+
+def test_outlier_samples_are_capped_and_keep_the_extremes():
+    # Zero IQR: every value but 50 is an outlier
+    values = np.concatenate([np.full(1_000, 50.0), np.arange(1.0, 50.0), np.arange(51.0, 151.0)])
+    codes = np.zeros(len(values), dtype=np.int64)
+
+    (row,) = box_stats_from_codes(codes, values, ["all"], max_outliers=10).to_dict("records")
+
+    assert len(row["outliers"]) == 10
+    assert row["outliers"][[0, -1]].tolist() == [1.0, 150.0]
+    assert (np.diff(row["outliers"]) > 0).all()
+
+
+def test_empty_groups_are_dropped():
+    values = np.array([1.0, 2.0, 3.0])
+    codes = np.array([0, 0, 2])
+
+    result = box_stats_from_codes(codes, values, ["a", "b", "c"])
+
+    assert result["category"].tolist() == ["a", "c"]
+    pd.testing.assert_series_equal(
+        result["count"], pd.Series([2, 1]), check_names=False, check_dtype=False
+    )
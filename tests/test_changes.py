@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import features
+from utils.aggregation import clear_memo
+from utils.changes import diff_by_appid, row_digests
+from utils.features import carry_forward, compute_feature, get_feature
+from utils.result_cache import result_cache
+from utils.dataset import stamp_version
+
+
+def _next_version(df, seed=1):
+    """
+    `df` with some rows removed, some edited and a few new ones appended.
+    """
+    rng = np.random.default_rng(seed)
+    current = df[rng.random(len(df)) > 0.05].reset_index(drop=True)
+
+    edited = rng.random(len(current)) < 0.1
+    recommendations = current["recommendations"].to_numpy(copy=True)
+    recommendations[edited] += 7
+    current["recommendations"] = recommendations
+
+    added = df.sample(40, random_state=seed).reset_index(drop=True)
+    added["appid"] = np.arange(len(added)) + df["appid"].max() + 1
+    return pd.concat([current, added], ignore_index=True)
+
+
+def _sorted(table):
+    return table.set_index("appid").sort_index()
+
+
+def test_diff_matches_a_merge_on_appid(games):
+    current = _next_version(games)
+
+    delta = diff_by_appid(games, current)
+
+    merged = games.merge(current, on="appid", how="outer", suffixes=("_old", ""), indicator=True)
+    added = merged.loc[merged["_merge"] == "right_only", "appid"]
+    removed = merged.loc[merged["_merge"] == "left_only", "appid"]
+    both = merged[merged["_merge"] == "both"]
+    old, new = both["recommendations_old"], both["recommendations"]
+    modified = both.loc[~((old == new) | (old.isna() & new.isna())), "appid"]
+
+    assert sorted(delta.added["appid"]) == sorted(added)
+    assert sorted(delta.removed["appid"]) == sorted(removed)
+    assert sorted(delta.modified_new["appid"]) == sorted(modified)
+    pd.testing.assert_frame_equal(
+        _sorted(delta.modified_old), _sorted(games[games["appid"].isin(modified)])
+    )
+    assert delta.counts() == {
+        "added": len(added), "removed": len(removed), "modified": len(modified)
+    }
+
+
+def test_stored_digests_give_the_same_diff(games):
+    current = _next_version(games)
+
+    delta = diff_by_appid(games, current, previous_digests=row_digests(games))
+
+    assert delta.counts() == diff_by_appid(games, current).counts()
+
+
+def test_unmatchable_versions_are_not_diffed(games):
+    duplicated = pd.concat([games, games.head(1)], ignore_index=True)
+
+    assert diff_by_appid(games, duplicated) is None
+    assert diff_by_appid(games, games.drop(columns="name")) is None
+
+
+def _cells(cube):
+    cells = cube.cells.reset_index()
+    for column in cube.dimensions:
+        cells[column] = cells[column].astype(object)
+    return cells.sort_values(cube.dimensions, na_position="last").reset_index(drop=True)
+
+
+@pytest.mark.parametrize("name", ["cube", "genre_cube"])
+def test_applied_delta_matches_a_rebuilt_cube(games, name):
+    current = _next_version(games)
+    delta = diff_by_appid(games, current)
+
+    updated = compute_feature(games, name).apply_delta(
+        compute_feature(delta.retracted, name), compute_feature(delta.inserted, name)
+    )
+    rebuilt = compute_feature(current, name)
+
+    pd.testing.assert_frame_equal(_cells(updated), _cells(rebuilt), check_dtype=False)
+    for keys in (["release_year"], []):
+        pd.testing.assert_frame_equal(
+            updated.metrics(keys), rebuilt.metrics(keys), check_dtype=False
+        )
+
+
+def test_carry_forward_seeds_the_next_version(games, monkeypatch):
+    monkeypatch.setattr(features, "MIN_INCREMENTAL_ROWS", 0)
+    clear_memo()
+    previous = stamp_version(games, "v1")
+    current = stamp_version(_next_version(games), "v2")
+    get_feature(previous, "cube")
+
+    delta = carry_forward(previous, current)
+
+    seeded = result_cache.lookup(features._feature_key(current, "cube"))
+    assert delta is not None and seeded is not None
+    pd.testing.assert_frame_equal(
+        _cells(seeded), _cells(compute_feature(current, "cube")), check_dtype=False
+    )
+    # Features never computed for the previous version are left alone
+    assert result_cache.lookup(features._feature_key(current, "genre_cube")) is None
+
+
+def test_carry_forward_skips_mostly_changed_versions(games, monkeypatch):
+    monkeypatch.setattr(features, "MIN_INCREMENTAL_ROWS", 0)
+    clear_memo()
+    previous = stamp_version(games, "v1")
+    current = stamp_version(games.assign(recommendations=games["recommendations"] + 1), "v2")
+    get_feature(previous, "cube")
+
+    assert carry_forward(previous, current).counts()["modified"] > len(games) // 2
+    assert result_cache.lookup(features._feature_key(current, "cube")) is None
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from utils.column_store import open_column_store, write_column_store
+
+
+def _columns(n=1_000):
+    rng = np.random.default_rng(0)
+    recommendations = np.floor(rng.pareto(1.1, n) * 50)
+    recommendations[::13] = np.nan
+    return {
+        "appid": rng.permutation(n).astype("uint32"),
+        "price": rng.choice([0.0, 4.99, 19.99], n),
+        "recommendations": recommendations,
+        "release_year": rng.integers(2006, 2026, n).astype("int16"),
+    }
+
+
+def test_stored_columns_map_back_read_only(tmp_path):
+    columns = _columns()
+    write_column_store(columns, tmp_path, "v1")
+
+    mapped = open_column_store(tmp_path, "v1")
+
+    assert set(mapped) == set(columns)
+    for name, values in columns.items():
+        assert mapped[name].dtype == values.dtype
+        np.testing.assert_array_equal(mapped[name], values)
+        with pytest.raises(ValueError):
+            mapped[name][0] = 0
+
+
+def test_other_versions_and_damaged_files_are_not_served(tmp_path):
+    write_column_store(_columns(), tmp_path, "v1")
+
+    assert open_column_store(tmp_path, "v2") is None
+    assert open_column_store(tmp_path / "missing", "v1") is None
+
+    (file,) = tmp_path.glob("price.*.bin")
+    with open(file, "r+b") as fh:
+        fh.truncate(100)
+    assert open_column_store(tmp_path, "v1") is None
+
+
+def test_rewrites_replace_the_previous_version(tmp_path):
+    write_column_store(_columns(), tmp_path, "v1")
+    old_maps = open_column_store(tmp_path, "v1")
+    expected = np.array(old_maps["price"])
+
+    new = {"price": np.arange(10.0)}
+    write_column_store(new, tmp_path, "v2")
+
+    np.testing.assert_array_equal(open_column_store(tmp_path, "v2")["price"], new["price"])
+    assert [path.name for path in tmp_path.glob("*.bin")] == ["price.v2.bin"]
+    # Maps opened before the rewrite keep reading the old values
+    np.testing.assert_array_equal(old_maps["price"], expected)
+
+
+def test_empty_columns(tmp_path):
+    write_column_store({"price": np.empty(0)}, tmp_path, "v1")
+
+    assert len(open_column_store(tmp_path, "v1")["price"]) == 0
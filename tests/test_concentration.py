@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.concentration import (
+    TOP_COUNTS,
+    concentration_profile,
+    concentration_tables,
+    entity_totals,
+    market_concentration,
+    profiles_from_tables,
+)
+
+
+def _reference(values):
+    # Textbook definitions on the raw values
+    values = np.sort(values[~np.isnan(values)])
+    n, total = len(values), values.sum()
+    shares = values / total
+    return {
+        "gini": np.abs(values[:, None] - values[None, :]).sum() / (2 * n * n * values.mean()),
+        "hhi": np.sum((shares * 100) ** 2),
+        **{f"top_{k}_share": values[::-1][:k].sum() / total for k in TOP_COUNTS},
+        "top_10pct_share": values[::-1][: int(n * 0.1)].sum() / total,
+    }
+
+
+def _values(seed=0, n=2_000):
+    rng = np.random.default_rng(seed)
+    values = np.floor(rng.pareto(1.1, n) * 50)
+    values[rng.random(n) < 0.05] = np.nan
+    return values
+
+
+def test_profile_matches_the_textbook_definitions():
+    values = _values()
+
+    profile = concentration_profile(values)
+
+    assert profile["entities"] == np.count_nonzero(~np.isnan(values))
+    for name, expected in _reference(values).items():
+        assert profile[name] == pytest.approx(expected, rel=1e-9), name
+    lorenz = profile["lorenz"]
+    assert lorenz["value_share"].iloc[[0, -1]].tolist() == pytest.approx([0.0, 1.0])
+    assert lorenz["value_share"].is_monotonic_increasing
+
+
+def test_weighted_values_equal_repeated_values():
+    values = np.array([0.0, 3.0, 10.0, 250.0])
+    counts = np.array([5, 40, 3, 1])
+
+    weighted = concentration_profile(values, counts)
+    repeated = concentration_profile(np.repeat(values, counts))
+
+    for name in ["entities", "total", "gini", "hhi", "top_5_share", "top_10pct_share"]:
+        assert weighted[name] == pytest.approx(repeated[name]), name
+    pd.testing.assert_frame_equal(weighted["lorenz"], repeated["lorenz"])
+
+
+def test_all_zero_values_have_no_concentration():
+    profile = concentration_profile(np.zeros(10))
+
+    assert profile["gini"] == 0 and profile["hhi"] == 0 and profile["top_1_share"] == 0
+
+
+def test_market_dimensions_use_entity_totals(games):
+    profiles = market_concentration(
+        {
+            "recommendations": games["recommendations"],
+            "publisher": games["publisher"],
+            "developer": games["developer"],
+            "primary_genre": games["genres"],
+        }
+    )
+
+    totals = games.groupby("publisher", observed=True)["recommendations"].sum()
+    catalogs = games.groupby("publisher", observed=True).size()
+    assert profiles["publishers"]["hhi"] == pytest.approx(_reference(totals.to_numpy())["hhi"])
+    assert profiles["publisher_catalogs"]["gini"] == pytest.approx(
+        _reference(catalogs.to_numpy(dtype="float64"))["gini"]
+    )
+    np.testing.assert_allclose(
+        np.sort(entity_totals(games["developer"], games["recommendations"])),
+        np.sort(games.groupby("developer", observed=True)["recommendations"].sum().to_numpy()),
+    )
+
+
+def test_tables_round_trip_the_profiles():
+    profiles = {"games": concentration_profile(_values(1)), "other": concentration_profile(_values(2))}
+
+    restored = profiles_from_tables(*concentration_tables(profiles))
+
+    for dimension, profile in profiles.items():
+        pd.testing.assert_frame_equal(restored[dimension]["lorenz"], profile["lorenz"])
+        assert restored[dimension]["gini"] == profile["gini"]
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from utils.cube import build_genre_cube
+from utils.genre_matrix import build_genre_matrix
+
+
+def _exploded_facts(df):
+    # Plain pandas reference: one row per (game, listed genre) with a value
+    exploded = df.assign(genres=df["genres"].astype("object").str.split(",")).explode("genres")
+    exploded["genres"] = exploded["genres"].str.strip()
+    return exploded.dropna(subset=["genres", "recommendations"])
+
+
+def test_genre_cube_matches_an_exploded_groupby(games):
+    engaged = (games["recommendations"] > 0).to_numpy()
+    cube = build_genre_cube(
+        build_genre_matrix(games["genres"]),
+        games["appid"],
+        games["recommendations"],
+        games["release_year"],
+        mask=engaged,
+    )
+
+    facts = _exploded_facts(games[engaged])
+    for keys in (["genres"], ["release_year", "genres"]):
+        grouped = facts.groupby(keys, dropna=True)
+        expected = pd.DataFrame(
+            {
+                "game_count": grouped["appid"].count(),
+                "total_recommendations": grouped["recommendations"].sum(),
+                "avg_recommendations": grouped["recommendations"].mean(),
+                "median_recommendations": grouped["recommendations"].median(),
+            }
+        )
+        result = cube.metrics(keys).set_index(keys)
+
+        pd.testing.assert_frame_equal(
+            result.drop(columns="median_recommendations"),
+            expected.drop(columns="median_recommendations"),
+            check_dtype=False,
+            check_index_type=False,
+            check_categorical=False,
+        )
+        # Cube medians are read from sketches
+        np.testing.assert_allclose(
+            result["median_recommendations"],
+            expected["median_recommendations"],
+            rtol=0.01,
+            atol=0.5,
+        )
+
+
+def test_genre_cube_of_genre_less_games_is_empty(games):
+    genre_less = games[games["genres"].isna()]
+
+    cube = build_genre_cube(
+        build_genre_matrix(genre_less["genres"]),
+        genre_less["appid"],
+        genre_less["recommendations"],
+        genre_less["release_year"],
+    )
+
+    assert cube.cells.empty
+    assert cube.metrics(["genres"]).empty
@@ -0,0 +1,112 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+import materialize
+from utils import data_loader
+from utils.aggregation import frame_fingerprint
+from utils.schema import apply_schema
+
+
+def _count_hashes(monkeypatch):
+    calls = []
+    original = data_loader._file_sha256
+
+    def counting(path, *args, **kwargs):
+        calls.append(path)
+        return original(path, *args, **kwargs)
+
+    monkeypatch.setattr(data_loader, "_file_sha256", counting)
+    return calls
+
+
+def test_snapshot_is_served_while_it_matches_the_csv(source_csv):
+    assert data_loader.load_snapshot(source_csv) is None
+
+    materialize.main(["--source", str(source_csv)])
+
+    assert data_loader.load_snapshot(source_csv) is not None
+
+
+def test_touched_csv_is_hashed_once_per_process(source_csv, monkeypatch):
+    materialize.main(["--source", str(source_csv)])
+    stat = os.stat(source_csv)
+    os.utime(source_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    calls = _count_hashes(monkeypatch)
+    for _ in range(5):
+        assert data_loader.load_aggregates(source_csv) is not None
+
+    assert len(calls) == 1
+
+
+def test_changed_csv_invalidates_the_snapshot(source_csv):
+    materialize.main(["--source", str(source_csv)])
+    with open(source_csv, "a") as fh:
+        fh.write("1,extra,Indie,p,d,0,1,2020\n")
+
+    assert data_loader.load_snapshot(source_csv) is None
+
+
+def test_dtype_plan_changes_the_memoization_key(source_csv, monkeypatch):
+    before = frame_fingerprint(data_loader.load_columnar(source_csv))
+    assert frame_fingerprint(data_loader.load_columnar(source_csv)) == before
+
+    monkeypatch.setattr(data_loader, "SCHEMA_VERSION", data_loader.SCHEMA_VERSION + 1)
+
+    assert frame_fingerprint(data_loader.load_columnar(source_csv)) != before
+
+
+def _count_parses(monkeypatch):
+    calls = []
+    original = data_loader.read_source
+
+    def counting(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(data_loader, "read_source", counting)
+    return calls
+
+
+def _plain(df):
+    # Memory-mapped columns as ordinary arrays, for frame comparisons
+    return pd.DataFrame(
+        {
+            column: np.array(values) if isinstance(values.dtype, np.dtype) else values
+            for column, values in df.items()
+        }
+    )
+
+
+def test_columnar_cache_round_trips_the_typed_frame(source_csv):
+    expected = apply_schema(data_loader.read_source(source_csv))
+
+    first = data_loader.load_columnar(source_csv)
+    cached = data_loader.load_columnar(source_csv)
+
+    for df in (first, cached):
+        pd.testing.assert_frame_equal(_plain(df), expected)
+    assert data_loader._cache_paths(source_csv)[0].exists()
+    assert data_loader.load_memory_report(source_csv) is not None
+
+
+def test_csv_is_parsed_again_only_when_its_content_or_plan_changes(source_csv, monkeypatch):
+    data_loader.load_columnar(source_csv)
+    parses = _count_parses(monkeypatch)
+
+    stat = os.stat(source_csv)
+    os.utime(source_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    data_loader.load_columnar(source_csv)
+    assert len(parses) == 0
+
+    monkeypatch.setattr(data_loader, "SCHEMA_VERSION", data_loader.SCHEMA_VERSION + 1)
+    data_loader.load_columnar(source_csv)
+    assert len(parses) == 1
+
+    with open(source_csv, "a") as fh:
+        fh.write("1,extra,Indie,p,d,0,1,2020\n")
+    df = data_loader.load_columnar(source_csv)
+    assert len(parses) == 2
+    assert df["name"].iloc[-1] == "extra"
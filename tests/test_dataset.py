@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.aggregation import frame_fingerprint
+from utils.dataset import freeze, overlay, stamp_version
+
+
+@pytest.fixture
+def shared(games):
+    return freeze(stamp_version(games, "v1"))
+
+
+def test_frozen_frame_shares_the_values(games, shared):
+    pd.testing.assert_frame_equal(shared, games, check_frame_type=False)
+    assert shared.attrs["dataset_version"] == "v1"
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda df: df.__setitem__("new", 1),
+        lambda df: df.__setitem__("price", 0.0),
+        lambda df: df.insert(0, "new", 1),
+        lambda df: df.pop("name"),
+        lambda df: df.__delitem__("name"),
+        lambda df: df.drop(columns="name", inplace=True),
+        lambda df: df.rename(columns={"name": "title"}, inplace=True),
+        lambda df: setattr(df, "columns", [f"c{i}" for i in range(df.shape[1])]),
+        lambda df: df.loc.__setitem__((df.index[0], "price"), 1.0),
+        lambda df: df["recommendations"].to_numpy().__setitem__(0, 1.0),
+    ],
+)
+def test_writes_to_the_shared_frame_raise(games, shared, write):
+    with pytest.raises((ValueError, TypeError)):
+        write(shared)
+
+    pd.testing.assert_frame_equal(shared, games, check_frame_type=False)
+
+
+def test_derived_frames_are_plain_and_writable(shared):
+    filtered = shared[shared["price"] > 0]
+    filtered["tax"] = filtered["price"] * 0.1
+
+    assert type(filtered) is pd.DataFrame
+    assert "tax" not in shared.columns
+    assert filtered.attrs["dataset_version"] == "v1"
+
+
+def test_overlays_never_leak_into_the_shared_frame(shared):
+    view = overlay(shared, price=np.zeros(len(shared)), free=True)
+
+    assert (view["price"] == 0).all() and "free" in view.columns
+    assert "free" not in shared.columns and (shared["price"] > 0).any()
+    # A replaced column is fingerprinted by content, not by version
+    other = overlay(shared, price=np.ones(len(shared)), free=True)
+    assert frame_fingerprint(view) != frame_fingerprint(other)
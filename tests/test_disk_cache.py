@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.disk_cache import DiskCache
+from utils.result_cache import ResultCache
+
+
+def _age(cache, key, seconds):
+    path = cache._path(key)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 10**9))
+
+
+def test_entries_round_trip(tmp_path):
+    cache = DiskCache(tmp_path, 10 * 1024**2)
+    frame = pd.DataFrame({"year": [2020, 2021], "total": [1.5, np.nan]})
+
+    cache.put(("fp", "yearly"), frame)
+
+    pd.testing.assert_frame_equal(cache.get(("fp", "yearly")), frame)
+    assert cache.get(("fp", "other")) is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_least_recently_read_entries_are_evicted_first(tmp_path):
+    payload = np.zeros(10_000)
+    cache = DiskCache(tmp_path, int(payload.nbytes * 3.5))
+
+    for key in range(3):
+        cache.put(key, payload)
+        _age(cache, key, 100 - key)
+    cache.get(0)
+
+    cache.put(3, payload)
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.get(1) is None
+    assert all(cache.get(key) is not None for key in (0, 2, 3))
+    assert cache.stats()["bytes"] <= cache.budget_bytes
+
+
+def test_tracked_size_matches_the_directory(tmp_path):
+    cache = DiskCache(tmp_path, 10 * 1024**2)
+    for key in range(5):
+        cache.put(key, np.arange(key * 1_000))
+    cache.put(2, np.arange(10))
+
+    assert cache._bytes == cache.stats()["bytes"]
+
+
+def test_unreadable_entries_are_dropped(tmp_path):
+    cache = DiskCache(tmp_path, 10 * 1024**2)
+    cache.put("key", [1, 2, 3])
+    cache._path("key").write_bytes(b"not a pickle")
+
+    assert cache.get("key", "missing") == "missing"
+    assert not cache._path("key").exists()
+
+
+def test_disk_tier_serves_values_computed_by_another_process(tmp_path):
+    first = ResultCache(10 * 1024**2, store=DiskCache(tmp_path, 10 * 1024**2))
+    first.get_or_compute(("result", "fp"), lambda: pd.Series([1, 2, 3]))
+
+    # A fresh memory tier over the same directory, as after a restart
+    second = ResultCache(10 * 1024**2, store=DiskCache(tmp_path, 10 * 1024**2))
+    value = second.get_or_compute(("result", "fp"), lambda: pd.Series([0]))
+
+    pd.testing.assert_series_equal(value, pd.Series([1, 2, 3]))
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.feature_engineering import (
+    PRICE_TIERS,
+    assign_tiers,
+    price_bucket,
+    pricing_type,
+    primary_genre,
+    yearly_coverage,
+)
+
+
+def test_price_tiers_match_pd_cut():
+    price = pd.Series([0, 0.5, 199, 500, 500.01, 999, 1000, 1000.5, 5000, np.nan])
+
+    expected = pd.cut(
+        price,
+        bins=[-np.inf, *PRICE_TIERS["edges"], np.inf],
+        labels=PRICE_TIERS["labels"],
+        right=True,
+    )
+
+    pd.testing.assert_series_equal(price_bucket(price), expected, check_names=False)
+
+
+def test_negative_prices_get_no_tier():
+    price = pd.Series([-1.0, -0.01, 0.0, 10.0])
+
+    assert price_bucket(price).isna().tolist() == [True, True, False, False]
+    assert pricing_type(price).tolist()[2:] == ["Free", "Paid"]
+
+
+def test_custom_tiers_need_one_more_label_than_edges():
+    with pytest.raises(ValueError):
+        assign_tiers([1.0], [0, 10], ["Free", "Paid"])
+
+
+@pytest.mark.parametrize("dtype", ["object", "category"])
+def test_primary_genre_is_the_first_listed_genre(games, dtype):
+    genres = games["genres"].astype(dtype)
+
+    expected = genres.astype("object").fillna("Unknown").str.split(",").str[0].str.strip()
+
+    result = primary_genre(genres)
+    assert result.astype("object").tolist() == expected.tolist()
+
+
+def test_yearly_coverage_counts_games_with_an_appid(games):
+    df = pd.concat([games, games.head(50)], ignore_index=True)
+    df.loc[df.index[::7], "appid"] = np.nan
+
+    expected = df.groupby("release_year")["appid"].count().reset_index(name="records")
+
+    pd.testing.assert_frame_equal(yearly_coverage(df), expected)
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import features
+from utils.aggregation import clear_memo
+from utils.feature_engineering import PRICE_TIERS
+from utils.features import (
+    base_columns,
+    compute_feature,
+    cube_metrics,
+    feature_config,
+    get_feature,
+    with_features,
+)
+
+
+def _price_tiers(price):
+    # Plain reference for the default tiers (right-closed edges 0/500/1000)
+    labels = np.select(
+        [price <= 0, price <= 500, price <= 1000, price > 1000],
+        ["Free", "Low (₹1–₹500)", "Mid (₹501–₹1000)", "High (₹1000+)"],
+        default=None,
+    )
+    return pd.Series(labels, index=price.index)
+
+
+@pytest.mark.parametrize("key", ["price_bucket", "release_year"])
+def test_cube_metrics_match_a_pandas_groupby_with_exact_medians(games, key):
+    result = cube_metrics(games, [key]).set_index(key)
+
+    facts = games.assign(price_bucket=_price_tiers(games["price"]))
+    facts = facts.dropna(subset=["recommendations", key])
+    grouped = facts.groupby(key)
+    expected = pd.DataFrame(
+        {
+            "game_count": grouped["appid"].count(),
+            "total_recommendations": grouped["recommendations"].sum().astype("int64"),
+            "avg_recommendations": grouped["recommendations"].mean(),
+            "median_recommendations": grouped["recommendations"].median(),
+        }
+    )
+
+    result.index = result.index.astype(object)
+    expected.index = expected.index.astype(object)
+    assert len(result) == len(expected)
+    pd.testing.assert_frame_equal(result, expected.loc[result.index], check_names=False)
+
+
+def test_cube_metrics_keep_the_requested_measure_order(games):
+    measures = ("median_recommendations", "game_count")
+
+    result = cube_metrics(games, ["price_bucket"], measures)
+
+    assert list(result.columns) == ["price_bucket", *measures]
+
+
+def test_features_are_computed_once_per_dataset(games, monkeypatch):
+    calls = []
+    compute, depends_on, update, config = features._registry["primary_genre"]
+
+    def counting(*columns):
+        calls.append(1)
+        return compute(*columns)
+
+    monkeypatch.setitem(features._registry, "primary_genre", (counting, depends_on, update, config))
+    clear_memo()
+    df = games.copy()
+
+    first = get_feature(df, "primary_genre")
+    # Other overlays of the same rows reuse the value
+    get_feature(with_features(df, "price_bucket"), "primary_genre")
+
+    assert len(calls) == 1
+    expected = df["genres"].astype("object").fillna("Unknown").str.split(",").str[0]
+    assert first.astype("object").tolist() == expected.tolist()
+
+
+def test_with_features_leaves_the_frame_untouched(games):
+    columns = list(games.columns)
+    view = with_features(games, "primary_genre", "price_bucket")
+
+    assert list(games.columns) == columns
+    assert {"primary_genre", "price_bucket"} <= set(view.columns)
+
+
+def test_feature_lineage_and_settings():
+    assert base_columns("cube") == sorted(
+        ["release_year", "genres", "price", "appid", "recommendations"]
+    )
+    assert ("price_bucket", PRICE_TIERS) in feature_config("cube")
+
+
+def test_changed_settings_change_the_cache_key(games, monkeypatch):
+    before = features._feature_key(games, "cube")
+    compute, depends_on, update, _ = features._registry["price_bucket"]
+    monkeypatch.setitem(
+        features._registry,
+        "price_bucket",
+        (compute, depends_on, update, {"edges": [0, 100], "labels": ["a", "b", "c"]}),
+    )
+
+    assert features._feature_key(games, "cube") != before
+    assert features._feature_key(games, "genre_matrix") == features._feature_key(games, "genre_matrix")
+
+
+def test_compute_feature_matches_the_cached_value(games):
+    pd.testing.assert_series_equal(
+        compute_feature(games, "price_bucket"), get_feature(games, "price_bucket")
+    )
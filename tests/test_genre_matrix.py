@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.genre_matrix import build_genre_matrix
+
+
+def _exploded(genres):
+    # Plain pandas reference: one row per (game, listed genre)
+    tokens = genres.astype("object").str.split(",").explode().str.strip()
+    return tokens[tokens.notna() & (tokens != "")]
+
+
+def test_rows_list_the_same_genres_as_explode(games):
+    matrix = build_genre_matrix(games["genres"])
+    expected = _exploded(games["genres"])
+
+    assert matrix.n_rows == len(games)
+    assert list(matrix.vocabulary) == sorted(expected.unique())
+    np.testing.assert_array_equal(matrix.row_ids(), expected.index.to_numpy())
+    np.testing.assert_array_equal(matrix.vocabulary[matrix.indices], expected.to_numpy())
+
+
+def test_weighted_sum_matches_an_exploded_groupby(games):
+    matrix = build_genre_matrix(games["genres"])
+    values = games["recommendations"].fillna(0)
+
+    exploded = _exploded(games["genres"]).to_frame("genre").join(values)
+    expected = exploded.groupby("genre")["recommendations"].sum()
+
+    np.testing.assert_allclose(matrix.weighted_sum(values), expected.to_numpy())
+
+
+@pytest.mark.parametrize("dtype", ["object", "category"])
+def test_frames_without_any_genre_give_an_empty_matrix(games, dtype):
+    genres = games.loc[games["genres"].isna(), "genres"].astype(dtype)
+
+    matrix = build_genre_matrix(genres)
+
+    assert matrix.n_rows == len(genres) > 0
+    assert matrix.n_genres == 0
+    np.testing.assert_array_equal(matrix.indptr, np.zeros(len(genres) + 1))
+    assert len(matrix.row_ids()) == 0
+    assert len(matrix.weighted_sum(np.ones(len(genres)))) == 0
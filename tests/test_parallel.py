@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.aggregation import STANDARD_MEASURES, _compute
+from utils.parallel import partitioned_metrics
+
+
+def _entities(seed=0, n=5_000):
+    rng = np.random.default_rng(seed)
+    values = np.floor(rng.pareto(1.1, n) * 50)
+    values[rng.random(n) < 0.05] = np.nan
+    developers = rng.integers(0, n // 5, n).astype(str)
+    return pd.DataFrame(
+        {
+            "appid": np.arange(n),
+            "developer": pd.Categorical(developers),
+            "publisher": developers,
+            "recommendations": values,
+        }
+    )
+
+
+@pytest.mark.parametrize("column", ["developer", "publisher"])
+def test_partitioned_metrics_match_the_serial_engine(column):
+    df = _entities()
+
+    parallel = partitioned_metrics(df, column, workers=2, min_rows=1)
+    serial = _compute(df, [column], STANDARD_MEASURES)
+
+    pd.testing.assert_frame_equal(parallel, serial)
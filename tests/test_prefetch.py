@@ -0,0 +1,49 @@
+import threading
+import time
+
+from utils.prefetch import Prefetcher
+
+
+def _wait(prefetcher, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        finished, total = prefetcher.progress()
+        if finished == total:
+            return
+        time.sleep(0.01)
+    raise AssertionError("prefetch did not finish")
+
+
+def _fail():
+    raise RuntimeError("boom")
+
+
+def test_each_task_records_its_outcome():
+    ran = []
+    prefetcher = Prefetcher(
+        [
+            ("done", lambda: ran.append("done")),
+            ("skipped", lambda: False),
+            ("failed", _fail),
+        ]
+    )
+    _wait(prefetcher)
+
+    status = prefetcher.status().set_index("task")
+    assert status["state"].to_dict() == {"done": "done", "skipped": "skipped", "failed": "failed"}
+    assert "boom" in status.loc["failed", "error"]
+    assert status["error"].drop("failed").isna().all()
+    assert (status["seconds"] >= 0).all()
+    assert ran == ["done"]
+
+
+def test_starting_does_not_wait_for_the_tasks():
+    release = threading.Event()
+    prefetcher = Prefetcher([("slow", release.wait), ("queued", lambda: None)], max_workers=1)
+
+    assert prefetcher.progress() == (0, 2)
+    assert prefetcher.status().set_index("task").loc["queued", "state"] == "pending"
+
+    release.set()
+    _wait(prefetcher)
+    assert set(prefetcher.status()["state"]) == {"done"}
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.profiling import DatasetProfile, profile_chunks
+
+
+def _chunks(df, rows):
+    return [df.iloc[start:start + rows] for start in range(0, len(df), rows)]
+
+
+def test_missing_summary_and_frequencies_match_pandas(games):
+    profile = profile_chunks(_chunks(games, 700))
+
+    expected = games.isna().mean().mul(100).round(2)
+    summary = profile.missing_value_summary().set_index("column")["missing_pct"]
+    pd.testing.assert_series_equal(summary, expected, check_names=False)
+
+    counts = profile.value_counts("release_year")
+    pd.testing.assert_series_equal(
+        counts.sort_index(), games["release_year"].value_counts().sort_index(), check_names=False
+    )
+    assert profile.missing_share() == pytest.approx(games.isna().mean().mean())
+
+
+def test_numeric_statistics_match_pandas(games):
+    profile = profile_chunks(_chunks(games, 1_000))
+    summary = profile.summary().set_index("column")
+
+    for column in ["price", "recommendations", "release_year"]:
+        values = games[column]
+        assert summary.at[column, "count"] == values.count()
+        assert summary.at[column, "min"] == values.min()
+        assert summary.at[column, "max"] == values.max()
+        assert summary.at[column, "mean"] == pytest.approx(values.mean())
+
+    # Few distinct values: exact quantiles
+    assert summary.at["price", "p50"] == games["price"].median()
+    # Many distinct values: sketch quantiles (1% relative, whole numbers)
+    assert summary.at["recommendations", "p75"] == pytest.approx(
+        games["recommendations"].quantile(0.75), rel=0.01, abs=0.5
+    )
+
+
+def test_distinct_counts_are_exact_then_estimated(games):
+    profile = profile_chunks(_chunks(games, 1_000))
+
+    assert profile.distinct_count("release_year") == games["release_year"].nunique()
+    # More distinct names than tracked values: HyperLogLog (~1.6% error)
+    assert not profile.exact["name"]
+    assert profile.distinct_count("name") == pytest.approx(games["name"].nunique(), rel=0.05)
+
+
+def test_merged_profiles_equal_one_pass(games):
+    whole = profile_chunks([games])
+    left = DatasetProfile().fold(games.iloc[:1_234])
+    right = DatasetProfile().fold(games.iloc[1_234:])
+    merged = left.merge(right)
+
+    pd.testing.assert_frame_equal(merged.missing_value_summary(), whole.missing_value_summary())
+    for column in ["release_year", "publisher", "name"]:
+        assert merged.distinct_count(column) == whole.distinct_count(column)
+    np.testing.assert_array_equal(merged.registers["name"], whole.registers["name"])
@@ -0,0 +1,61 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.result_cache import ResultCache, estimate_nbytes
+
+
+def test_size_estimates_follow_the_data():
+    frame = pd.DataFrame({"a": np.zeros(1_000), "b": np.arange(1_000)})
+    shared = np.zeros(10_000)
+
+    assert estimate_nbytes(frame) == frame.memory_usage(index=True, deep=True).sum()
+    # The same array reached twice is counted once
+    assert estimate_nbytes([shared, shared]) < 2 * shared.nbytes
+
+
+def test_least_recently_used_entries_go_first_when_over_budget():
+    block = np.zeros(1_000)
+    cache = ResultCache(int(block.nbytes * 3.5))
+
+    for key in "abc":
+        cache.put(key, block.copy())
+    cache.get("a")
+    cache.put("d", block.copy())
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in "acd")
+    assert cache.stats()["evictions"] == 1
+    assert cache.bytes <= cache.budget_bytes
+
+
+def test_values_larger_than_the_budget_are_not_stored():
+    cache = ResultCache(100)
+
+    assert cache.put("big", np.zeros(1_000)) is not None
+    assert cache.get("big") is None and cache.bytes == 0
+
+
+def test_concurrent_misses_compute_once():
+    cache = ResultCache(10 * 1024**2)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return len(calls)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("key", compute)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1] and results == [1, 1, 1, 1]
+
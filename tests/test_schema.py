@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from conftest import raw_games
+from utils.schema import apply_schema, memory_report, memory_usage
+
+
+def _raw():
+    df = raw_games()
+    df.columns = df.columns.str.lower()
+    return df
+
+
+def test_typed_frame_holds_the_same_values():
+    raw = _raw()
+    raw.loc[:4, "price"] = [19.99, 0.1, 4.49, 1e7 + 0.01, 2**40 + 0.5]
+
+    typed = apply_schema(raw)
+
+    pd.testing.assert_frame_equal(
+        typed.astype(object).where(typed.notna(), None),
+        raw.astype(object).where(raw.notna(), None),
+        check_dtype=False,
+    )
+    assert typed["price"].dtype == "float64"
+    assert typed.loc[0, "price"] == 19.99
+
+
+def test_integer_columns_are_downcast_unless_values_are_missing():
+    raw = _raw()
+    raw["release_year"] = raw["release_year"].fillna(2020).astype("int64")
+
+    typed = apply_schema(raw)
+
+    assert typed["appid"].dtype == "uint16"
+    assert typed["release_year"].dtype == "int16"
+    # Missing values need a float; float64 keeps large counts exact
+    assert typed["recommendations"].dtype == "float64"
+    assert isinstance(typed["developer"].dtype, pd.CategoricalDtype)
+    assert not isinstance(typed["name"].dtype, pd.CategoricalDtype)
+
+
+def test_memory_report_totals_the_columns():
+    raw = _raw()
+    report = memory_report(memory_usage(raw), memory_usage(apply_schema(raw))).set_index("column")
+
+    assert report.loc["total", "before_bytes"] == report.drop("total")["before_bytes"].sum()
+    assert report.loc["total", "saving_pct"] > 0
+    assert np.isclose(
+        report.loc["appid", "saving_pct"],
+        (1 - report.loc["appid", "after_bytes"] / report.loc["appid", "before_bytes"]) * 100,
+        atol=0.05,
+    )
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.cube import build_cube
+from utils.sketches import (
+    RELATIVE_ACCURACY,
+    build_sketch,
+    integral,
+    merge_sketches,
+    roll_up,
+    sketch_quantiles,
+)
+
+
+def _catalog(seed=0):
+    # Groups of every size from 1 to 4 rows, plus a few large ones
+    rng = np.random.default_rng(seed)
+    small = np.repeat(np.arange(400), rng.integers(1, 5, 400))
+    large = rng.integers(400, 405, 20_000)
+    groups = np.concatenate([small, large])
+    values = np.floor(rng.pareto(1.1, len(groups)) * 50)
+    values[rng.random(len(groups)) < 0.05] = np.nan
+    return pd.DataFrame({"group": groups, "recommendations": values})
+
+
+def _assert_within_bound(estimates, exact, slack=0.0):
+    estimates = estimates.reindex(exact.index)
+    error = (estimates - exact).abs()
+    assert (error <= RELATIVE_ACCURACY * exact.abs() + slack + 1e-9).all(), error.max()
+
+
+@pytest.mark.parametrize("q", [0.1, 0.25, 0.5, 0.75, 0.9])
+def test_float_quantiles_match_pandas_within_bound(q):
+    df = _catalog()
+    df["recommendations"] += 0.25
+
+    sketch = build_sketch(df["group"], df["recommendations"])
+    exact = df.groupby("group")["recommendations"].quantile(q).dropna()
+
+    _assert_within_bound(sketch_quantiles(sketch, q), exact)
+
+
+def test_integer_medians_match_pandas_within_bound():
+    df = _catalog()
+
+    sketch = build_sketch(df["group"], df["recommendations"])
+    exact = df.groupby("group")["recommendations"].median().dropna()
+
+    # Rounding the bucket values adds at most 0.5
+    _assert_within_bound(sketch_quantiles(sketch, 0.5, integer=True), exact, slack=0.5)
+
+
+def test_two_value_median_is_the_midpoint():
+    df = pd.DataFrame({"group": ["a", "a", "b", "c", "c", "c"], "recommendations": [1, 20886, 7, 3, 4, 40]})
+
+    medians = sketch_quantiles(build_sketch(df["group"], df["recommendations"]), 0.5, integer=True)
+
+    assert medians["a"] == pytest.approx(10443.5, rel=RELATIVE_ACCURACY)
+    assert medians["b"] == 7
+    assert medians["c"] == 4
+
+
+def test_small_integers_are_exact():
+    df = _catalog()
+    df["recommendations"] = df["recommendations"] % 50
+
+    sketch = build_sketch(df["group"], df["recommendations"])
+    exact = df.groupby("group")["recommendations"].median().dropna()
+
+    pd.testing.assert_series_equal(
+        sketch_quantiles(sketch, 0.5, integer=True).reindex(exact.index), exact, check_names=False
+    )
+
+
+def test_merged_and_rolled_up_sketches_equal_a_single_pass():
+    df = _catalog()
+    df["half"] = np.arange(len(df)) % 2
+
+    whole = build_sketch(df["group"], df["recommendations"])
+    halves = merge_sketches(
+        *(build_sketch(part["group"], part["recommendations"]) for _, part in df.groupby("half"))
+    )
+    fine = roll_up(build_sketch(df[["group", "half"]], df["recommendations"]), ["group"])
+
+    pd.testing.assert_series_equal(halves.sort_index(), whole.sort_index())
+    pd.testing.assert_series_equal(
+        sketch_quantiles(fine, 0.5), sketch_quantiles(whole, 0.5), check_index_type=False
+    )
+
+
+def test_integral_is_decided_from_values():
+    assert integral(np.array([1.0, np.nan, 3.0]))
+    assert integral(np.array([1, 2], dtype="uint32"))
+    assert not integral(np.array([1.5, np.nan]))
+
+
+def test_cube_medians_of_whole_numbers_stored_as_floats():
+    df = _catalog()
+    assert df["recommendations"].dtype == "float64"
+
+    cube = build_cube(df[["group"]], pd.Series(np.arange(len(df))), df["recommendations"])
+    medians = cube.metrics(["group"], ("median_recommendations",)).set_index("group")
+    exact = df.groupby("group")["recommendations"].median().dropna()
+
+    assert cube.integer
+    # Whole numbers or midpoints of two of them, never bucket artefacts
+    assert (np.mod(medians["median_recommendations"] * 2, 1) == 0).all()
+    _assert_within_bound(medians["median_recommendations"], exact, slack=0.5)
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+from conftest import raw_games
+from utils.feature_engineering import yearly_coverage
+from utils.schema import apply_schema
+from utils.streaming import stream_aggregates
+
+
+def _source(tmp_path):
+    raw = raw_games()
+    raw.loc[raw.index[::9], "AppID"] = np.nan
+    path = tmp_path / "games.csv"
+    raw.to_csv(path, index=False)
+
+    df = pd.read_csv(path)
+    df.columns = df.columns.str.lower()
+    return path, apply_schema(df)
+
+
+def test_yearly_coverage_matches_the_in_memory_table(tmp_path):
+    path, df = _source(tmp_path)
+
+    streamed = stream_aggregates(path, chunk_rows=700)
+
+    pd.testing.assert_frame_equal(streamed.yearly_coverage(), yearly_coverage(df))
@@ -0,0 +1,315 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from utils.kernels import segmented_median, segmented_quantiles
+from utils.parallel import partitioned_metrics
+from utils.result_cache import result_cache
+from utils.sketches import (
+    RELATIVE_ACCURACY,
+    build_sketch,
+    integral,
+    roll_up,
+    sketch_percentiles,
+)
+
+# Named measures: output column -> (source column, reduction)
+MEASURES = {
+    "game_count": ("appid", "count"),
+    "total_recommendations": ("recommendations", "sum"),
+    "avg_recommendations": ("recommendations", "mean"),
+    "median_recommendations": ("recommendations", "median"),
+}
+
+STANDARD_MEASURES = (
+    "game_count",
+    "total_recommendations",
+    "avg_recommendations",
+    "median_recommendations",
+)
+
+# "exact": medians and quantiles are computed from the rows with the
+# segmented kernel, so every in-memory table and chart agrees exactly.
+# "sketch": they are read from mergeable quantile sketches rolled up from
+# the finest grouping already sketched for the frame. Sketches remain the
+# source where rows are gone: streaming and snapshots (cube medians; pages
+# with rows in memory read exact ones through `features.cube_metrics`).
+QUANTILE_METHOD = "exact"
+
+# Dimensions that share one fine-grained sketch; any subset of them is a
+# roll-up of it. Entity columns get a sketch of their own.
+ROLLUP_LEVELS = ("release_year", "primary_genre", "price_bucket", "pricing_type")
+
+
+# -------------------------
+# Dataset Fingerprint
+# -------------------------
+def _column_digest(values: pd.Series) -> bytes:
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Codes plus the (small) category table, without hashing every label
+        categories = pd.util.hash_pandas_object(values.cat.categories.to_series(), index=False)
+        return (
+            categories.to_numpy().tobytes()
+            + repr(values.cat.ordered).encode()
+            + np.ascontiguousarray(values.cat.codes.to_numpy()).tobytes()
+        )
+    if isinstance(values.dtype, np.dtype):
+        return values.dtype.str.encode() + np.ascontiguousarray(values.to_numpy()).tobytes()
+    return pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes()
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Identifies the rows and columns of a frame for memoization.
+    Frames stamped by the loader (`attrs["dataset_version"]`) hash their
+    index, and the contents of every column that is not a base column of
+    that version: filtered views keep the stamp but select other rows, and
+    overlaid columns (other price tiers, replaced values) carry data the
+    version does not identify. Unstamped frames fall back to hashing their
+    full contents.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(tuple(df.columns)).encode())
+
+    version = df.attrs.get("dataset_version")
+    if version is None:
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    digest.update(str(version).encode())
+    if isinstance(df.index, pd.RangeIndex):
+        digest.update(repr((df.index.start, df.index.stop, df.index.step)).encode())
+    else:
+        digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+
+    base = set(df.attrs.get("base_columns", df.columns))
+    for position, column in enumerate(df.columns):
+        if column not in base:
+            digest.update(_column_digest(df.iloc[:, position]))
+
+    return digest.hexdigest()
+
+
+# -------------------------
+# Group Codes
+# -------------------------
+def group_codes(df: pd.DataFrame, keys):
+    """
+    Factorizes the group keys once.
+    Returns per-row int64 codes (-1 where a key is missing) and a frame of
+    the sorted distinct key values, one row per code.
+    """
+    grouper = df.groupby(list(keys), observed=True, sort=True)
+    codes = grouper.ngroup().fillna(-1).to_numpy(dtype="int64")
+    key_frame = grouper.size().index.to_frame(index=False)
+    return codes, key_frame
+
+
+# -------------------------
+# Aggregation Engine
+# -------------------------
+def group_sketch(df: pd.DataFrame, keys, column="recommendations") -> pd.Series:
+    """
+    Quantile sketch of `column` per group of `keys`.
+    Keys within ROLLUP_LEVELS share one sketch at the finest grain the
+    frame has, so its rows are scanned once and every later request is a
+    direct cache lookup plus a merge of the stored sketches.
+    """
+    keys = (keys,) if isinstance(keys, str) else tuple(keys)
+
+    grain = keys
+    if set(keys) <= set(ROLLUP_LEVELS):
+        grain = tuple(level for level in ROLLUP_LEVELS if level in df.columns)
+
+    sketch = result_cache.get_or_compute(
+        ("sketch", frame_fingerprint(df), column, grain, RELATIVE_ACCURACY),
+        lambda: build_sketch(df[list(grain)], df[column], dropna=False),
+    )
+
+    return roll_up(sketch, keys)
+
+
+def _key_index(keys, key_frame):
+    return pd.MultiIndex.from_frame(key_frame) if len(keys) > 1 else pd.Index(key_frame[keys[0]])
+
+
+def _sketch_quantile_columns(df, keys, key_frame, column, qs):
+    quantiles = sketch_percentiles(
+        group_sketch(df, keys, column), qs, integer=integral(df[column].to_numpy())
+    )
+    return quantiles.reindex(_key_index(keys, key_frame))
+
+
+def _reduce(codes, n_groups, values, reductions):
+    """
+    Computes every requested reduction of one column in a single pass over
+    the shared group codes.
+    """
+    valid = codes >= 0
+    if values.dtype.kind == "f":
+        valid &= ~np.isnan(values)
+
+    group = codes[valid]
+    kept = values[valid]
+
+    out = {}
+    counts = np.bincount(group, minlength=n_groups)
+
+    if "count" in reductions:
+        out["count"] = counts
+
+    if "sum" in reductions or "mean" in reductions:
+        sums = np.bincount(group, weights=kept.astype("float64"), minlength=n_groups)
+        if "sum" in reductions:
+            out["sum"] = sums.astype("int64") if integral(kept) else sums
+        if "mean" in reductions:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                out["mean"] = sums / counts
+
+    if "median" in reductions and QUANTILE_METHOD == "exact":
+        out["median"] = segmented_median(group, kept, n_groups)
+
+    return out
+
+
+def _compute(df, keys, measures):
+    codes, result = group_codes(df, keys)
+    n_groups = len(result)
+
+    by_column = {}
+    for name in measures:
+        column, reduction = MEASURES[name]
+        by_column.setdefault(column, set()).add(reduction)
+
+    reduced = {
+        column: _reduce(codes, n_groups, df[column].to_numpy(), reductions)
+        for column, reductions in by_column.items()
+    }
+
+    for name in measures:
+        column, reduction = MEASURES[name]
+        if reduction == "median" and QUANTILE_METHOD == "sketch":
+            result[name] = _sketch_quantile_columns(
+                df, keys, result[list(keys)], column, [0.5]
+            )[0.5].to_numpy()
+        else:
+            result[name] = reduced[column][reduction]
+
+    return result
+
+
+def memoized(df: pd.DataFrame, spec, compute):
+    """
+    Returns `compute()` for this frame and result spec, running it at most
+    once while the result stays in the shared result cache. The key is the
+    frame fingerprint (dataset version and selected rows, i.e. the active
+    filters) plus `spec`, which must be hashable and identify the result
+    (function name plus parameters).
+    """
+    result = result_cache.get_or_compute(("result", frame_fingerprint(df), spec), compute)
+    return result.copy()
+
+
+def _aggregate(df, keys, measures):
+    if len(keys) == 1 and set(measures) <= set(STANDARD_MEASURES) and QUANTILE_METHOD == "exact":
+        # Large single-key groupings (publisher, developer) fan out to the
+        # process pool, which computes exact medians; None means the input
+        # is too small to be worth it
+        result = partitioned_metrics(df, keys[0])
+        if result is not None:
+            return result[[*keys, *measures]]
+
+    return _compute(df, keys, measures)
+
+
+def aggregate(df: pd.DataFrame, keys, measures=STANDARD_MEASURES) -> pd.DataFrame:
+    """
+    Groups `df` by `keys` and returns one row per group with the requested
+    named measures (see MEASURES), sorted by the keys.
+    Results are memoized by dataset fingerprint and grouping spec.
+    """
+    keys = (keys,) if isinstance(keys, str) else tuple(keys)
+    measures = tuple(measures)
+
+    # The quantile method is part of the spec: results persist across restarts
+    return memoized(
+        df,
+        ("aggregate", keys, measures, QUANTILE_METHOD),
+        lambda: _aggregate(df, keys, measures),
+    )
+
+
+def _quantiles(df, keys, qs, column):
+    if QUANTILE_METHOD == "sketch":
+        return sketch_percentiles(
+            group_sketch(df, keys, column), qs, integer=integral(df[column].to_numpy())
+        )
+
+    codes, key_frame = group_codes(df, keys)
+    quantiles = segmented_quantiles(codes, df[column].to_numpy(), len(key_frame), qs)
+    return pd.DataFrame(quantiles, index=_key_index(keys, key_frame))
+
+
+def aggregate_quantiles(df: pd.DataFrame, keys, qs, column="recommendations") -> pd.DataFrame:
+    """
+    Quantiles of `column` per group of `keys`, one column per q, computed
+    as QUANTILE_METHOD says (see utils/sketches.py for the sketch bound).
+    """
+    keys = (keys,) if isinstance(keys, str) else tuple(keys)
+    qs = tuple(qs)
+    return memoized(
+        df,
+        ("quantiles", keys, qs, column, QUANTILE_METHOD),
+        lambda: _quantiles(df, keys, qs, column),
+    )
+
+
+def _top_groups(df, key, k):
+    codes, key_frame = group_codes(df, [key])
+    n_groups = len(key_frame)
+
+    appid = _reduce(codes, n_groups, df["appid"].to_numpy(), {"count"})
+    recommendations = df["recommendations"].to_numpy()
+    reduced = _reduce(codes, n_groups, recommendations, {"sum", "mean"})
+    totals = reduced["sum"]
+
+    # Partial selection: everything tied with the k-th total is a candidate,
+    # then only the candidates are ordered (total descending, key ascending)
+    k = min(k, n_groups)
+    if k == 0:
+        return pd.DataFrame(columns=[key, *STANDARD_MEASURES])
+    threshold = np.partition(totals, n_groups - k)[n_groups - k]
+    candidates = np.flatnonzero(totals >= threshold)
+    top = candidates[np.lexsort((candidates, -totals[candidates]))][:k]
+
+    # Medians only for the rows of the selected groups, exact
+    rank = np.full(n_groups + 1, -1, dtype=np.int64)
+    rank[top] = np.arange(k)
+    local = rank[codes]
+    valid = local >= 0
+    if recommendations.dtype.kind == "f":
+        valid &= ~np.isnan(recommendations)
+
+    result = key_frame.iloc[top].reset_index(drop=True)
+    result["game_count"] = appid["count"][top]
+    result["total_recommendations"] = totals[top]
+    result["avg_recommendations"] = reduced["mean"][top]
+    result["median_recommendations"] = segmented_median(
+        local[valid], recommendations[valid], k
+    )
+    return result
+
+
+def top_groups(df: pd.DataFrame, key, k) -> pd.DataFrame:
+    """
+    The k groups of `key` with the most total recommendations, ordered by
+    that total, with the standard measures. Totals are one pass over all
+    groups; the leaders are found by partial selection and medians are
+    computed only for their rows.
+    """
+    return memoized(df, ("top_groups", key, k), lambda: _top_groups(df, key, k))
+
+
+def clear_memo():
+    result_cache.clear()
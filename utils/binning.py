@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from utils.aggregation import memoized
+
+
+# -------------------------
+# Server-Side Histogram Binning
+# -------------------------
+def bin_edges(values, nbins=60, scale="linear"):
+    """
+    Fixed-width edges from 0 to the maximum, or log-spaced edges with a
+    leading [0, 1) bin so zero counts stay visible on a log axis.
+    """
+    low = min(float(values.min()), 0.0) if len(values) else 0.0
+    high = float(values.max()) if len(values) else 1.0
+
+    if scale == "log":
+        return np.concatenate(([0.0], np.geomspace(1.0, max(high, 1.0), nbins)))
+    if scale == "linear":
+        return np.linspace(low, high, nbins + 1)
+
+    raise ValueError(f"unknown histogram scale: {scale!r}")
+
+
+def bin_counts(values, nbins=60, scale="linear") -> pd.DataFrame:
+    """
+    Counts values per bin in NumPy. Returns one row per bin with its edges,
+    which is all the chart needs to draw.
+    """
+    values = np.asarray(values, dtype="float64")
+    values = values[~np.isnan(values)]
+    edges = bin_edges(values, nbins, scale)
+
+    if scale == "linear":
+        width = (edges[-1] - edges[0]) / nbins or 1.0
+        bins = ((values - edges[0]) / width).astype(np.int64)
+    else:
+        bins = np.searchsorted(edges, values, side="right") - 1
+
+    # The maximum sits on the last edge; it belongs to the last bin
+    bins = np.clip(bins, 0, nbins - 1)
+
+    return pd.DataFrame(
+        {
+            "bin_start": edges[:-1],
+            "bin_end": edges[1:],
+            "games": np.bincount(bins, minlength=nbins).astype("int64"),
+        }
+    )
+
+
+def histogram(df, column="recommendations", nbins=60, scale="linear") -> pd.DataFrame:
+    """
+    `bin_counts` of a frame column, memoized per dataset version.
+    """
+    return memoized(
+        df,
+        ("histogram", column, nbins, scale),
+        lambda: bin_counts(df[column].to_numpy(dtype="float64"), nbins, scale),
+    )
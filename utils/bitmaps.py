@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+# Set bits per byte value, for counting rows without unpacking
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+# -------------------------
+# Packed Row Bitmaps
+# -------------------------
+def rows_to_bitmap(rows, n_rows):
+    """
+    Packs a list of row positions into a bitmap of n_rows bits (8 rows per
+    byte, so a 1M-row bitmap takes 125 kB).
+    """
+    bits = np.zeros(n_rows, dtype=bool)
+    bits[rows] = True
+    return np.packbits(bits)
+
+
+def bitmap_rows(bitmap, n_rows):
+    """
+    Row positions whose bit is set, in ascending order.
+    """
+    return np.flatnonzero(np.unpackbits(bitmap, count=n_rows))
+
+
+def bitmap_count(bitmap):
+    return int(_POPCOUNT[bitmap].sum())
+
+
+def bitmap_and(*bitmaps):
+    return np.bitwise_and.reduce(bitmaps)
+
+
+def bitmap_or(*bitmaps):
+    return np.bitwise_or.reduce(bitmaps)
+
+
+class BitmapIndex:
+    """
+    One packed bitmap per distinct value of a column. Selecting rows for a
+    set of values is an OR of their bitmaps: byte-wise work on n / 8 bytes
+    instead of comparing every row.
+    """
+
+    def __init__(self, n_rows, bitmaps):
+        self.n_rows = n_rows
+        self.bitmaps = bitmaps
+
+    @property
+    def values(self):
+        return list(self.bitmaps)
+
+    def any_of(self, values):
+        """
+        Bitmap of the rows holding any of `values` (no rows for an empty list).
+        """
+        selected = [self.bitmaps[value] for value in values if value in self.bitmaps]
+        if not selected:
+            return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        return bitmap_or(*selected)
+
+
+def build_bitmap_index(column) -> BitmapIndex:
+    """
+    Indexes a single-valued column; missing values get no bitmap.
+    """
+    codes, uniques = pd.factorize(pd.Series(column), sort=True)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+
+    return BitmapIndex(
+        len(codes),
+        {
+            value: rows_to_bitmap(order[bounds[code]:bounds[code + 1]], len(codes))
+            for code, value in enumerate(uniques.tolist())
+        },
+    )
+
+
+def build_genre_bitmap_index(matrix) -> BitmapIndex:
+    """
+    Indexes the multi-valued genres column from its sparse matrix: a game
+    is in the bitmap of every genre it lists.
+    """
+    rows = matrix.row_ids()
+    order = np.argsort(matrix.indices, kind="stable")
+    bounds = np.searchsorted(matrix.indices[order], np.arange(matrix.n_genres + 1))
+
+    return BitmapIndex(
+        matrix.n_rows,
+        {
+            genre: rows_to_bitmap(rows[order[bounds[code]:bounds[code + 1]]], matrix.n_rows)
+            for code, genre in enumerate(matrix.vocabulary)
+        },
+    )
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+from utils.aggregation import memoized
+from utils.feature_engineering import PRICING_TYPES, tier_codes
+from utils.kernels import sort_segments
+
+# Points beyond the whiskers sent to the chart, per category
+MAX_OUTLIERS = 200
+
+# Tukey fences: whiskers reach the last point within 1.5 IQR of the box
+WHISKER_IQR = 1.5
+
+
+# -------------------------
+# Box-Plot Summary Statistics
+# -------------------------
+def _evenly_spaced(values, limit):
+    if len(values) <= limit:
+        return values
+    # Keeps both extremes and an even spread of the sorted points between
+    return values[np.linspace(0, len(values) - 1, limit).round().astype(np.int64)]
+
+
+def box_stats_from_codes(codes, values, labels, max_outliers=MAX_OUTLIERS) -> pd.DataFrame:
+    """
+    Quartiles, Tukey whiskers and a capped, evenly spaced outlier sample for
+    every group code, from one segmented sort. Quartiles use linear
+    interpolation, as Plotly does by default.
+    """
+    segments = sort_segments(codes, values, len(labels))
+    starts, counts = segments.starts, segments.counts
+    sorted_values = segments.sorted_values()
+
+    q1 = segments.quantile(0.25)
+    median = segments.quantile(0.5)
+    q3 = segments.quantile(0.75)
+    iqr = q3 - q1
+
+    present = counts > 0
+    group = np.repeat(np.arange(len(labels)), counts)
+    inside = (sorted_values >= (q1 - WHISKER_IQR * iqr)[group]) & (
+        sorted_values <= (q3 + WHISKER_IQR * iqr)[group]
+    )
+
+    lowerfence = np.full(len(labels), np.nan)
+    upperfence = np.full(len(labels), np.nan)
+    lowerfence[present] = np.minimum.reduceat(
+        np.where(inside, sorted_values, np.inf), starts[present]
+    )
+    upperfence[present] = np.maximum.reduceat(
+        np.where(inside, sorted_values, -np.inf), starts[present]
+    )
+
+    outliers = [
+        _evenly_spaced(sorted_values[start:start + count][~inside[start:start + count]], max_outliers)
+        for start, count in zip(starts, counts)
+    ]
+
+    return pd.DataFrame(
+        {
+            "category": list(labels),
+            "count": counts,
+            "lowerfence": lowerfence,
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "upperfence": upperfence,
+            "outliers": outliers,
+        }
+    )[present].reset_index(drop=True)
+
+
+def tier_box_stats(
+    df, column="recommendations", tier_column="price", tiers=PRICING_TYPES
+) -> pd.DataFrame:
+    """
+    Box statistics of `column` per tier of `tier_column` (Free vs Paid by
+    default), memoized per dataset version. Nothing is added to `df`.
+    """
+    return memoized(
+        df,
+        ("tier_box_stats", column, tier_column, tuple(tiers["edges"]), tuple(tiers["labels"])),
+        lambda: box_stats_from_codes(
+            tier_codes(df[tier_column], tiers["edges"]),
+            df[column].to_numpy(),
+            tiers["labels"],
+        ),
+    )
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+
+# Above this share of changed rows, rebuilding from scratch is cheaper
+# than applying the delta
+MAX_DELTA_SHARE = 0.5
+
+# Below this many rows a rebuild costs less than the fixed overhead of
+# building and applying delta aggregates (see benchmarks/bench_refresh.py)
+MIN_INCREMENTAL_ROWS = 100_000
+
+
+# Column of the column store holding each row's digest, so the next
+# refresh does not rehash the previous version
+ROW_DIGEST_COLUMN = "_row_digest"
+
+
+# -------------------------
+# Change Detection
+# -------------------------
+def _compact(rows):
+    # A few changed rows keep the full category tables of their version;
+    # trimming them keeps grouping the delta proportional to its size
+    for column in rows.columns:
+        if isinstance(rows[column].dtype, pd.CategoricalDtype):
+            rows[column] = rows[column].cat.remove_unused_categories()
+    return rows
+
+
+class DatasetDelta:
+    """
+    Rows that differ between two versions of the dataset, matched by
+    appid: `added` and `modified_new` come from the new version,
+    `removed` and `modified_old` from the previous one.
+    """
+
+    def __init__(self, added, removed, modified_old, modified_new):
+        self.added = added
+        self.removed = removed
+        self.modified_old = modified_old
+        self.modified_new = modified_new
+
+    @property
+    def retracted(self) -> pd.DataFrame:
+        """
+        Previous-version rows whose contribution must be taken out.
+        """
+        return _compact(pd.concat([self.removed, self.modified_old], ignore_index=True))
+
+    @property
+    def inserted(self) -> pd.DataFrame:
+        """
+        New-version rows whose contribution must be added.
+        """
+        return _compact(pd.concat([self.added, self.modified_new], ignore_index=True))
+
+    def counts(self) -> dict:
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "modified": len(self.modified_new),
+        }
+
+    @property
+    def changed_rows(self):
+        return len(self.added) + len(self.removed) + len(self.modified_new)
+
+
+def row_digests(df, key="appid"):
+    """
+    One 64-bit hash per row over every column except `key`. Numeric
+    columns are hashed as float64, so a column downcast to another width
+    in the new version does not read as modified.
+    """
+    columns = {
+        column: df[column].astype("float64") if df[column].dtype.kind in "iuf" else df[column]
+        for column in df.columns
+        if column != key
+    }
+    return pd.util.hash_pandas_object(pd.DataFrame(columns), index=False).to_numpy()
+
+
+def _ids(df, key):
+    ids = df[key]
+    if ids.isna().any():
+        return None
+    return ids.to_numpy(dtype="int64")
+
+
+def _dense_positions(previous_ids, current_ids):
+    # Ids in a narrow range (Steam appids) index a lookup table directly
+    low = min(previous_ids.min(), current_ids.min())
+    span = max(previous_ids.max(), current_ids.max()) - low + 1
+    if span > max(4 * (len(previous_ids) + len(current_ids)), 1 << 22):
+        return None
+
+    for ids in (previous_ids, current_ids):
+        if np.bincount(ids - low, minlength=span).max() > 1:
+            raise ValueError("duplicate ids")
+
+    lookup = np.full(span, -1, dtype=np.int64)
+    lookup[previous_ids - low] = np.arange(len(previous_ids))
+    return lookup[current_ids - low]
+
+
+def match_ids(previous_ids, current_ids):
+    """
+    Position in `previous_ids` of every entry of `current_ids` (-1 where it
+    is new). Raises ValueError when either side repeats an id.
+    """
+    if len(previous_ids) == 0 or len(current_ids) == 0:
+        return np.full(len(current_ids), -1, dtype=np.int64)
+
+    position = _dense_positions(previous_ids, current_ids)
+    if position is not None:
+        return position
+
+    previous_index, current_index = pd.Index(previous_ids), pd.Index(current_ids)
+    if not (previous_index.is_unique and current_index.is_unique):
+        raise ValueError("duplicate ids")
+    return previous_index.get_indexer(current_index)
+
+
+def diff_by_appid(previous, current, key="appid", previous_digests=None, current_digests=None):
+    """
+    Compares two versions of the dataset row by row, matched on `key`.
+    Returns a DatasetDelta, or None when the versions cannot be matched
+    (different columns, missing or duplicate ids). Digests stored with the
+    previous version skip rehashing it; either way the diff is one linear
+    pass and only the changed rows are materialized.
+    """
+    if list(previous.columns) != list(current.columns) or key not in current.columns:
+        return None
+
+    previous_ids, current_ids = _ids(previous, key), _ids(current, key)
+    if previous_ids is None or current_ids is None:
+        return None
+    try:
+        position = match_ids(previous_ids, current_ids)
+    except ValueError:
+        return None
+
+    if previous_digests is None or len(previous_digests) != len(previous):
+        previous_digests = row_digests(previous, key)
+    if current_digests is None or len(current_digests) != len(current):
+        current_digests = row_digests(current, key)
+
+    matched = position >= 0
+    changed = np.zeros(len(current), dtype=bool)
+    changed[matched] = current_digests[matched] != previous_digests[position[matched]]
+
+    kept = np.zeros(len(previous), dtype=bool)
+    kept[position[matched]] = True
+
+    return DatasetDelta(
+        added=current.take(np.flatnonzero(~matched)).reset_index(drop=True),
+        removed=previous.take(np.flatnonzero(~kept)).reset_index(drop=True),
+        modified_old=previous.take(position[changed]).reset_index(drop=True),
+        modified_new=current.take(np.flatnonzero(changed)).reset_index(drop=True),
+    )
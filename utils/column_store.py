@@ -0,0 +1,98 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Bumped whenever the on-disk layout changes
+COLUMN_STORE_VERSION = 1
+
+HEADER = "header.json"
+
+
+# -------------------------
+# Fixed-Width Column Store
+# -------------------------
+def _column_file(column, dataset_version):
+    # Versioned names: a rewrite never touches a file another process has
+    # mapped, it only unlinks it once the new header is in place
+    return f"{column}.{dataset_version[:16]}.bin"
+
+
+def write_column_store(columns, directory, dataset_version):
+    """
+    Writes each NumPy column as raw little-endian values (one file per
+    column) plus a JSON header with dtype and row count. The header is
+    replaced last, so readers see either the old store or the new one.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    n_rows = len(next(iter(columns.values()))) if columns else 0
+
+    header = {
+        "version": COLUMN_STORE_VERSION,
+        "dataset_version": dataset_version,
+        "rows": n_rows,
+        "columns": {},
+    }
+
+    for column, values in columns.items():
+        values = np.ascontiguousarray(values)
+        dtype = values.dtype.newbyteorder("<")
+        file_name = _column_file(column, dataset_version)
+
+        tmp_path = directory / (file_name + ".tmp")
+        values.astype(dtype, copy=False).tofile(tmp_path)
+        os.replace(tmp_path, directory / file_name)
+        header["columns"][column] = {"dtype": dtype.str, "file": file_name}
+
+    tmp_path = directory / (HEADER + ".tmp")
+    with open(tmp_path, "w") as fh:
+        json.dump(header, fh)
+    os.replace(tmp_path, directory / HEADER)
+
+    # Drop files of earlier versions; existing maps of them stay valid
+    current = {spec["file"] for spec in header["columns"].values()}
+    for path in directory.glob("*.bin"):
+        if path.name not in current:
+            path.unlink(missing_ok=True)
+
+
+def open_column_store(directory, dataset_version):
+    """
+    Read-only `np.memmap` per stored column, or None when the store is
+    missing, incomplete or was written for another dataset version.
+    Every process mapping the same files shares one copy in the OS page
+    cache.
+    """
+    directory = Path(directory)
+    try:
+        with open(directory / HEADER) as fh:
+            header = json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        header.get("version") != COLUMN_STORE_VERSION
+        or header.get("dataset_version") != dataset_version
+    ):
+        return None
+
+    n_rows = header["rows"]
+    columns = {}
+
+    for column, spec in header["columns"].items():
+        path = directory / spec["file"]
+        dtype = np.dtype(spec["dtype"])
+        try:
+            if os.path.getsize(path) != n_rows * dtype.itemsize:
+                return None
+            columns[column] = (
+                np.memmap(path, dtype=dtype, mode="r", shape=(n_rows,))
+                if n_rows
+                else np.empty(0, dtype=dtype)
+            )
+        except (OSError, ValueError):
+            return None
+
+    return columns
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+
+# Dimension -> (entity column, measure). Games are their own entities;
+# "games" as a measure counts the titles in each entity's catalog.
+CONCENTRATION_DIMENSIONS = {
+    "games": (None, "recommendations"),
+    "publishers": ("publisher", "recommendations"),
+    "developers": ("developer", "recommendations"),
+    "genres": ("primary_genre", "recommendations"),
+    "publisher_catalogs": ("publisher", "games"),
+}
+
+# Top-N entity counts and top-fraction shares reported per dimension
+TOP_COUNTS = (1, 5, 10)
+TOP_FRACTIONS = (0.01, 0.1, 0.2)
+
+# Points kept on each Lorenz curve, evenly spaced in population share
+LORENZ_POINTS = 101
+
+
+# -------------------------
+# Concentration Profile
+# -------------------------
+def _share_name(fraction):
+    return f"top_{round(fraction * 100)}pct_share"
+
+
+def concentration_profile(values, counts=None) -> dict:
+    """
+    Gini, HHI, top-N and top-fraction shares and a downsampled Lorenz curve
+    of one distribution, all read off a single sort and its cumulative sums.
+    `counts` weights each value (e.g. sketch buckets holding many games);
+    shares are fractions of the total and HHI is on the 0-10,000 scale.
+    """
+    values = np.asarray(values, dtype="float64")
+    counts = np.ones(len(values)) if counts is None else np.asarray(counts, dtype="float64")
+    keep = ~np.isnan(values) & (counts > 0)
+    values, counts = values[keep], counts[keep]
+
+    order = np.argsort(values, kind="stable")
+    values, counts = values[order], counts[order]
+
+    # Lorenz vertices: entities and mass held, from the smallest value up
+    entities = np.concatenate([[0.0], np.cumsum(counts)])
+    mass = np.concatenate([[0.0], np.cumsum(values * counts)])
+    n, total = entities[-1], mass[-1]
+
+    population = np.linspace(0, 1, LORENZ_POINTS)
+    profile = {"entities": int(n), "total": float(total)}
+
+    if not total:
+        profile.update({"gini": 0.0, "hhi": 0.0})
+        profile.update({f"top_{k}_share": 0.0 for k in TOP_COUNTS})
+        profile.update({_share_name(f): 0.0 for f in TOP_FRACTIONS})
+        profile["lorenz"] = pd.DataFrame(
+            {"population_share": population, "value_share": np.zeros(LORENZ_POINTS)}
+        )
+        return profile
+
+    lorenz = mass / total
+
+    def top_share(top_n):
+        # Linear inside a vertex pair is exact: its entities share one value
+        return float(1 - np.interp(n - min(top_n, n), entities, mass) / total)
+
+    profile["gini"] = float(1 - np.sum(counts / n * (lorenz[:-1] + lorenz[1:])))
+    profile["hhi"] = float(np.sum(counts * (values / total) ** 2) * 10_000)
+    profile.update({f"top_{k}_share": top_share(k) for k in TOP_COUNTS})
+    profile.update({_share_name(f): top_share(int(n * f)) for f in TOP_FRACTIONS})
+    profile["lorenz"] = pd.DataFrame(
+        {
+            "population_share": population,
+            "value_share": np.interp(population * n, entities, mass) / total,
+        }
+    )
+    return profile
+
+
+# -------------------------
+# Market Concentration
+# -------------------------
+def entity_totals(entities, values=None):
+    """
+    Per-entity totals of `values` (rows per entity when None), skipping
+    rows with a missing entity or value.
+    """
+    codes, uniques = pd.factorize(pd.Series(entities))
+    if values is None:
+        weights = None
+    else:
+        weights = np.asarray(values, dtype="float64")
+        codes = np.where(np.isnan(weights), -1, codes)
+
+    valid = codes >= 0
+    return np.bincount(
+        codes[valid],
+        weights=None if weights is None else weights[valid],
+        minlength=len(uniques),
+    )
+
+
+def market_concentration(columns) -> dict:
+    """
+    Concentration profile per dimension of CONCENTRATION_DIMENSIONS, from
+    {column: values} holding recommendations and the entity columns.
+    """
+    recommendations = columns["recommendations"]
+    profiles = {}
+
+    for dimension, (entity, measure) in CONCENTRATION_DIMENSIONS.items():
+        if entity is None:
+            values = recommendations
+        else:
+            values = entity_totals(
+                columns[entity], recommendations if measure == "recommendations" else None
+            )
+        profiles[dimension] = concentration_profile(values)
+
+    return profiles
+
+
+# -------------------------
+# Tabular Form
+# -------------------------
+def concentration_tables(profiles):
+    """
+    Flattens profiles into a summary table (one row per dimension) and a
+    long Lorenz table, e.g. for storing in a snapshot.
+    """
+    summary = pd.DataFrame(
+        [
+            {"dimension": dimension, **{k: v for k, v in profile.items() if k != "lorenz"}}
+            for dimension, profile in profiles.items()
+        ]
+    )
+    lorenz = pd.concat(
+        [profile["lorenz"].assign(dimension=dimension) for dimension, profile in profiles.items()],
+        ignore_index=True,
+    )
+    return summary, lorenz
+
+
+def profiles_from_tables(summary, lorenz) -> dict:
+    """
+    Inverse of `concentration_tables`.
+    """
+    curves = {
+        dimension: curve.drop(columns="dimension").reset_index(drop=True)
+        for dimension, curve in lorenz.groupby("dimension", sort=False)
+    }
+    profiles = {}
+    for row in summary.to_dict("records"):
+        dimension = row.pop("dimension")
+        profiles[dimension] = {**row, "lorenz": curves[dimension]}
+    return profiles
@@ -0,0 +1,276 @@
+import numpy as np
+import pandas as pd
+
+from utils.aggregation import STANDARD_MEASURES
+from utils.sketches import build_sketch, integral, roll_up, sketch_quantiles
+
+# Dimensions of the main cube; every chart grouping on a subset of them is
+# answered from its cells
+CUBE_DIMENSIONS = ("release_year", "primary_genre", "price_bucket", "pricing_type")
+
+# Measures a cube can report, named as in utils.aggregation.MEASURES
+CUBE_MEASURES = (*STANDARD_MEASURES, "std_recommendations")
+
+
+# -------------------------
+# Data Cube
+# -------------------------
+def _combine(parts):
+    # Sums aligned cells (or sketch buckets), keeping missing labels
+    combined = pd.concat(parts)
+    return combined.groupby(
+        level=list(combined.index.names), observed=True, dropna=False
+    ).sum()
+
+
+def _labels(index):
+    # Rebuilt from its values, so missing labels are coded alike whether
+    # the index came from a groupby (NaN level) or from arrays (code -1)
+    return pd.MultiIndex.from_arrays(
+        [index.get_level_values(level) for level in range(index.nlevels)]
+    )
+
+
+def _add_at(table, delta, occupancy):
+    """
+    `table + delta` aligned on the index, writing only the rows `delta`
+    touches (new labels are appended). Rows whose `occupancy` column
+    drops to zero are removed.
+    """
+    position = _labels(table.index).get_indexer(_labels(delta.index))
+    found = position >= 0
+
+    columns = {}
+    for column in table.columns:
+        values = table[column].to_numpy(copy=True)
+        values[position[found]] += delta[column].to_numpy()[found]
+        columns[column] = values
+    result = pd.DataFrame(columns, index=table.index)
+
+    if not found.all():
+        result = pd.concat([result, delta[~found]])
+
+    occupied = result[occupancy].to_numpy() > 0
+    return result if occupied.all() else result[occupied]
+
+
+class DataCube:
+    """
+    Recommendation facts pre-aggregated per cell of a few dimensions.
+    Each cell holds additive measures (game_count, count, sum, sum_sq) and
+    the cube keeps a quantile sketch per cell, so any roll-up, slice or
+    metric costs O(cells) and never touches the rows again.
+    Facts are the rows with a recommendations value; missing dimension
+    labels are kept as cells and only dropped by roll-ups that keep that
+    dimension.
+    """
+
+    def __init__(self, cells, sketch, integer=False):
+        self.cells = cells
+        self.sketch = sketch
+        self.integer = integer
+
+    @property
+    def dimensions(self):
+        return list(self.cells.index.names)
+
+    def slice(self, **conditions) -> "DataCube":
+        """
+        Keeps the cells whose labels are in the given lists, e.g.
+        `cube.slice(pricing_type=["Paid"], release_year=range(2021, 2024))`.
+        """
+        cells_mask = np.ones(len(self.cells), dtype=bool)
+        sketch_mask = np.ones(len(self.sketch), dtype=bool)
+
+        for dimension, labels in conditions.items():
+            labels = [labels] if np.isscalar(labels) else list(labels)
+            cells_mask &= self.cells.index.get_level_values(dimension).isin(labels)
+            sketch_mask &= self.sketch.index.get_level_values(dimension).isin(labels)
+
+        return DataCube(self.cells[cells_mask], self.sketch[sketch_mask], self.integer)
+
+    def roll_up(self, keys) -> pd.DataFrame:
+        """
+        Additive measures summed per group of `keys` (all cells merged into
+        one row when `keys` is empty).
+        """
+        keys = list(keys)
+        if not keys:
+            return self.cells.sum().to_frame().T
+
+        return self.cells.groupby(level=keys, observed=True).sum().sort_index()
+
+    def apply_delta(self, retracted=None, inserted=None) -> "DataCube":
+        """
+        The cube after taking out the facts of `retracted` and adding those
+        of `inserted` (cubes over the same dimensions, built from changed
+        rows only). Every cell measure and sketch bucket is a count or a
+        sum, so only the cells the delta touches are updated, whatever the
+        dataset size. Cells and buckets left without facts are dropped.
+        """
+        cells, sketch, integer = [], [], self.integer
+        if retracted is not None:
+            cells.append(-retracted.cells)
+            sketch.append(-retracted.sketch)
+        if inserted is not None:
+            cells.append(inserted.cells)
+            sketch.append(inserted.sketch)
+            integer = integer and inserted.integer
+        if not cells:
+            return self
+
+        # Net change per cell first (small), then only those cells are written
+        cells = _add_at(self.cells, _combine(cells), "count")
+        sketch = _add_at(self.sketch.to_frame(), _combine(sketch).to_frame(), "count")["count"]
+
+        return DataCube(
+            cells.astype({"game_count": "int64", "count": "int64"}), sketch, integer
+        )
+
+    def metrics(self, keys, measures=STANDARD_MEASURES) -> pd.DataFrame:
+        """
+        Same shape as `aggregate(df, keys, measures)` on the fact rows:
+        one row per group, sorted by the keys. Medians come from the rolled
+        up sketches; `utils.features.cube_metrics` swaps in exact ones when
+        the rows are in memory.
+        """
+        keys = list(keys)
+        cells = self.roll_up(keys)
+        result = cells.index.to_frame(index=False) if keys else pd.DataFrame(index=[0])
+
+        count = cells["count"].to_numpy()
+        total = cells["sum"].to_numpy()
+
+        for name in measures:
+            if name == "game_count":
+                result[name] = cells["game_count"].to_numpy().astype("int64")
+            elif name == "total_recommendations":
+                result[name] = total.astype("int64") if self.integer else total
+            elif name == "avg_recommendations":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result[name] = total / count
+            elif name == "std_recommendations":
+                # Sample standard deviation from the sum of squares
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    variance = (cells["sum_sq"].to_numpy() - total**2 / count) / (count - 1)
+                result[name] = np.sqrt(np.maximum(variance, 0))
+            elif name == "median_recommendations":
+                medians = sketch_quantiles(
+                    roll_up(self.sketch, keys), 0.5, integer=self.integer
+                )
+                result[name] = medians.reindex(cells.index).to_numpy() if keys else medians.to_numpy()
+            else:
+                raise KeyError(f"unknown cube measure: {name!r}")
+
+        return result
+
+
+def build_cube(dimensions: pd.DataFrame, appid, recommendations) -> DataCube:
+    """
+    Scans the rows once into cube cells over the columns of `dimensions`.
+    """
+    values = pd.Series(recommendations).reset_index(drop=True)
+    facts = dimensions.reset_index(drop=True)
+    levels = list(facts.columns)
+
+    observed = values.notna().to_numpy()
+    facts = facts[observed].reset_index(drop=True)
+    kept = values[observed].to_numpy(dtype="float64")
+
+    facts["game_count"] = pd.Series(appid).reset_index(drop=True)[observed].notna().to_numpy()
+    facts["count"] = 1
+    facts["sum"] = kept
+    facts["sum_sq"] = kept**2
+
+    cells = (
+        facts.groupby(levels, observed=True, dropna=False)[["game_count", "count", "sum", "sum_sq"]]
+        .sum()
+        .astype({"game_count": "int64", "count": "int64"})
+    )
+    sketch = build_sketch(dimensions, values, dropna=False)
+
+    return DataCube(cells, sketch, integer=integral(kept))
+
+
+def build_genre_cube(matrix, appid, recommendations, years, mask=None) -> DataCube:
+    """
+    Cube over (genres, release_year) with one fact per game and listed
+    genre. Cell measures are summed straight off the sparse genre matrix
+    (one `bincount` per measure); only the sketch visits each (game, genre)
+    pair. `mask` limits the games included (e.g. engaged games only).
+    """
+    values = np.asarray(recommendations, dtype="float64")
+    facts = ~np.isnan(values)
+    if mask is not None:
+        facts &= np.asarray(mask, dtype=bool)
+
+    # Missing years stay a cell of their own, sorted last as in a groupby
+    year_codes, year_labels = pd.factorize(np.asarray(years), sort=True, use_na_sentinel=False)
+    row_codes = np.where(facts, year_codes, -1)
+    kept = np.where(facts, values, 0.0)
+
+    sums = matrix.cell_sums(
+        row_codes,
+        len(year_labels),
+        {
+            "game_count": pd.notna(np.asarray(appid)),
+            "count": np.ones(len(values)),
+            "sum": kept,
+            "sum_sq": kept**2,
+        },
+    )
+    genre_ids, year_ids = np.nonzero(sums["count"])
+
+    index = pd.MultiIndex.from_arrays(
+        [
+            pd.Categorical.from_codes(genre_ids, categories=matrix.vocabulary),
+            year_labels[year_ids],
+        ],
+        names=["genres", "release_year"],
+    )
+    cells = pd.DataFrame(
+        {name: cell[genre_ids, year_ids] for name, cell in sums.items()}, index=index
+    ).astype({"game_count": "int64", "count": "int64"})
+
+    # Sketch buckets still need each fact's value, so it alone goes per pair
+    rows = matrix.row_ids()
+    pairs = facts[rows]
+    sketch = build_sketch(
+        pd.DataFrame(
+            {
+                "genres": pd.Categorical.from_codes(
+                    matrix.indices[pairs], categories=matrix.vocabulary
+                ),
+                "release_year": np.asarray(years)[rows[pairs]],
+            }
+        ),
+        values[rows[pairs]],
+        dropna=False,
+    )
+
+    return DataCube(cells, sketch, integer=integral(values[facts]))
+
+
+# -------------------------
+# Page Aggregates
+# -------------------------
+def cube_genre_metrics(genre_cube) -> pd.DataFrame:
+    """
+    Genre table of the pages: game_count, total_recommendations and
+    avg_recommendations per genre.
+    """
+    return genre_cube.metrics(
+        ["genres"], ("game_count", "total_recommendations", "avg_recommendations")
+    )
+
+
+def cube_genre_yearly_totals(genre_cube, genres=None) -> pd.DataFrame:
+    """
+    Total recommendations per (release_year, genre) in the long format the
+    trend charts expect, optionally limited to a list of genre names.
+    """
+    if genres is not None:
+        genre_cube = genre_cube.slice(genres=genres)
+    return genre_cube.metrics(
+        ["release_year", "genres"], ("total_recommendations",)
+    ).rename(columns={"total_recommendations": "recommendations"})
@@ -1,15 +1,376 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-@st.cache_data
-def load_data():
+from utils.changes import ROW_DIGEST_COLUMN, row_digests
+from utils.column_store import open_column_store, write_column_store
+from utils.dataset import freeze, stamp_version
+from utils.features import carry_forward
+from utils.snapshot import read_manifest, read_snapshot
+from utils.streaming import stream_aggregates
+from utils.schema import (
+    NUMERIC_COLUMNS,
+    SCHEMA_VERSION,
+    apply_schema,
+    memory_report,
+    memory_usage,
+)
+
+DATA_PATH = Path("data/steam_games.csv")
+CACHE_DIR = Path("data/.cache")
+
+# Above this size the pages render from streamed partial aggregates.
+# The environment variable forces the mode either way ("1" / "0").
+STREAMING_ENV = "STEAM_DASHBOARD_STREAMING"
+STREAMING_THRESHOLD_BYTES = 2 * 1024**3
+
+
+# -------------------------
+# Source Fingerprint
+# -------------------------
+def _file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_signature(path=DATA_PATH, previous=None):
     """
-    Loads the Steam games dataset.
-    Acts as a single source of truth for all pages.
+    Returns size, mtime and content hash of the source CSV.
+    The hash is reused from `previous` when size and mtime are unchanged,
+    so an untouched file is never re-read just to be fingerprinted.
+    """
+    stat = os.stat(path)
+    signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    if (
+        previous
+        and previous.get("size") == signature["size"]
+        and previous.get("mtime_ns") == signature["mtime_ns"]
+    ):
+        signature["sha256"] = previous["sha256"]
+    else:
+        signature["sha256"] = _file_sha256(path)
+
+    return signature
+
+
+def current_source_signature(path=DATA_PATH):
+    """
+    Signature of the source CSV as it is on disk now, reusing the hash
+    recorded by the last conversion when the file is untouched.
+    """
+    return source_signature(path, _read_meta(_cache_paths(path)[1]))
+
+
+# Last signature seen per source path in this process, so polling for a
+# changed CSV is a stat call even where the cache metadata is not writable
+_signatures = {}
+
+
+def dataset_version(path=DATA_PATH):
+    """
+    Content hash of the source CSV as it is on disk now.
+    """
+    previous = _signatures.get(path) or _read_meta(_cache_paths(path)[1])
+    signature = source_signature(path, previous)
+    _signatures[path] = signature
+    return signature["sha256"]
+
+
+# -------------------------
+# Columnar Cache
+# -------------------------
+def _cache_paths(path):
+    stem = Path(path).stem
+    return CACHE_DIR / f"{stem}.parquet", CACHE_DIR / f"{stem}.meta.json"
+
+
+def column_store_path(path=DATA_PATH):
+    return CACHE_DIR / f"{Path(path).stem}.columns"
+
+
+def snapshot_path(path=DATA_PATH):
+    return CACHE_DIR / f"{Path(path).stem}.snapshot.zip"
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def _atomic_write_json(obj, path):
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w") as fh:
+        json.dump(obj, fh)
+    os.replace(tmp_path, path)
+
+
+def _write_cache(df, parquet_path, meta_path, meta):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = parquet_path.with_suffix(".parquet.tmp")
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, parquet_path)
+    _atomic_write_json(meta, meta_path)
+
+
+def _is_fresh(meta, signature):
+    return (
+        meta is not None
+        and meta.get("schema_version") == SCHEMA_VERSION
+        and meta.get("sha256") == signature["sha256"]
+    )
+
+
+def _stamp(df, sha256):
+    # Typed frames differ per dtype plan, so memoized results (including
+    # the disk tier) are keyed on the plan as well as the CSV content
+    return stamp_version(df, (sha256, SCHEMA_VERSION))
+
+
+def _read_parquet(path, mapped=None):
+    import pyarrow.parquet as pq
+
+    # Columns already memory-mapped from the column store are not decoded
+    mapped = mapped or {}
+    names = pq.read_schema(path).names
+    table = pq.read_table(
+        path, columns=[name for name in names if name not in mapped], memory_map=True
+    )
+
+    # split_blocks keeps one block per column, so numeric columns stay
+    # zero-copy (read-only) views of the Arrow buffers
+    df = table.to_pandas(split_blocks=True)
+    if not mapped:
+        return df
+    return pd.DataFrame(
+        {name: mapped[name] if name in mapped else df[name] for name in names}, copy=False
+    )
+
+
+def _map_numeric_columns(df, path, dataset_version, digests=None):
+    """
+    Swaps the fixed-width numeric columns of `df` for read-only memory maps
+    of the column store, writing the store first (with the row digests the
+    next refresh diffs against). Returns `df` unchanged when the cache
+    directory is not writable.
+    """
+    columns = {
+        column: df[column].to_numpy()
+        for column in NUMERIC_COLUMNS
+        if column in df.columns and isinstance(df[column].dtype, np.dtype)
+    }
+    columns[ROW_DIGEST_COLUMN] = row_digests(df) if digests is None else digests
+    try:
+        write_column_store(columns, column_store_path(path), dataset_version)
+    except OSError:
+        return df
+
+    mapped = open_column_store(column_store_path(path), dataset_version)
+    if mapped is None:
+        return df
+    return pd.DataFrame(
+        {name: mapped[name] if name in mapped else df[name] for name in df.columns}, copy=False
+    )
+
+
+def _read_previous(path, parquet_path, meta):
+    """
+    The cached version a changed CSV replaces, with its stored row digests,
+    or (None, None) when there is no usable cache to diff against.
+    """
+    if (
+        meta is None
+        or meta.get("schema_version") != SCHEMA_VERSION
+        or not parquet_path.exists()
+    ):
+        return None, None
+
+    mapped = open_column_store(column_store_path(path), meta["sha256"])
+    try:
+        df = _read_parquet(parquet_path, mapped)
+    except (ImportError, OSError, ValueError):
+        return None, None
+
+    return _stamp(df, meta["sha256"]), (mapped or {}).get(ROW_DIGEST_COLUMN)
+
+
+def read_source(path=DATA_PATH):
+    """
+    Parses the raw CSV and standardizes column names.
     """
-    df = pd.read_csv("data/steam_games.csv")
+    df = pd.read_csv(path)
 
     # Standardize column names (safety)
     df.columns = df.columns.str.lower()
 
     return df
+
+
+def load_columnar(path=DATA_PATH):
+    """
+    Returns the typed dataset from the Parquet cache, converting the CSV on
+    first use and whenever its size, mtime, content hash or the dtype plan
+    changes. Numeric columns are memory-mapped from the column store, so
+    every server process shares one copy of them in the OS page cache.
+    A changed CSV is diffed against the cached version it replaces: the
+    counts land in the metadata and incremental aggregates are carried
+    forward by applying the delta.
+    """
+    parquet_path, meta_path = _cache_paths(path)
+    previous = _read_meta(meta_path)
+    signature = source_signature(path, previous)
+
+    if _is_fresh(previous, signature) and parquet_path.exists():
+        mapped = open_column_store(column_store_path(path), signature["sha256"])
+        try:
+            df = _read_parquet(parquet_path, mapped)
+        except (ImportError, OSError, ValueError):
+            df = None
+
+        if df is not None:
+            if mapped is None:
+                df = _map_numeric_columns(df, path, signature["sha256"])
+            # File was touched but not changed: refresh the stored stat
+            if any(previous.get(key) != value for key, value in signature.items()):
+                _atomic_write_json({**previous, **signature}, meta_path)
+            return _stamp(df, signature["sha256"])
+
+    raw = read_source(path)
+    df = _stamp(apply_schema(raw), signature["sha256"])
+
+    digests = row_digests(df)
+    previous_df, previous_digests = _read_previous(path, parquet_path, previous)
+    delta = (
+        carry_forward(previous_df, df, previous_digests, digests)
+        if previous_df is not None
+        else None
+    )
+
+    meta = {
+        **signature,
+        "schema_version": SCHEMA_VERSION,
+        "memory": {"before": memory_usage(raw), "after": memory_usage(df)},
+        "last_change": delta.counts() if delta is not None else None,
+    }
+
+    try:
+        _write_cache(df, parquet_path, meta_path, meta)
+    except (ImportError, OSError):
+        # No Parquet engine or read-only data dir: serve from the CSV parse
+        pass
+
+    df = _map_numeric_columns(df, path, signature["sha256"], digests)
+    return _stamp(df, signature["sha256"])
+
+
+def load_memory_report(path=DATA_PATH):
+    """
+    Returns the per-column memory saving of the dtype plan, as recorded
+    when the CSV was last converted. None if no conversion is on disk.
+    """
+    meta = _read_meta(_cache_paths(path)[1])
+    if not meta or "memory" not in meta:
+        return None
+
+    return memory_report(meta["memory"]["before"], meta["memory"]["after"])
+
+
+def load_last_change(path=DATA_PATH):
+    """
+    Rows added, removed and modified by the last CSV replacement, as
+    counted against the version it replaced. None before any replacement.
+    """
+    meta = _read_meta(_cache_paths(path)[1])
+    return meta.get("last_change") if meta else None
+
+
+@st.cache_resource(max_entries=1)
+def _load_dataset(sha256):
+    return freeze(load_columnar(DATA_PATH))
+
+
+def load_data():
+    """
+    Loads the Steam games dataset.
+    Acts as a single source of truth for all pages: one read-only frame
+    per server process, shared by every session without copying. Request
+    derived columns by name through `utils.features`; assigning into it
+    raises (see `utils.dataset.freeze`). A replaced CSV is picked up on the
+    next call.
+    """
+    return _load_dataset(dataset_version(DATA_PATH))
+
+
+# -------------------------
+# Streaming Mode
+# -------------------------
+def use_streaming(path=DATA_PATH):
+    flag = os.environ.get(STREAMING_ENV)
+    if flag is not None:
+        return flag.strip().lower() in ("1", "true", "yes")
+    return os.path.getsize(path) > STREAMING_THRESHOLD_BYTES
+
+
+@st.cache_resource(max_entries=1)
+def _stream_aggregates(size, mtime_ns):
+    return stream_aggregates(DATA_PATH)
+
+
+def load_streaming_aggregates():
+    """
+    Partial aggregates folded chunk by chunk from the CSV, for datasets
+    that do not fit in memory. A replaced CSV is streamed again in full.
+    """
+    stat = os.stat(DATA_PATH)
+    return _stream_aggregates(stat.st_size, stat.st_mtime_ns)
+
+
+# -------------------------
+# Precomputed Aggregates
+# -------------------------
+@st.cache_resource
+def _load_snapshot(snapshot_file, sha256):
+    return read_snapshot(snapshot_file)
+
+
+def load_snapshot(path=DATA_PATH):
+    """
+    Aggregates written by `python materialize.py`, or None when no snapshot
+    exists or it was built from another version of the CSV / dtype plan.
+    """
+    snapshot_file = snapshot_path(path)
+    manifest = read_manifest(snapshot_file)
+    if manifest is None or not manifest.get("source"):
+        return None
+
+    # The per-process signature keeps a touched CSV to one hash per process
+    sha256 = dataset_version(path)
+    if not _is_fresh(manifest["source"], {"sha256": sha256}):
+        return None
+
+    return _load_snapshot(snapshot_file, sha256)
+
+
+def load_aggregates(path=DATA_PATH):
+    """
+    Page aggregates that do not need the raw rows: a fresh snapshot when
+    one exists, otherwise streamed partials for oversized datasets. None
+    means pages compute from `load_data()`.
+    """
+    snapshot = load_snapshot(path)
+    if snapshot is not None:
+        return snapshot
+    if use_streaming(path):
+        return load_streaming_aggregates()
+    return None
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+
+# -------------------------
+# Read-Only Shared Frame
+# -------------------------
+def _read_only(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # `Categorical.codes` is already a read-only view of the codes
+        return pd.Categorical.from_codes(
+            series.array.codes, dtype=series.dtype, validate=False
+        )
+
+    if isinstance(series.dtype, np.dtype):
+        values = series.to_numpy()
+        values.flags.writeable = False
+        return values
+
+    # Arrow-backed strings and other extension arrays have immutable buffers
+    return series.array
+
+
+class FrozenFrame(pd.DataFrame):
+    """
+    DataFrame whose set of columns cannot change: adding, replacing or
+    deleting a column raises. Anything derived from it (copies, filters,
+    overlays) is a plain, writable DataFrame.
+    """
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    def _read_only_error(self, *args, **kwargs):
+        raise ValueError(
+            "the shared dataset is read-only; attach derived columns with "
+            "utils.dataset.overlay or utils.features.with_features"
+        )
+
+    # Column assignment and the `inplace=True` methods
+    __setitem__ = __delitem__ = insert = pop = _update_inplace = _read_only_error
+
+    def __setattr__(self, name, value):
+        if name in ("columns", "index"):
+            self._read_only_error()
+        super().__setattr__(name, value)
+
+
+def freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rebuilds `df` around read-only views of its own buffers (no data is
+    copied). In-place writes to the result, and assigning or deleting
+    columns on it, raise instead of silently changing the dataset every
+    session shares.
+    """
+    frozen = FrozenFrame(
+        {column: _read_only(df[column]) for column in df.columns},
+        index=df.index,
+        copy=False,
+    )
+    frozen.attrs.update(df.attrs)
+    return frozen
+
+
+def stamp_version(df: pd.DataFrame, version) -> pd.DataFrame:
+    """
+    Marks `df` as the loaded dataset `version`. Its current columns become
+    the base columns, which memoization identifies by version and name
+    alone (see `utils.aggregation.frame_fingerprint`).
+    """
+    df.attrs["dataset_version"] = version
+    df.attrs["base_columns"] = tuple(df.columns)
+    return df
+
+
+# -------------------------
+# Column Overlays
+# -------------------------
+def overlay(df: pd.DataFrame, **columns) -> pd.DataFrame:
+    """
+    Returns a view of `df` with extra (or replaced) columns.
+    The base columns are shared, not copied, and `df` itself is untouched,
+    so derived columns never leak into the shared dataset. A replaced
+    column stops counting as a base column of the view.
+    """
+    view = df.copy(deep=False)
+    for name, values in columns.items():
+        view[name] = values
+
+    if "base_columns" in view.attrs:
+        view.attrs["base_columns"] = tuple(
+            column for column in view.attrs["base_columns"] if column not in columns
+        )
+    return view
@@ -0,0 +1,153 @@
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+
+# Location and byte budget of the on-disk result cache (env vars, MB);
+# a budget of 0 turns the disk tier off. Point it only at a trusted
+# directory: its files are loaded with pickle
+DISK_CACHE_DIR_ENV = "STEAM_DASHBOARD_DISK_CACHE_DIR"
+DISK_CACHE_BUDGET_ENV = "STEAM_DASHBOARD_DISK_CACHE_MB"
+DEFAULT_DISK_CACHE_DIR = Path("data/.cache/results")
+DEFAULT_DISK_BUDGET_MB = 1024
+
+# Bump whenever a cached function changes what it returns for the same
+# inputs; entries written under another version are never read again
+DISK_CACHE_VERSION = 2
+
+
+# -------------------------
+# Content-Addressed Disk Cache
+# -------------------------
+class DiskCache:
+    """
+    Pickled results on disk, one file per entry, named by a hash of the
+    cache key (dataset fingerprint plus function and arguments). Writes go
+    to a temporary file that is renamed into place, so readers in any
+    process never see a partial entry. Reads refresh the file's mtime and
+    the oldest entries are evicted once the directory exceeds its budget.
+    The directory size is scanned once, then tracked per write; entries
+    other processes wrote are counted at the next eviction scan.
+    Entries are unpickled, which can run arbitrary code: the directory
+    must only be writable by the dashboard's own processes.
+    """
+
+    def __init__(self, directory, budget_bytes):
+        self.directory = Path(directory)
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = None
+
+    def _path(self, key):
+        digest = hashlib.blake2b(repr((DISK_CACHE_VERSION, key)).encode(), digest_size=20)
+        return self.directory / f"{digest.hexdigest()}.pkl"
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                value = pickle.load(fh)
+        except FileNotFoundError:
+            self._count("misses")
+            return default
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            # Unreadable or written by incompatible code: drop it
+            path.unlink(missing_ok=True)
+            self._count("misses")
+            return default
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return value
+
+    def put(self, key, value):
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            size = tmp_path.stat().st_size
+            replaced = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # Read-only disk or an unpicklable value: memory tier only
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = sum(entry_size for _, entry_size, _ in self._entries())
+            else:
+                self._bytes += size - replaced
+            over_budget = self._bytes > self.budget_bytes
+
+        if over_budget:
+            self._evict()
+
+    def _entries(self):
+        entries = []
+        for path in self.directory.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.budget_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self._count("evictions")
+
+        with self._lock:
+            self._bytes = total
+
+    def clear(self):
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._bytes = None
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            }
+
+
+def default_disk_cache():
+    """
+    The disk tier configured by the environment, or None when disabled.
+    """
+    budget_mb = float(os.environ.get(DISK_CACHE_BUDGET_ENV, DEFAULT_DISK_BUDGET_MB))
+    if budget_mb <= 0:
+        return None
+
+    directory = os.environ.get(DISK_CACHE_DIR_ENV, DEFAULT_DISK_CACHE_DIR)
+    return DiskCache(directory, int(budget_mb * 1024**2))
@@ -1,98 +1,136 @@
 import pandas as pd
 import numpy as np
 
-# -------------------------
-# Genre Processing
-# -------------------------
-def explode_genres(df):
-    df = df.copy()
-    df["genres"] = df["genres"].str.split(",")
-    df = df.explode("genres")
-    df["genres"] = df["genres"].str.strip()
-    return df
+from utils.aggregation import aggregate, top_groups
+from utils.dataset import overlay
+from utils.profiling import profile_frame
 
 
 # -------------------------
-# Pricing Buckets
+# Price Tiering
 # -------------------------
-def add_price_buckets(df):
-    df = df.copy()
+# Right-closed edges: a value goes to the first tier whose edge it does not
+# exceed; anything above the last edge goes to the final label. Negative
+# prices (sentinels for unknown) get no tier.
+PRICE_TIERS = {
+    "edges": [0, 500, 1000],
+    "labels": ["Free", "Low (₹1–₹500)", "Mid (₹501–₹1000)", "High (₹1000+)"],
+}
+
+PRICING_TYPES = {
+    "edges": [0],
+    "labels": ["Free", "Paid"],
+}
+
+
+def tier_codes(values, edges):
+    """
+    Vectorized tier lookup: returns int8 tier codes, -1 for missing and
+    negative values.
+    """
+    values = np.asarray(values, dtype="float64")
+    codes = np.searchsorted(np.asarray(edges, dtype="float64"), values, side="left")
+    codes[np.isnan(values) | (values < 0)] = -1
+    return codes.astype("int8")
+
+
+def assign_tiers(values, edges, labels):
+    """
+    Maps values onto ordered categorical tiers.
+    `labels` needs exactly one more entry than `edges`.
+    """
+    if len(labels) != len(edges) + 1:
+        raise ValueError("labels must have exactly one more entry than edges")
+
+    return pd.Categorical.from_codes(
+        tier_codes(values, edges), categories=labels, ordered=True
+    )
+
+
+def price_bucket(price, tiers=PRICE_TIERS):
+    return pd.Series(
+        assign_tiers(price, tiers["edges"], tiers["labels"]),
+        index=getattr(price, "index", None),
+        name="price_bucket",
+    )
 
-    def bucket(price):
-        if price == 0:
-            return "Free"
-        elif price <= 500:
-            return "Low (₹1–₹500)"
-        elif price <= 1000:
-            return "Mid (₹501–₹1000)"
-        else:
-            return "High (₹1000+)"
 
-    df["price_bucket"] = df["price"].apply(bucket)
-    df["pricing_type"] = np.where(df["price"] == 0, "Free", "Paid")
+def pricing_type(price, tiers=PRICING_TYPES):
+    return pd.Series(
+        assign_tiers(price, tiers["edges"], tiers["labels"]),
+        index=getattr(price, "index", None),
+        name="pricing_type",
+    )
+
 
-    return df
+def add_price_buckets(df, tiers=PRICE_TIERS):
+    return overlay(
+        df,
+        price_bucket=price_bucket(df["price"], tiers),
+        pricing_type=pricing_type(df["price"]),
+    )
 
 
 # -------------------------
 # Yearly Aggregates
 # -------------------------
 def yearly_metrics(df):
-    return (
-        df.groupby("release_year")
-        .agg(
-            game_count=("appid", "count"),
-            total_recommendations=("recommendations", "sum"),
-            avg_recommendations=("recommendations", "mean"),
-            median_recommendations=("recommendations", "median"),
-        )
-        .reset_index()
-        .sort_values("release_year")
-    )
+    return aggregate(df, ["release_year"])
 
 
 # -------------------------
 # Publisher / Developer Aggregates
 # -------------------------
 def entity_metrics(df, column):
-    return (
-        df.groupby(column)
-        .agg(
-            game_count=("appid", "count"),
-            total_recommendations=("recommendations", "sum"),
-            avg_recommendations=("recommendations", "mean"),
-            median_recommendations=("recommendations", "median"),
-        )
-        .reset_index()
-    )
+    return aggregate(df, [column])
+
+
+def top_entity_metrics(df, column, k=15):
+    """
+    Leading `k` entities by total recommendations, without computing the
+    long tail's medians.
+    """
+    return top_groups(df, column, k)
 
 def missing_value_summary(df):
-    return (
-        df.isna()
-        .mean()
-        .mul(100)
-        .round(2)
-        .reset_index()
-        .rename(columns={"index": "column", 0: "missing_pct"})
-    )
+    """
+    Missing share (%) per column, read from the frame's column profile.
+    """
+    return profile_frame(df).missing_value_summary()
     
 def yearly_coverage(df):
-    return (
-        df.groupby("release_year")["appid"]
-        .count()
-        .reset_index(name="records")
-        .sort_values("release_year")
+    """
+    Records (games with an appid) per release year, counted like the
+    game_count of `yearly_metrics`.
+    """
+    return aggregate(df, ["release_year"], ("game_count",)).rename(
+        columns={"game_count": "records"}
     )
     
-def add_primary_genre(df):
-    df = df.copy()
+def primary_genre(genres):
+    """
+    First listed genre of each row, "Unknown" when genres are missing.
+    """
+    if isinstance(genres.dtype, pd.CategoricalDtype):
+        # Split each distinct genre string once, then map back through the codes;
+        # code -1 (missing) picks the trailing "Unknown". The result stays
+        # categorical, so groupings reuse its codes.
+        categories = genres.cat.categories
+        primary = categories.str.split(",").str[0].str.strip().to_numpy(dtype=object)
+        labels, lookup = np.unique(np.append(primary, "Unknown"), return_inverse=True)
+        return pd.Series(
+            pd.Categorical.from_codes(lookup[genres.cat.codes.to_numpy()], categories=labels),
+            index=genres.index,
+        )
 
-    df["primary_genre"] = (
-        df["genres"]
+    return (
+        genres
         .fillna("Unknown")
         .str.split(",")
         .str[0]
         .str.strip()
     )
 
-    return df
+
+def add_primary_genre(df):
+    return overlay(df, primary_genre=primary_genre(df["genres"]))
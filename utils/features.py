@@ -0,0 +1,274 @@
+import hashlib
+
+import pandas as pd
+
+from utils.aggregation import STANDARD_MEASURES, aggregate, frame_fingerprint
+from utils.bitmaps import build_bitmap_index, build_genre_bitmap_index
+from utils.changes import MAX_DELTA_SHARE, MIN_INCREMENTAL_ROWS, diff_by_appid
+from utils.concentration import (
+    LORENZ_POINTS,
+    TOP_COUNTS,
+    TOP_FRACTIONS,
+    market_concentration,
+)
+from utils.cube import CUBE_DIMENSIONS, DataCube, build_cube, build_genre_cube
+from utils.dataset import overlay
+from utils.feature_engineering import (
+    PRICE_TIERS,
+    PRICING_TYPES,
+    price_bucket,
+    pricing_type,
+    primary_genre,
+)
+from utils.genre_matrix import build_genre_matrix
+from utils.result_cache import result_cache
+from utils.sketches import RELATIVE_ACCURACY
+
+_registry = {}
+
+
+# -------------------------
+# Derived Feature Registry
+# -------------------------
+def feature(name, depends_on=(), update=None, config=None):
+    """
+    Declares a derived column or table. `depends_on` lists base columns or
+    other registered features; the decorated function receives them as
+    positional arguments in that order. Features with an
+    `update(previous, retracted, inserted)` are carried across dataset
+    versions by applying the change delta (see `carry_forward`). `config`
+    holds the settings the values depend on (tier edges and labels, sketch
+    accuracy, ...); it is part of the cache key, so values cached on disk
+    under other settings are never served.
+    """
+    def register(compute):
+        _registry[name] = (compute, tuple(depends_on), update, config)
+        return compute
+
+    return register
+
+
+def registered_features():
+    return {name: depends_on for name, (_, depends_on, _, _) in _registry.items()}
+
+
+def base_columns(name):
+    """
+    Source columns a feature is ultimately derived from.
+    """
+    if name not in _registry:
+        return [name]
+    _, depends_on, _, _ = _registry[name]
+    return sorted({column for dependency in depends_on for column in base_columns(dependency)})
+
+
+def get_feature(df, name):
+    """
+    Value of a registered feature for `df`, computed on first access and
+    kept in the shared result cache per dataset version (frame fingerprint).
+    """
+    if name not in _registry:
+        if name in df.columns:
+            return df[name]
+        raise KeyError(f"unknown feature or column: {name!r}")
+
+    compute, depends_on, _, _ = _registry[name]
+
+    return result_cache.get_or_compute(
+        _feature_key(df, name),
+        lambda: compute(*(get_feature(df, dependency) for dependency in depends_on)),
+    )
+
+
+def feature_config(name):
+    """
+    Settings a feature's values depend on: its own `config` and that of
+    every feature it is derived from.
+    """
+    if name not in _registry:
+        return ()
+    _, depends_on, _, config = _registry[name]
+    inherited = tuple(item for dependency in depends_on for item in feature_config(dependency))
+    return ((name, config), *inherited) if config is not None else inherited
+
+
+def _config_digest(name):
+    return hashlib.blake2b(repr(feature_config(name)).encode(), digest_size=8).hexdigest()
+
+
+def _feature_key(df, name):
+    # Keyed on the source columns only, so overlays of the same rows share
+    # values, plus the feature's settings
+    return ("feature", frame_fingerprint(df[base_columns(name)]), name, _config_digest(name))
+
+
+def compute_feature(df, name):
+    """
+    Value of a feature computed straight from `df`, bypassing the cache;
+    meant for small frames such as the rows of a change delta.
+    """
+    if name not in _registry:
+        return df[name]
+    compute, depends_on, _, _ = _registry[name]
+    return compute(*(compute_feature(df, dependency) for dependency in depends_on))
+
+
+def with_features(df, *names):
+    """
+    Overlay of `df` with the named derived columns attached.
+    """
+    return overlay(df, **{name: get_feature(df, name) for name in names})
+
+
+def cube_metrics(df, keys, measures=STANDARD_MEASURES) -> pd.DataFrame:
+    """
+    `get_feature(df, "cube").metrics(keys, measures)` for in-memory rows.
+    Additive measures still roll up the cube cells, but the median column
+    comes from the exact kernel over the rows, like every other in-memory
+    table; sketch medians are for snapshots and streaming, where the rows
+    are gone.
+    """
+    keys, measures = list(keys), list(measures)
+    result = get_feature(df, "cube").metrics(
+        keys, [name for name in measures if name != "median_recommendations"]
+    )
+    if "median_recommendations" not in measures:
+        return result
+
+    rows = with_features(df, *(key for key in keys if key not in df.columns))
+    medians = aggregate(rows, keys, ("median_recommendations",)).set_index(keys)
+    groups = pd.MultiIndex.from_frame(result[keys]) if len(keys) > 1 else result[keys[0]]
+
+    # Groups without facts are not cube cells, so the lookup skips them
+    result.insert(
+        len(keys) + measures.index("median_recommendations"),
+        "median_recommendations",
+        medians["median_recommendations"].reindex(groups).to_numpy(),
+    )
+    return result
+
+
+# -------------------------
+# Incremental Refresh
+# -------------------------
+def carry_forward(previous, current, previous_digests=None, current_digests=None):
+    """
+    Seeds the cache for dataset version `current` with every incremental
+    feature already cached (in memory or on disk) for `previous`, applying
+    the delta between the versions instead of rescanning every row.
+    Returns the DatasetDelta, or None when the versions cannot be matched.
+    Features are left to the next full computation when most rows changed
+    or the dataset is small enough that rebuilding is cheaper.
+    """
+    delta = diff_by_appid(
+        previous, current, previous_digests=previous_digests, current_digests=current_digests
+    )
+    if (
+        delta is None
+        or len(current) < MIN_INCREMENTAL_ROWS
+        or delta.changed_rows > len(current) * MAX_DELTA_SHARE
+    ):
+        return delta
+
+    retracted, inserted = delta.retracted, delta.inserted
+
+    for name, (_, _, update, _) in _registry.items():
+        if update is None:
+            continue
+        value = result_cache.lookup(_feature_key(previous, name))
+        if value is None:
+            continue
+
+        value = update(
+            value,
+            compute_feature(retracted, name) if len(retracted) else None,
+            compute_feature(inserted, name) if len(inserted) else None,
+        )
+        result_cache.put(_feature_key(current, name), value, persist=True)
+
+    return delta
+
+
+# -------------------------
+# Registered Features
+# -------------------------
+@feature("primary_genre", depends_on=["genres"])
+def _primary_genre(genres):
+    return primary_genre(genres)
+
+
+@feature("price_bucket", depends_on=["price"], config=PRICE_TIERS)
+def _price_bucket(price):
+    return price_bucket(price, PRICE_TIERS)
+
+
+@feature("pricing_type", depends_on=["price"], config=PRICING_TYPES)
+def _pricing_type(price):
+    return pricing_type(price, PRICING_TYPES)
+
+
+@feature("genre_matrix", depends_on=["genres"])
+def _genre_matrix(genres):
+    # The exploded genres, kept as a game x genre CSR matrix
+    return build_genre_matrix(genres)
+
+
+@feature(
+    "cube",
+    depends_on=[*CUBE_DIMENSIONS, "appid", "recommendations"],
+    update=DataCube.apply_delta,
+    config={"relative_accuracy": RELATIVE_ACCURACY},
+)
+def _cube(*columns):
+    *dimensions, appid, recommendations = columns
+    return build_cube(
+        pd.concat(dict(zip(CUBE_DIMENSIONS, dimensions)), axis=1), appid, recommendations
+    )
+
+
+@feature(
+    "genre_cube",
+    depends_on=["genre_matrix", "appid", "recommendations", "release_year"],
+    update=DataCube.apply_delta,
+    config={"relative_accuracy": RELATIVE_ACCURACY},
+)
+def _genre_cube(matrix, appid, recommendations, years):
+    # Genre charts cover engaged games only
+    return build_genre_cube(
+        matrix, appid, recommendations, years, mask=(recommendations > 0).to_numpy()
+    )
+
+
+@feature(
+    "filter_indexes",
+    depends_on=["release_year", "genre_matrix", "price_bucket", "pricing_type"],
+)
+def _filter_indexes(release_year, matrix, price_bucket, pricing_type):
+    # Bitmap index per filterable column, keyed like the sidebar filters
+    return {
+        "release_year": build_bitmap_index(release_year),
+        "genres": build_genre_bitmap_index(matrix),
+        "price_bucket": build_bitmap_index(price_bucket),
+        "pricing_type": build_bitmap_index(pricing_type),
+    }
+
+
+@feature(
+    "concentration",
+    depends_on=["recommendations", "publisher", "developer", "primary_genre"],
+    config={
+        "top_counts": TOP_COUNTS,
+        "top_fractions": TOP_FRACTIONS,
+        "lorenz_points": LORENZ_POINTS,
+    },
+)
+def _concentration(recommendations, publisher, developer, primary_genre):
+    # Concentration profile per market dimension (games, publishers, ...)
+    return market_concentration(
+        {
+            "recommendations": recommendations,
+            "publisher": publisher,
+            "developer": developer,
+            "primary_genre": primary_genre,
+        }
+    )
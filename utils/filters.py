@@ -0,0 +1,128 @@
+import streamlit as st
+
+from utils.bitmaps import bitmap_and, bitmap_count, bitmap_rows
+from utils.data_loader import load_aggregates, load_data, use_streaming
+from utils.feature_engineering import PRICE_TIERS, PRICING_TYPES
+from utils.features import get_feature
+
+# Sidebar widget keys, shared by every page
+FILTER_KEYS = {
+    "release_year": "filter_release_year",
+    "genres": "filter_genres",
+    "price_bucket": "filter_price_bucket",
+    "pricing_type": "filter_pricing_type",
+}
+
+
+# -------------------------
+# Row Selection
+# -------------------------
+def filter_selection(df, filters):
+    """
+    Packed bitmap of the rows matching every active filter, or None when no
+    filter is set. Values inside one filter are OR-ed, filters are AND-ed,
+    all on the bitmap indexes built once per dataset version.
+    """
+    if not filters:
+        return None
+
+    indexes = get_feature(df, "filter_indexes")
+    selections = []
+
+    for column, allowed in filters.items():
+        index = indexes[column]
+        if column == "release_year":
+            first, last = allowed
+            allowed = [year for year in index.values if first <= year <= last]
+        selections.append(index.any_of(allowed))
+
+    return bitmap_and(*selections)
+
+
+def apply_filters(df, filters):
+    """
+    Rows of `df` matching `filters`; `df` itself when no filter is set.
+    """
+    selection = filter_selection(df, filters)
+    if selection is None:
+        return df
+    return df.take(bitmap_rows(selection, len(df)))
+
+
+# -------------------------
+# Sidebar
+# -------------------------
+def _filter_options():
+    # A fresh snapshot lists the values without loading the rows
+    aggregates = load_aggregates()
+    if aggregates is not None:
+        years = aggregates.yearly_coverage()["release_year"].tolist()
+        genres = aggregates.genre_metrics()["genres"].tolist()
+    else:
+        indexes = get_feature(load_data(), "filter_indexes")
+        years = indexes["release_year"].values
+        genres = indexes["genres"].values
+
+    return sorted(int(year) for year in years), sorted(genres)
+
+
+def sidebar_filters():
+    """
+    Renders the dashboard-wide filters and returns the active ones as
+    {column: allowed values}, with the year range as (first, last).
+    Returns {} when nothing is filtered.
+    """
+    st.sidebar.header("Filters")
+
+    if use_streaming():
+        st.sidebar.caption("Filters need the in-memory dataset; they are off for streamed data.")
+        return {}
+
+    # Keyed widget state is dropped on page switches unless reassigned
+    for key in FILTER_KEYS.values():
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
+
+    years, genres = _filter_options()
+    filters = {}
+
+    if len(years) > 1:
+        full_range = (years[0], years[-1])
+        key = FILTER_KEYS["release_year"]
+        first, last = st.session_state.setdefault(key, full_range)
+        if first < full_range[0] or last > full_range[1]:
+            st.session_state[key] = full_range
+
+        year_range = st.sidebar.slider("Release year", full_range[0], full_range[1], key=key)
+        if tuple(year_range) != full_range:
+            filters["release_year"] = tuple(year_range)
+
+    for column, label, options in [
+        ("genres", "Genre", genres),
+        ("price_bucket", "Price tier", PRICE_TIERS["labels"]),
+        ("pricing_type", "Free / Paid", PRICING_TYPES["labels"]),
+    ]:
+        selected = st.sidebar.multiselect(label, options, key=FILTER_KEYS[column])
+        if selected:
+            filters[column] = selected
+
+    return filters
+
+
+def filtered_data(filters):
+    """
+    The shared dataset restricted to `filters`, with the match count shown
+    in the sidebar. Stops the page when no game matches.
+    """
+    df = load_data()
+    selection = filter_selection(df, filters)
+    if selection is None:
+        return df
+
+    matches = bitmap_count(selection)
+    st.sidebar.caption(f"{matches:,} of {len(df):,} games match")
+    if matches == 0:
+        st.warning("No games match the current filters.")
+        st.stop()
+
+    return df.take(bitmap_rows(selection, len(df)))
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+
+# -------------------------
+# Game x Genre Incidence (CSR)
+# -------------------------
+class GenreMatrix:
+    """
+    Sparse game x genre incidence matrix in CSR layout.
+    Row i lists the genre ids of game i in
+    `indices[indptr[i]:indptr[i + 1]]`; `vocabulary[id]` is the genre name.
+    """
+
+    def __init__(self, indptr, indices, vocabulary):
+        self.indptr = indptr
+        self.indices = indices
+        self.vocabulary = vocabulary
+
+    @property
+    def n_rows(self):
+        return len(self.indptr) - 1
+
+    @property
+    def n_genres(self):
+        return len(self.vocabulary)
+
+    def row_ids(self):
+        """
+        Row number of every stored entry (the COO view of the matrix).
+        """
+        return np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+
+    def weighted_sum(self, weights):
+        """
+        Computes M^T @ weights: per-genre sum of a per-row vector.
+        """
+        return np.bincount(
+            self.indices,
+            weights=np.asarray(weights, dtype="float64")[self.row_ids()],
+            minlength=self.n_genres,
+        )
+
+    def cell_sums(self, row_codes, n_codes, weights):
+        """
+        Per (genre, row group) sums of per-row vectors: for each name in
+        `weights`, entry [g, c] adds that vector over the rows coded `c`
+        that list genre `g`. Rows coded -1 are skipped. Returns one
+        (n_genres, n_codes) array per name.
+        """
+        rows = self.row_ids()
+        codes = np.asarray(row_codes)[rows]
+        kept = codes >= 0
+        rows = rows[kept]
+        cells = self.indices[kept].astype("int64") * n_codes + codes[kept]
+
+        return {
+            name: np.bincount(
+                cells,
+                weights=np.asarray(values, dtype="float64")[rows],
+                minlength=self.n_genres * n_codes,
+            ).reshape(self.n_genres, n_codes)
+            for name, values in weights.items()
+        }
+
+
+def _split_tokens(values):
+    tokens = pd.Series(values, dtype="object").str.split(",").explode().str.strip()
+    return tokens[tokens.notna() & (tokens != "")]
+
+
+def build_genre_matrix(genres: pd.Series) -> GenreMatrix:
+    """
+    Splits the comma-separated `genres` column into a GenreMatrix.
+    Each distinct genre string is split once; rows are then gathered
+    through its codes, so the work scales with distinct strings.
+    """
+    codes, uniques = pd.factorize(genres, use_na_sentinel=True)
+    if len(uniques) == 0:
+        # No listed genres at all: every row is empty
+        return GenreMatrix(
+            np.zeros(len(codes) + 1, dtype="int64"),
+            np.empty(0, dtype="int32"),
+            np.empty(0, dtype=object),
+        )
+
+    tokens = _split_tokens(uniques)
+    genre_ids, vocabulary = pd.factorize(tokens, sort=True)
+
+    # CSR over the distinct genre strings
+    unique_lengths = np.bincount(tokens.index.to_numpy(), minlength=len(uniques))
+    unique_indptr = np.concatenate(([0], np.cumsum(unique_lengths)))
+
+    # Gather the rows: missing genres (code -1) get an empty row
+    safe_codes = np.where(codes >= 0, codes, 0)
+    row_lengths = np.where(codes >= 0, unique_lengths[safe_codes], 0)
+    indptr = np.concatenate(([0], np.cumsum(row_lengths)))
+
+    starts = np.repeat(unique_indptr[safe_codes], row_lengths)
+    offsets = np.arange(indptr[-1]) - np.repeat(indptr[:-1], row_lengths)
+    indices = genre_ids[starts + offsets].astype("int32")
+
+    return GenreMatrix(indptr, indices, np.asarray(vocabulary, dtype=object))
@@ -0,0 +1,275 @@
+import numpy as np
+
+_SIGN_BIT = np.uint32(0x80000000)
+
+
+# -------------------------
+# Order-Preserving Sort Keys
+# -------------------------
+def _float32_keys(values):
+    bits = values.view(np.uint32)
+    return np.where(bits & _SIGN_BIT, ~bits, bits | _SIGN_BIT)
+
+
+def _decode_float32_keys(keys):
+    keys = keys.astype(np.uint32)
+    bits = np.where(keys & _SIGN_BIT, keys & ~_SIGN_BIT, ~keys)
+    return bits.view(np.float32).astype("float64")
+
+
+def _uint32_keys(values):
+    """
+    Maps values to uint32 keys that sort in the same order, plus a decoder
+    back to float64. Returns (None, None) when no lossless mapping exists.
+    """
+    if len(values) == 0:
+        return values.astype(np.uint32), lambda keys: keys.astype("float64")
+
+    kind = values.dtype.kind
+
+    if kind in "ub":
+        if values.max() < 2**32:
+            return values.astype(np.uint32), lambda keys: keys.astype("float64")
+
+    elif kind == "i":
+        if values.min() >= -(2**31) and values.max() < 2**31:
+            keys = (values.astype(np.int64) + 2**31).astype(np.uint32)
+            return keys, lambda keys: keys.astype("float64") - 2**31
+
+    elif kind == "f":
+        as_f32 = values.astype(np.float32)
+        if values.dtype == np.float32 or np.array_equal(as_f32, values):
+            return _float32_keys(as_f32), _decode_float32_keys
+
+    return None, None
+
+
+# -------------------------
+# Segmented Sort
+# -------------------------
+class SortedSegments:
+    """
+    Values sorted within each group by one global sort.
+    Group g occupies positions `starts[g]:starts[g] + counts[g]` in
+    ascending order. Values stay packed as sort keys and are only decoded
+    at the positions a query reads.
+    """
+
+    def __init__(self, packed, starts, counts, decode):
+        self.packed = packed
+        self.starts = starts
+        self.counts = counts
+        self._decode = decode
+
+    def values_at(self, positions):
+        return self._decode(self.packed[positions] & 0xFFFFFFFF)
+
+    def sorted_values(self):
+        return self.values_at(slice(None))
+
+    def quantile(self, q):
+        """
+        Linear-interpolated quantile `q` of every group (NaN for empty ones),
+        matching pandas/NumPy's default interpolation.
+        """
+        out = np.full(len(self.counts), np.nan)
+        present = self.counts > 0
+        if not present.any():
+            return out
+
+        position = q * (self.counts[present] - 1)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        fraction = position - lower
+
+        base = self.starts[present]
+        low_values = self.values_at(base + lower)
+        high_values = self.values_at(base + upper)
+
+        out[present] = low_values + (high_values - low_values) * fraction
+        return out
+
+
+def sort_segments(codes, values, n_groups) -> SortedSegments:
+    """
+    Sorts `values` within each integer group code in [0, n_groups).
+    Rows with a negative code or a NaN value are dropped.
+    """
+    codes = np.asarray(codes)
+    values = np.asarray(values)
+
+    valid = codes >= 0
+    if values.dtype.kind == "f":
+        valid &= ~np.isnan(values)
+    if not valid.all():
+        codes = codes[valid]
+        values = values[valid]
+
+    counts = np.bincount(codes, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+
+    keys, decode = _uint32_keys(values)
+    if keys is None:
+        # General path: sort by value once, then pack ranks instead of values
+        order = np.argsort(values, kind="stable")
+        keys = np.empty(len(values), dtype=np.uint32)
+        keys[order] = np.arange(len(values), dtype=np.uint32)
+        sorted_by_value = values[order].astype("float64")
+        decode = lambda ranks: sorted_by_value[ranks.astype(np.int64)]
+
+    # Group code in the high half, value key in the low half: a plain sort
+    # of one int64 array orders by group, then by value
+    packed = codes.astype(np.int64) << 32
+    packed |= keys
+    packed.sort()
+
+    return SortedSegments(packed, starts, counts, decode)
+
+
+# -------------------------
+# Segmented Quantiles
+# -------------------------
+def segmented_quantile(codes, values, n_groups, q=0.5):
+    """
+    Per-group quantile of `values` for integer group `codes` in [0, n_groups).
+    """
+    return sort_segments(codes, values, n_groups).quantile(q)
+
+
+def segmented_quantiles(codes, values, n_groups, qs):
+    """
+    Several per-group quantiles from a single sort. Returns {q: array}.
+    """
+    segments = sort_segments(codes, values, n_groups)
+    return {q: segments.quantile(q) for q in qs}
+
+
+def segmented_median(codes, values, n_groups):
+    return segmented_quantile(codes, values, n_groups, 0.5)
+
+
+# -------------------------
+# Overview KPIs
+# -------------------------
+def _present(values):
+    values = np.asarray(values)
+    if values.dtype.kind == "f":
+        valid = ~np.isnan(values)
+        return values[valid], valid
+    return values, None
+
+
+def _presence_table(present):
+    """
+    Offsets of integral values into a table spanning min..max, when that
+    table is small enough to beat hashing or sorting; None otherwise.
+    """
+    if len(present) == 0 or present.dtype.kind not in "iuf":
+        return None
+
+    low, high = present.min(), present.max()
+    if high - low >= max(4 * len(present), 1 << 22):
+        return None
+    if present.dtype.kind == "f" and not np.array_equal(present, np.floor(present)):
+        return None
+
+    offsets = (present - low).astype(np.intp)
+    seen = np.zeros(int(high - low) + 1, dtype=bool)
+    seen[offsets] = True
+    return low, offsets, seen
+
+
+def dense_codes(values):
+    """
+    Integer codes in [0, n) for `values` (-1 where missing) plus the sorted
+    labels. Integral values in a narrow range (years, ids) go through a
+    presence table instead of being hashed or sorted.
+    """
+    present, valid = _present(values)
+
+    table = _presence_table(present)
+    if table is not None:
+        low, offsets, seen = table
+        present_codes = (np.cumsum(seen) - 1)[offsets]
+        labels = (np.flatnonzero(seen) + low).astype(present.dtype)
+    else:
+        labels, present_codes = np.unique(present, return_inverse=True)
+
+    if valid is None:
+        return present_codes.astype(np.int64), labels
+
+    codes = np.full(len(valid), -1, dtype=np.int64)
+    codes[valid] = present_codes
+    return codes, labels
+
+
+def distinct_count(values):
+    """
+    Number of distinct non-missing values, without hashing.
+    """
+    present, _ = _present(values)
+    table = _presence_table(present)
+    if table is not None:
+        return int(np.count_nonzero(table[2]))
+    return len(np.unique(present))
+
+
+def top_share(values, n_rows, fraction):
+    """
+    Share (0-1) of the total held by the `int(n_rows * fraction)` largest
+    values, found by partial selection instead of a full sort. Missing
+    values count towards `n_rows` but never make the top.
+    """
+    values, _ = _present(values)
+    total = values.sum(dtype="float64")
+    if not total:
+        return 0.0
+
+    top_n = int(n_rows * fraction)
+    if top_n >= len(values):
+        return 1.0
+    if top_n <= 0:
+        return 0.0
+
+    top = np.partition(values, len(values) - top_n)[len(values) - top_n:]
+    return top.sum(dtype="float64") / total
+
+
+def overview_kpis(appid, recommendations, price, genre_codes, n_genres, year_codes, n_years,
+                  top_fraction=0.2) -> dict:
+    """
+    Every overview KPI and summary input from the raw arrays, with group
+    codes supplied by the caller. Counts and totals are single bincount or
+    reduction passes; the top-share threshold is a partial selection.
+    """
+    # The columns are read as stored (possibly memory-mapped views) and
+    # reductions accumulate in float64 instead of upcasting a copy first
+    recommendations = np.asarray(recommendations)
+    price = np.asarray(price)
+    _, valid_recommendations = _present(recommendations)
+    _, valid_price = _present(price)
+
+    genre_valid = genre_codes >= 0
+    if valid_recommendations is not None:
+        genre_valid &= valid_recommendations
+    year_valid = year_codes >= 0
+
+    price_count = len(price) if valid_price is None else int(valid_price.sum())
+    price_sum = np.sum(price, where=True if valid_price is None else valid_price, dtype="float64")
+
+    return {
+        "total_games": distinct_count(appid),
+        "total_recommendations": np.sum(
+            recommendations,
+            where=True if valid_recommendations is None else valid_recommendations,
+            dtype="float64",
+        ),
+        "price_mean": price_sum / price_count if price_count else np.nan,
+        "free_count": int((price == 0).sum()),
+        "rows": len(recommendations),
+        "genre_totals": np.bincount(
+            genre_codes[genre_valid], weights=recommendations[genre_valid], minlength=n_genres
+        ),
+        "year_counts": np.bincount(year_codes[year_valid], minlength=n_years),
+        "top_share": top_share(recommendations, len(recommendations), top_fraction),
+    }
@@ -1,27 +1,56 @@
 import pandas as pd
 import numpy as np
 
+from utils.aggregation import aggregate, aggregate_quantiles
+from utils.concentration import concentration_profile
+from utils.feature_engineering import PRICING_TYPES, pricing_type
+from utils.features import get_feature
+from utils.kernels import dense_codes, overview_kpis
+from utils.profiling import profile_frame
+
+
+def _kpi_codes(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy().astype(np.int64), series.cat.categories
+    if series.dtype.kind in "iuf":
+        return dense_codes(series.to_numpy())
+    codes, labels = pd.factorize(series, sort=True)
+    return codes.astype(np.int64), labels
+
 
 def compute_overview_metrics(df: pd.DataFrame) -> dict:
+    """
+    Overview KPIs, plus the yearly release counts the summary needs, from
+    one pass of the NumPy KPI kernel over the raw arrays.
+    """
+    genre_codes, genres = _kpi_codes(df["primary_genre"])
+    year_codes, years = _kpi_codes(df["release_year"])
+
+    kpis = overview_kpis(
+        df["appid"].to_numpy(),
+        df["recommendations"].to_numpy(),
+        df["price"].to_numpy(),
+        genre_codes,
+        len(genres),
+        year_codes,
+        len(years),
+    )
+
     metrics = {}
 
-    metrics["total_games"] = df["appid"].nunique()
-    metrics["total_recommendations"] = int(df["recommendations"].sum())
-    metrics["avg_price"] = round(df["price"].mean(), 2)
-    metrics["free_pct"] = round((df["price"] == 0).mean() * 100, 1)
+    metrics["total_games"] = kpis["total_games"]
+    metrics["total_recommendations"] = int(kpis["total_recommendations"])
+    metrics["avg_price"] = round(float(kpis["price_mean"]), 2)
+    metrics["free_pct"] = round(kpis["free_count"] / kpis["rows"] * 100, 1) if kpis["rows"] else 0.0
 
-    genre_reco = (
-        df.groupby("primary_genre")["recommendations"]
-        .sum()
-        .sort_values(ascending=False)
-    )
-    metrics["top_genre"] = genre_reco.index[0] if not genre_reco.empty else "N/A"
+    genre_totals = kpis["genre_totals"]
+    metrics["top_genre"] = genres[int(np.argmax(genre_totals))] if len(genre_totals) else "N/A"
 
     # Concentration metric (Top 20% games share)
-    top_20_pct_cutoff = int(len(df) * 0.2)
-    sorted_reco = df["recommendations"].sort_values(ascending=False)
-    metrics["top_20_share"] = round(
-        sorted_reco.head(top_20_pct_cutoff).sum() / sorted_reco.sum() * 100, 1
+    metrics["top_20_share"] = round(kpis["top_share"] * 100, 1)
+
+    metrics["releases_by_year"] = pd.Series(
+        kpis["year_counts"], index=pd.Index(years, name="release_year")
     )
 
     return metrics
@@ -30,8 +59,10 @@ def compute_overview_metrics(df: pd.DataFrame) -> dict:
 def generate_overview_summary(df: pd.DataFrame, metrics: dict) -> list[str]:
     summary = []
 
-    # Market growth
-    releases_by_year = df.groupby("release_year").size()
+    # Market growth (every metrics source supplies the yearly counts)
+    releases_by_year = metrics.get("releases_by_year")
+    if releases_by_year is None:
+        releases_by_year = df.groupby("release_year").size()
     if releases_by_year.is_monotonic_increasing:
         summary.append(
             "The number of games released shows a consistent upward trend, suggesting increasing market saturation on Steam."
@@ -70,18 +101,12 @@ def compute_genre_metrics(df: pd.DataFrame) -> pd.DataFrame:
     - total_recommendations
     - avg_recommendations
     """
-    genre_metrics = (
-        df.groupby("primary_genre")
-        .agg(
-            game_count=("appid", "count"),
-            total_recommendations=("recommendations", "sum"),
-            avg_recommendations=("recommendations", "mean"),
-        )
-        .reset_index()
+    return aggregate(
+        df,
+        ["primary_genre"],
+        ["game_count", "total_recommendations", "avg_recommendations"],
     )
 
-    return genre_metrics
-
 
 def generate_genre_summary(genre_metrics):
     top_genre = genre_metrics.iloc[0]
@@ -165,8 +190,14 @@ def generate_pricing_summary(df, bucket_stats):
     # -----------------------------
     # 2. Free vs Paid Performance
     # -----------------------------
-    free_median = df[df["price"] == 0]["recommendations"].median()
-    paid_median = df[df["price"] > 0]["recommendations"].median()
+    # Free/paid medians merged from the pricing-type sketches
+    free_median, paid_median = (
+        aggregate_quantiles(
+            df.assign(pricing_type=pricing_type(df["price"])), ["pricing_type"], [0.5]
+        )[0.5]
+        .reindex(PRICING_TYPES["labels"])
+        .to_numpy()
+    )
 
     if free_median > paid_median:
         summary_points.append(
@@ -222,12 +253,7 @@ def generate_dev_pub_summary(publisher_stats, developer_stats):
     # -------------------------
     # Top Publisher Dominance
     # -------------------------
-    top_share = (
-        publisher_stats.sort_values("total_recommendations", ascending=False)
-        .head(5)["total_recommendations"]
-        .sum()
-        / publisher_stats["total_recommendations"].sum()
-    )
+    top_share = concentration_profile(publisher_stats["total_recommendations"])["top_5_share"]
 
     points.append(
         f"The top five publishers account for approximately **{top_share:.1%}** of total player engagement, indicating a highly concentrated market."
@@ -317,28 +343,30 @@ def generate_market_trends_summary(yearly_stats, genre_yearly):
 
 import numpy as np
 
+def _is_right_skewed(profile, column):
+    # Median below a third of the mean: a long tail of low values
+    return profile.quantiles([0.5]).at[column, 0.5] < profile.mean(column) / 3
+
 def calculate_dataset_health_score(df):
     score = 100
 
     # -------------------------
     # Completeness Penalty
     # -------------------------
-    missing_penalty = df.isna().mean().mean() * 100
+    profile = profile_frame(df)
+    missing_penalty = profile.missing_share() * 100
     score -= missing_penalty * 0.5
 
     # -------------------------
     # Skewness Penalty
     # -------------------------
-    if df["recommendations"].median() < df["recommendations"].mean() / 3:
+    if _is_right_skewed(profile, "recommendations"):
         score -= 15
 
     # -------------------------
     # Concentration Penalty
     # -------------------------
-    top_pub_share = (
-        df["publisher"].value_counts().head(10).sum()
-        / df["publisher"].count()
-    )
+    top_pub_share = get_feature(df, "concentration")["publisher_catalogs"]["top_10_share"]
 
     if top_pub_share > 0.5:
         score -= 15
@@ -370,12 +398,14 @@ def generate_dataset_health_summary(df, score):
             "The dataset exhibits significant limitations, and conclusions should be treated cautiously."
         )
 
-    if df.isna().mean().mean() > 0.05:
+    profile = profile_frame(df)
+
+    if profile.missing_share() > 0.05:
         points.append(
             "Some key fields contain missing values, which may affect segmentation and comparative analysis."
         )
 
-    if df["recommendations"].median() < df["recommendations"].mean() / 3:
+    if _is_right_skewed(profile, "recommendations"):
         points.append(
             "Engagement data is heavily right-skewed, indicating a strong long-tail distribution."
         )
@@ -401,22 +431,10 @@ def calculate_health_score(missing_df, yearly_df):
     return max(score, 0)
 
 def entity_metrics(df, entity_col):
-    df = df.copy()
-
-    metrics = (
-        df.groupby(entity_col)
-        .agg(
-            game_count=("appid", "count"),
-            total_recommendations=("recommendations", "sum"),
-            avg_recommendations=("recommendations", "mean"),
-            median_recommendations=("recommendations", "median"),
-        )
-        .reset_index()
-        .sort_values("total_recommendations", ascending=False)
+    return aggregate(df, [entity_col]).sort_values(
+        "total_recommendations", ascending=False
     )
 
-    return metrics
-
 def generate_entity_summary(entity_stats, entity_type="Developer"):
     top_entity = entity_stats.iloc[0]
 
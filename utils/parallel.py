@@ -0,0 +1,177 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from utils.kernels import segmented_median
+from utils.sketches import integral
+
+# Worker processes for partitioned aggregation (env var overrides the CPU count)
+WORKERS_ENV = "STEAM_DASHBOARD_WORKERS"
+
+# Below this many rows the serial engine is faster than shipping buffers
+PARALLEL_MIN_ROWS = 1_000_000
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def default_workers():
+    configured = os.environ.get(WORKERS_ENV)
+    if configured:
+        return max(int(configured), 1)
+    return os.cpu_count() or 1
+
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # Spawned workers only import numpy and utils.kernels, and are
+            # safe to start from Streamlit's threaded server
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = workers
+        return _pool
+
+
+@atexit.register
+def _shutdown_pool():
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+
+
+# -------------------------
+# Shared Column Buffers
+# -------------------------
+def _share(array):
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    return block, (block.name, array.dtype.str, array.shape)
+
+
+def _attach(spec):
+    name, dtype, shape = spec
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _partition_stats(codes, values, has_appid):
+    entities, local = np.unique(codes, return_inverse=True)
+    n_local = len(entities)
+
+    game_count = np.bincount(local, weights=has_appid, minlength=n_local)
+    valid = ~np.isnan(values)
+    recommendation_count = np.bincount(local[valid], minlength=n_local)
+    totals = np.bincount(local[valid], weights=values[valid], minlength=n_local)
+    medians = segmented_median(local, values, n_local)
+
+    return entities, game_count, recommendation_count, totals, medians
+
+
+def _aggregate_partition(specs, start, stop):
+    """
+    Worker: aggregates rows [start, stop) of the shared, partition-ordered
+    buffers. Every group lives in exactly one partition.
+    """
+    blocks, arrays = zip(*(_attach(spec) for spec in specs))
+    try:
+        return _partition_stats(*(array[start:stop] for array in arrays))
+    finally:
+        # Views into the buffers must go before the blocks can close
+        del arrays
+        for block in blocks:
+            block.close()
+
+
+# -------------------------
+# Partitioned Group Aggregation
+# -------------------------
+def _group_codes(column):
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy().astype(np.int64), column.cat.categories
+    codes, labels = pd.factorize(column, sort=True)
+    return codes.astype(np.int64), labels
+
+
+def _group_labels(column, labels, codes):
+    # Keys typed like the serial engine's: categorical keys stay categorical
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return pd.Categorical.from_codes(codes, dtype=column.dtype)
+    return labels.take(codes)
+
+
+def partitioned_metrics(df, column, workers=None, min_rows=PARALLEL_MIN_ROWS):
+    """
+    Per-group game_count, total/avg/median recommendations for one key
+    column (publisher, developer, ...), computed by hash-partitioning rows
+    on the key across a process pool.
+    Column buffers travel through shared memory instead of pickling the
+    frame. Returns None when the input is too small (or only one worker is
+    configured) so callers can use the serial engine. Values and dtypes
+    match the serial engine's exact path (QUANTILE_METHOD = "exact").
+    """
+    workers = workers or default_workers()
+    if workers <= 1 or len(df) < min_rows:
+        return None
+
+    codes, labels = _group_codes(df[column])
+    keep = codes >= 0
+
+    # Multiplicative hash spreads consecutive group ids across partitions
+    partition = ((codes[keep] * 2654435761) % 2**32 % workers).astype(np.uint16)
+    order = np.flatnonzero(keep)[np.argsort(partition, kind="stable")]
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(partition, minlength=workers))))
+
+    recommendations = df["recommendations"].to_numpy(dtype="float64")
+    buffers = [
+        codes[order],
+        recommendations[order],
+        df["appid"].notna().to_numpy(dtype="float64")[order],
+    ]
+    shared = [_share(array) for array in buffers]
+    specs = [spec for _, spec in shared]
+
+    try:
+        pool = _get_pool(workers)
+        futures = [
+            pool.submit(_aggregate_partition, specs, bounds[p], bounds[p + 1])
+            for p in range(workers)
+            if bounds[p + 1] > bounds[p]
+        ]
+        parts = [future.result() for future in futures]
+    finally:
+        for block, _ in shared:
+            block.close()
+            block.unlink()
+
+    entities, game_count, recommendation_count, totals, medians = (
+        np.concatenate(field) for field in zip(*parts)
+    )
+    order = np.argsort(entities)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        averages = totals[order] / recommendation_count[order]
+
+    result = pd.DataFrame(
+        {
+            column: _group_labels(df[column], labels, entities[order]),
+            "game_count": game_count[order].astype("int64"),
+            "total_recommendations": totals[order],
+            "avg_recommendations": averages,
+            "median_recommendations": medians[order],
+        }
+    )
+    if integral(recommendations):
+        result["total_recommendations"] = result["total_recommendations"].astype("int64")
+
+    return result
@@ -0,0 +1,149 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+
+from utils.binning import histogram
+from utils.box_stats import tier_box_stats
+from utils.data_loader import load_aggregates, load_data
+from utils.feature_engineering import top_entity_metrics
+from utils.features import cube_metrics, get_feature, with_features
+from utils.profiling import profile_frame
+
+# Background threads warming page caches; kept small so the landing page
+# and the first interactive sessions keep most of the CPU
+PREFETCH_WORKERS = 2
+
+
+# -------------------------
+# Warm-Up Tasks
+# -------------------------
+def _warm_overview():
+    df = with_features(load_data(), "primary_genre")
+    histogram(df, "recommendations", nbins=60)
+    tier_box_stats(df, "recommendations")
+    get_feature(df, "cube")
+    get_feature(df, "concentration")
+
+
+def _warm_entities():
+    df = load_data().dropna(subset=["developer", "publisher", "recommendations"])
+    for column in ["publisher", "developer"]:
+        top_entity_metrics(df, column, 15)
+
+
+def _warm_health():
+    df = load_data()
+    profile_frame(df)
+    get_feature(df, "concentration")
+
+
+def _warm_features(*names):
+    def warm():
+        df = load_data()
+        for name in names:
+            get_feature(df, name)
+
+    return warm
+
+
+def _warm_cube_metrics(keys, *names):
+    def warm():
+        df = load_data()
+        cube_metrics(df, keys)
+        for name in names:
+            get_feature(df, name)
+
+    return warm
+
+
+def _needs_rows(warm):
+    # Pages render from a snapshot or streamed partials when one is
+    # available; the row-level caches are then never read
+    def task():
+        if load_aggregates() is not None:
+            return False
+        warm()
+        return True
+
+    return task
+
+
+def prefetch_tasks():
+    """
+    (name, callable) per warm-up task, in submission order. Each fills the
+    same caches the pages read for the unfiltered dataset; a task returning
+    False had nothing to warm.
+    """
+    return [
+        ("Page aggregates", lambda: load_aggregates() is not None),
+        ("Dataset", _needs_rows(load_data)),
+        ("Sidebar filters", _needs_rows(_warm_features("filter_indexes"))),
+        ("Executive Overview", _needs_rows(_warm_overview)),
+        ("Genre Intelligence", _needs_rows(_warm_features("genre_cube"))),
+        ("Pricing & Monetization", _needs_rows(_warm_cube_metrics(["price_bucket"]))),
+        ("Developer & Publisher", _needs_rows(_warm_entities)),
+        ("Market Trends", _needs_rows(_warm_cube_metrics(["release_year"], "genre_cube"))),
+        ("Dataset Health", _needs_rows(_warm_health)),
+    ]
+
+
+# -------------------------
+# Background Prefetcher
+# -------------------------
+class Prefetcher:
+    """
+    Runs warm-up tasks on a small background thread pool and records the
+    state of each (pending, running, done, skipped, failed) with its
+    duration. Starting it returns immediately; failures are recorded, never
+    raised, since the page recomputes on demand anyway.
+    """
+
+    def __init__(self, tasks, max_workers=PREFETCH_WORKERS):
+        self._lock = threading.Lock()
+        self._status = {
+            name: {"task": name, "state": "pending", "seconds": None, "error": None}
+            for name, _ in tasks
+        }
+
+        executor = ThreadPoolExecutor(max_workers, thread_name_prefix="prefetch")
+        for name, task in tasks:
+            executor.submit(self._run, name, task)
+        # Queued tasks still run; the worker threads exit when they are done
+        executor.shutdown(wait=False)
+
+    def _update(self, name, **fields):
+        with self._lock:
+            self._status[name].update(fields)
+
+    def _run(self, name, task):
+        self._update(name, state="running")
+        start = time.perf_counter()
+        try:
+            warmed = task()
+            fields = {"state": "skipped" if warmed is False else "done"}
+        except Exception as exc:
+            fields = {"state": "failed", "error": repr(exc)}
+        self._update(name, seconds=round(time.perf_counter() - start, 2), **fields)
+
+    def status(self) -> pd.DataFrame:
+        with self._lock:
+            return pd.DataFrame([dict(entry) for entry in self._status.values()])
+
+    def progress(self):
+        """
+        (finished, total) task counts; failed and skipped tasks are finished.
+        """
+        with self._lock:
+            states = [entry["state"] for entry in self._status.values()]
+        return sum(state not in ("pending", "running") for state in states), len(states)
+
+
+@st.cache_resource
+def start_prefetch() -> Prefetcher:
+    """
+    Starts warming every page's caches once per server process.
+    """
+    return Prefetcher(prefetch_tasks())
@@ -0,0 +1,453 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from utils.aggregation import frame_fingerprint
+from utils.kernels import dense_codes
+from utils.result_cache import result_cache
+from utils.sketches import KEY_LEVEL, bucket_keys, integral, merge_sketches, sketch_percentiles
+
+PROFILE_CHUNK_ROWS = 250_000
+
+# Most frequent values reported per column
+TOP_VALUES = 5
+
+# Values whose counts are tracked per column. Columns with at most this
+# many distinct values keep exact counts (and an exact distinct count);
+# beyond it only the heaviest values of each chunk are kept.
+FREQUENCY_CAPACITY = 1024
+
+# HyperLogLog precision: 2**12 one-byte registers per column, about 1.6%
+# standard error on distinct counts
+DISTINCT_PRECISION = 12
+
+PROFILE_QUANTILES = (0.25, 0.5, 0.75)
+
+
+# -------------------------
+# Approximate Distinct Counts
+# -------------------------
+def _mix64(x):
+    # splitmix64 finalizer; uint64 arithmetic wraps
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _hash_strings(values):
+    # Each byte is weighted by a mixed hash of its position and summed per
+    # string straight from the Arrow buffers: no Python string objects
+    array = pa.array(values, type=pa.large_string())
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+
+    _, offsets, data = array.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.empty(0, np.uint8)
+    data = data[offsets[0]:offsets[-1]]
+
+    starts, lengths = offsets[:-1] - offsets[0], np.diff(offsets)
+    position = np.arange(len(data), dtype=np.int64) - np.repeat(starts, lengths)
+    weights = _mix64(np.arange(1, lengths.max(initial=0) + 1, dtype=np.uint64))
+    terms = data.astype(np.uint64) * weights[position]
+
+    sums = np.zeros(len(starts), dtype=np.uint64)
+    filled = lengths > 0
+    if filled.any():
+        sums[filled] = np.add.reduceat(terms, starts[filled])
+    return _mix64(sums ^ _mix64(lengths.astype(np.uint64)))
+
+
+def _hash_values(values):
+    """
+    64-bit hash per value of an Index of distinct non-null values. Numbers
+    hash by their float64 value, so int and float columns agree.
+    """
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "iufb":
+        # + 0.0 folds -0.0 into 0.0
+        return _mix64((values.to_numpy(dtype="float64") + 0.0).view(np.uint64))
+    if pd.api.types.is_string_dtype(values.dtype):
+        try:
+            return _hash_strings(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def _register_updates(hashes, precision=DISTINCT_PRECISION):
+    # HyperLogLog: the top bits pick a register, which keeps the longest
+    # run of leading zeros (plus one) seen in the remaining bits. Those
+    # bits fit a float64 mantissa, so frexp gives their bit length exactly.
+    index = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+    rest = hashes & np.uint64((1 << (64 - precision)) - 1)
+    _, bit_length = np.frexp(rest.astype("float64"))
+    return index, (64 - precision + 1 - bit_length).astype(np.uint8)
+
+
+def _estimate_distinct(registers):
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.ldexp(1.0, -registers.astype(np.int64)))
+
+    # Small cardinalities: linear counting over the empty registers
+    empty = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and empty:
+        estimate = m * np.log(m / empty)
+    return int(round(estimate))
+
+
+# -------------------------
+# Chunk Statistics
+# -------------------------
+def _is_numeric(values):
+    return isinstance(values.dtype, np.dtype) and values.dtype.kind in "iuf"
+
+
+def _value_counts(values):
+    # Counts per distinct non-null value; numeric labels come out sorted
+    if _is_numeric(values):
+        # Narrow integer ranges count through a presence table, not a hash
+        codes, labels = dense_codes(values.to_numpy())
+        counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+        return pd.Series(counts, index=pd.Index(labels), dtype="int64")
+
+    return values.value_counts(dropna=True, sort=False).astype("int64")
+
+
+def _heaviest_positions(counts, k=FREQUENCY_CAPACITY):
+    # Positions of the k largest counts (ties broken arbitrarily), in order
+    return np.sort(np.argpartition(counts, len(counts) - k)[len(counts) - k:])
+
+
+def _heaviest(counts, k=FREQUENCY_CAPACITY):
+    return counts.iloc[_heaviest_positions(counts.to_numpy(), k)]
+
+
+def _sketch_counts(column, labels, counts):
+    # Bucket counts of one non-negative column from its sorted distinct
+    # values, as a sketch with a "column" group level; bucket keys are
+    # monotonic in the value, so each bucket is a run of labels
+    keys = bucket_keys(labels)
+    starts = np.flatnonzero(np.diff(keys, prepend=keys[0] - 1))
+    return pd.Series(
+        np.add.reduceat(counts, starts).astype("int64"),
+        index=pd.MultiIndex.from_arrays(
+            [np.full(len(starts), column, dtype=object), keys[starts]], names=["column", KEY_LEVEL]
+        ),
+        name="count",
+    )
+
+
+def _exact_quantiles(counts, qs):
+    # Linear interpolation between the order statistics of ranks floor(h)
+    # and ceil(h), h = q * (n - 1), read off value counts
+    counts = counts.sort_index()
+    cumulative = np.cumsum(counts.to_numpy())
+    values = counts.index.to_numpy(dtype="float64")
+
+    position = np.asarray(qs, dtype="float64") * (cumulative[-1] - 1)
+    lower = values[np.searchsorted(cumulative, np.floor(position), side="right")]
+    upper = values[np.searchsorted(cumulative, np.ceil(position), side="right")]
+    return lower + (upper - lower) * (position - np.floor(position))
+
+
+def _merge_stats(acc, new):
+    if acc is None or new is None:
+        return new if acc is None else acc
+
+    grouped = pd.concat([acc, new]).groupby(level=0, sort=False)
+    merged = grouped[["nulls", "count"]].sum()
+    if "sum" in acc or "sum" in new:
+        merged["sum"] = grouped["sum"].sum(min_count=1)
+        merged["min"] = grouped["min"].min()
+        merged["max"] = grouped["max"].max()
+        merged["integral"] = grouped["integral"].min()
+    return merged
+
+
+# -------------------------
+# Dataset Profile
+# -------------------------
+class DatasetProfile:
+    """
+    Per-column statistics folded from row chunks in one pass: null count,
+    approximate distinct count (HyperLogLog), min / max / mean and a
+    quantile sketch for numeric columns, and the most frequent values.
+    Every field is a sum, a min / max, a register-wise max or a sketch, so
+    profiles of disjoint rows combine with `merge`, like
+    StreamingAggregates. Memory is bounded per column, not per row.
+    """
+
+    def __init__(self):
+        self.row_count = 0
+        self.dtypes = {}
+        self.stats = None
+        self.sketch = None
+        self.registers = {}
+        self.frequencies = {}
+        self.exact = {}
+        self._category_hashes = {}
+
+    def __getstate__(self):
+        # Category hashes only speed up folding chunks of one frame
+        return {**vars(self), "_category_hashes": {}}
+
+    # ---------- folding ----------
+    def fold(self, chunk):
+        """
+        Adds one chunk of rows (any columns) to the profile.
+        """
+        self.row_count += len(chunk)
+        stats, sketches = {}, []
+
+        for column in chunk.columns:
+            values = chunk[column]
+            self.dtypes.setdefault(column, str(values.dtype))
+            nulls = int(values.isna().sum())
+            row = stats[column] = {"nulls": nulls, "count": len(values) - nulls}
+            if not row["count"]:
+                continue
+
+            # One count per distinct value; the other statistics are read
+            # off it. Registers keep maxima, so hashing each distinct value
+            # once is the same as hashing every row.
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                counts, hashes = self._category_counts(column, values)
+            else:
+                counts = _value_counts(values)
+                hashes = _hash_values(counts.index)
+
+            if _is_numeric(values):
+                labels, weights = counts.index.to_numpy(dtype="float64"), counts.to_numpy()
+                row.update(
+                    sum=float(labels @ weights),
+                    min=labels[0],
+                    max=labels[-1],
+                    integral=integral(labels),
+                )
+                # Log-bucket sketches hold non-negative values only
+                if row["min"] >= 0:
+                    sketches.append(_sketch_counts(column, labels, weights))
+
+            self._fold_distinct(column, hashes)
+            self._fold_frequencies(column, counts)
+
+        self.stats = _merge_stats(self.stats, pd.DataFrame.from_dict(stats, orient="index"))
+        self.sketch = merge_sketches(self.sketch, *sketches)
+        return self
+
+    def _category_counts(self, column, values):
+        # Counts by code, with labels taken only for the heaviest observed
+        # categories; hashes cover every observed one
+        categories = values.cat.categories
+        counts = np.bincount(values.cat.codes.to_numpy() + 1, minlength=len(categories) + 1)[1:]
+        observed = np.flatnonzero(counts)
+
+        # Chunks of one frame share its categories: hash them once
+        cached, hashes = self._category_hashes.get(column, (None, None))
+        if cached is not categories:
+            hashes = _hash_values(categories)
+            self._category_hashes[column] = (categories, hashes)
+        hashes = hashes[observed]
+
+        if len(observed) > FREQUENCY_CAPACITY:
+            observed = observed[_heaviest_positions(counts[observed])]
+            self.exact[column] = False
+        return pd.Series(counts[observed], index=categories.take(observed), dtype="int64"), hashes
+
+    def _fold_distinct(self, column, hashes):
+        registers = self.registers.setdefault(
+            column, np.zeros(1 << DISTINCT_PRECISION, dtype=np.uint8)
+        )
+        index, rank = _register_updates(hashes)
+        np.maximum.at(registers, index, rank)
+
+    def _fold_frequencies(self, column, counts):
+        exact = self.exact.get(column, True)
+        if len(counts) > FREQUENCY_CAPACITY:
+            counts, exact = _heaviest(counts), False
+
+        previous = self.frequencies.get(column)
+        if previous is not None:
+            counts = previous.add(counts, fill_value=0).astype("int64")
+            if len(counts) > FREQUENCY_CAPACITY:
+                counts, exact = _heaviest(counts), False
+
+        self.frequencies[column] = counts
+        self.exact[column] = exact
+
+    def merge(self, other):
+        """
+        Combines profiles built from disjoint sets of rows.
+        """
+        merged = DatasetProfile()
+        merged.row_count = self.row_count + other.row_count
+        merged.dtypes = {**self.dtypes, **{c: d for c, d in other.dtypes.items() if c not in self.dtypes}}
+        merged.stats = _merge_stats(self.stats, other.stats)
+        merged.sketch = merge_sketches(self.sketch, other.sketch)
+
+        for profile in (self, other):
+            for column, registers in profile.registers.items():
+                if column in merged.registers:
+                    registers = np.maximum(merged.registers[column], registers)
+                merged.registers[column] = registers.copy()
+            for column, counts in profile.frequencies.items():
+                merged.exact[column] = merged.exact.get(column, True) and profile.exact[column]
+                merged._fold_frequencies(column, counts)
+        return merged
+
+    # ---------- statistics ----------
+    @property
+    def columns(self):
+        return list(self.dtypes)
+
+    def null_count(self, column) -> int:
+        return int(self.stats.at[column, "nulls"])
+
+    def missing_share(self) -> float:
+        """
+        Share of missing cells over all columns (mean of per-column shares).
+        """
+        if not self.row_count or self.stats is None:
+            return 0.0
+        return float((self.stats["nulls"] / self.row_count).mean())
+
+    def distinct_count(self, column) -> int:
+        """
+        Exact while the column's frequencies fit FREQUENCY_CAPACITY,
+        otherwise the HyperLogLog estimate.
+        """
+        if column not in self.registers:
+            return 0
+        if self.exact[column]:
+            return len(self.frequencies[column])
+        return _estimate_distinct(self.registers[column])
+
+    def mean(self, column) -> float:
+        count = self.stats.at[column, "count"]
+        total = self.stats.at[column, "sum"] if "sum" in self.stats else np.nan
+        return float(total / count) if count and pd.notna(total) else np.nan
+
+    def quantiles(self, qs=PROFILE_QUANTILES) -> pd.DataFrame:
+        """
+        Quantiles per numeric column, one column per q (linear
+        interpolation, as pandas' default). Exact while the column's
+        frequencies are, otherwise read from its sketch (see
+        utils/sketches.py for the bound; whole-number columns are rounded).
+        Columns holding negative values past FREQUENCY_CAPACITY have none.
+        """
+        has_sketch = self.sketch is not None and len(self.sketch)
+        sketched = {
+            integer: (
+                sketch_percentiles(self.sketch, qs, integer=integer)
+                if has_sketch
+                else pd.DataFrame(columns=list(qs), dtype="float64")
+            )
+            for integer in (False, True)
+        }
+
+        numeric = [
+            column
+            for column in self.columns
+            if self.stats is not None and "min" in self.stats and pd.notna(self.stats.at[column, "min"])
+        ]
+
+        rows = {}
+        for column in numeric:
+            integer = bool(self.stats.at[column, "integral"])
+            if self.exact.get(column, False):
+                rows[column] = _exact_quantiles(self.frequencies[column], qs)
+            elif column in sketched[integer].index and self.stats.at[column, "min"] >= 0:
+                rows[column] = sketched[integer].loc[column].to_numpy(dtype="float64")
+
+        return pd.DataFrame.from_dict(rows, orient="index", columns=list(qs), dtype="float64")
+
+    def value_counts(self, column) -> pd.Series:
+        """
+        Tracked values of `column`, most frequent first; all of them while
+        `exact[column]` holds.
+        """
+        counts = self.frequencies.get(column, pd.Series(dtype="int64"))
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def top_values(self, column, k=TOP_VALUES) -> pd.Series:
+        return self.value_counts(column).head(k)
+
+    # ---------- page tables ----------
+    def missing_value_summary(self) -> pd.DataFrame:
+        """
+        Same shape as `missing_value_summary(df)`: missing_pct per column.
+        """
+        nulls = self.stats["nulls"].reindex(self.columns)
+        return (
+            nulls.div(self.row_count or 1)
+            .mul(100)
+            .round(2)
+            .reset_index()
+            .rename(columns={"index": "column", "nulls": "missing_pct"})
+        )
+
+    def frequency_table(self, column, name="records") -> pd.DataFrame:
+        """
+        Rows per value of a low-cardinality column, ordered by value.
+        """
+        return (
+            self.value_counts(column)
+            .sort_index()
+            .rename_axis(column)
+            .reset_index(name=name)
+        )
+
+    def summary(self) -> pd.DataFrame:
+        """
+        One row per column: dtype, non-null and distinct counts, missing
+        share, numeric range, mean and quartiles, and the top values.
+        """
+        quantiles = self.quantiles()
+        rows = []
+        for column in self.columns:
+            stats = self.stats.loc[column]
+            top = self.top_values(column)
+            rows.append(
+                {
+                    "column": column,
+                    "dtype": self.dtypes[column],
+                    "count": int(stats["count"]),
+                    "missing_pct": round(stats["nulls"] / (self.row_count or 1) * 100, 2),
+                    "distinct": self.distinct_count(column),
+                    "distinct_exact": bool(self.exact.get(column, True)),
+                    "min": stats.get("min", np.nan),
+                    "max": stats.get("max", np.nan),
+                    "mean": self.mean(column),
+                    **{
+                        f"p{round(q * 100)}": (
+                            quantiles.at[column, q] if column in quantiles.index else np.nan
+                        )
+                        for q in PROFILE_QUANTILES
+                    },
+                    "top_values": ", ".join(f"{value} ({count:,})" for value, count in top.items()),
+                }
+            )
+        return pd.DataFrame(rows)
+
+
+def profile_chunks(chunks) -> DatasetProfile:
+    profile = DatasetProfile()
+    for chunk in chunks:
+        profile.fold(chunk)
+    return profile
+
+
+def profile_frame(df, chunk_rows=PROFILE_CHUNK_ROWS) -> DatasetProfile:
+    """
+    Profile of every column of `df`, folded `chunk_rows` rows at a time
+    and memoized per frame fingerprint (dataset version and selected rows).
+    """
+    def compute():
+        return profile_chunks(
+            df.iloc[start:start + chunk_rows] for start in range(0, max(len(df), 1), chunk_rows)
+        )
+
+    return result_cache.get_or_compute(("profile", frame_fingerprint(df), chunk_rows), compute)
@@ -0,0 +1,193 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.disk_cache import default_disk_cache
+
+# Byte budget of the shared result cache (env var, in MB)
+CACHE_BUDGET_ENV = "STEAM_DASHBOARD_CACHE_MB"
+DEFAULT_BUDGET_MB = 512
+
+
+# -------------------------
+# Size Estimation
+# -------------------------
+def estimate_nbytes(value, _seen=None):
+    """
+    Approximate memory held by a cached value: exact for frames and arrays,
+    recursive for containers and plain objects (cubes, indexes, matrices).
+    Objects reached twice are counted once.
+    """
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (np.ndarray, pd.Categorical)):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_nbytes(key, seen) + estimate_nbytes(item, seen) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(item, seen) for item in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + estimate_nbytes(vars(value), seen)
+    return sys.getsizeof(value)
+
+
+# -------------------------
+# Size-Aware LRU Cache
+# -------------------------
+class ResultCache:
+    """
+    Thread-safe LRU cache bounded by an estimated byte budget rather than an
+    entry count. Inserting evicts least recently used entries until the new
+    value fits; a value larger than the whole budget is not stored.
+    Hits, misses and evictions are counted for tuning.
+    An optional `store` (see utils.disk_cache) backs `get_or_compute`:
+    misses are looked up there before computing, and computed values are
+    written through, so results outlive the process.
+    """
+
+    def __init__(self, budget_bytes, store=None):
+        self.budget_bytes = budget_bytes
+        self.store = store
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._computing = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return default
+
+    def lookup(self, key, default=None):
+        """
+        Like `get`, falling back to the store without computing anything.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel and self.store is not None:
+            value = self.store.get(key, sentinel)
+            if value is not sentinel:
+                self.put(key, value)
+        return default if value is sentinel else value
+
+    def put(self, key, value, persist=False):
+        """
+        Stores `value` in memory; `persist` also writes it to the store.
+        """
+        if persist and self.store is not None:
+            self.store.put(key, value)
+
+        nbytes = estimate_nbytes(value)
+
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            if nbytes > self.budget_bytes:
+                return value
+
+            while self._entries and self.bytes + nbytes > self.budget_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.bytes -= evicted_bytes
+                self.evictions += 1
+
+            self._entries[key] = (value, nbytes)
+            self.bytes += nbytes
+
+        return value
+
+    def get_or_compute(self, key, compute):
+        """
+        Cached value for `key`, computing and storing it on a miss.
+        Concurrent misses on one key (e.g. a page and the background
+        prefetch) compute it once; the other callers wait for that result.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is not sentinel:
+            return value
+
+        with self._lock:
+            key_lock = self._computing.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    return self._entries[key][0]
+            try:
+                if self.store is not None:
+                    value = self.store.get(key, sentinel)
+                    if value is not sentinel:
+                        return self.put(key, value)
+
+                return self.put(key, compute(), persist=True)
+            finally:
+                with self._lock:
+                    self._computing.pop(key, None)
+
+    def entries(self):
+        """
+        (key, value) pairs from least to most recently used, without
+        touching the LRU order or the counters.
+        """
+        with self._lock:
+            return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            }
+
+
+def default_budget_bytes():
+    return int(float(os.environ.get(CACHE_BUDGET_ENV, DEFAULT_BUDGET_MB)) * 1024**2)
+
+
+# One cache per process, shared by the aggregation engine and the feature
+# registry: every session and filter combination draws on the same budget.
+# The disk tier behind it is shared by every process and survives restarts.
+result_cache = ResultCache(default_budget_bytes(), store=default_disk_cache())
+
+
+def cache_stats() -> dict:
+    return result_cache.stats()
+
+
+def disk_cache_stats():
+    """
+    Stats of the disk tier, or None when it is disabled.
+    """
+    return result_cache.store.stats() if result_cache.store is not None else None
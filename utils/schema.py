@@ -0,0 +1,93 @@
+import pandas as pd
+
+# Bump whenever the dtype plan changes so cached Parquet files are rebuilt
+SCHEMA_VERSION = 3
+
+# Free-text columns that repeat heavily across rows (dictionary-encoded)
+CATEGORICAL_COLUMNS = ["genres", "publisher", "developer"]
+
+# Only encode when distinct values are at most this share of the rows;
+# above it the category table costs more than it saves
+MAX_CATEGORY_RATIO = 0.5
+
+# Numeric columns and the downcast family they belong to ("float" columns
+# keep float64: narrower floats would round decimal prices)
+NUMERIC_COLUMNS = {
+    "appid": "unsigned",
+    "price": "float",
+    "recommendations": "unsigned",
+    "release_year": "integer",
+}
+
+
+# -------------------------
+# Dtype Plan
+# -------------------------
+def _downcast(series, kind):
+    if kind == "float":
+        # float32 cannot hold most decimal prices (19.99 reads back as
+        # 19.9899998), so float columns keep full precision
+        return pd.to_numeric(series).astype("float64")
+
+    values = pd.to_numeric(series)
+
+    # Integer dtypes cannot hold NaN. float64 still stores every integer up
+    # to 2**53 exactly (float32 only up to 2**24), so the column stays lossless
+    if values.isna().any():
+        return values.astype("float64")
+
+    if kind == "unsigned" and (values < 0).any():
+        kind = "integer"
+
+    return pd.to_numeric(values, downcast=kind)
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Applies the explicit dtype plan to a freshly parsed frame:
+    - low-cardinality string columns become categoricals
+    - integer columns are downcast to the smallest lossless dtype
+      (float64 when they have missing values); float columns stay float64
+    """
+    df = df.copy()
+
+    for column in CATEGORICAL_COLUMNS:
+        if column not in df.columns or isinstance(df[column].dtype, pd.CategoricalDtype):
+            continue
+        if df[column].nunique() <= len(df) * MAX_CATEGORY_RATIO:
+            df[column] = df[column].astype("category")
+
+    for column, kind in NUMERIC_COLUMNS.items():
+        if column in df.columns:
+            df[column] = _downcast(df[column], kind)
+
+    return df
+
+
+# -------------------------
+# Memory Reporting
+# -------------------------
+def memory_usage(df: pd.DataFrame) -> dict:
+    """
+    Returns deep memory usage in bytes per column.
+    """
+    return {
+        column: int(nbytes)
+        for column, nbytes in df.memory_usage(index=False, deep=True).items()
+    }
+
+
+def memory_report(before: dict, after: dict) -> pd.DataFrame:
+    """
+    Compares two `memory_usage` snapshots column by column.
+    """
+    report = pd.DataFrame(
+        {"before_bytes": pd.Series(before), "after_bytes": pd.Series(after)}
+    ).fillna(0).astype("int64")
+
+    report.loc["total"] = report.sum()
+    report["saving_pct"] = (
+        (1 - report["after_bytes"] / report["before_bytes"]).mul(100).round(1)
+    )
+
+    return report.rename_axis("column").reset_index()
@@ -0,0 +1,205 @@
+import numpy as np
+import pandas as pd
+
+# Relative accuracy of every quantile read from a sketch
+RELATIVE_ACCURACY = 0.01
+
+# Bucket key reserved for exact zeros (log-buckets cannot hold 0)
+ZERO_KEY = np.iinfo(np.int32).min
+
+KEY_LEVEL = "key"
+
+
+# -------------------------
+# Log-Bucketed Quantile Sketch
+# -------------------------
+# A sketch is a pandas Series of counts indexed by (group levels..., key).
+# Bucket k holds values in (gamma^(k-1), gamma^k] with
+# gamma = (1 + a) / (1 - a), a = RELATIVE_ACCURACY.
+#
+# Accuracy: quantile q of a group of n values sits at rank h = q * (n - 1).
+# The sketch reads the representative values of the buckets holding the
+# order statistics of ranks floor(h) and ceil(h) and interpolates linearly
+# between them, like pandas' default (so a median of two values is their
+# midpoint). Every value in a bucket is within a relative error `a` of its
+# representative, and so is any interpolation between two of them:
+#     |estimate - exact| <= a * exact
+# for any group, any q and any roll-up. Zeros are stored exactly. For
+# integer data the representatives are rounded before interpolating, which
+# makes them exact below 1 / (2a) (50 at the default) and adds at most 0.5
+# above it.
+#
+# Merging is adding counts per (group, key), so sketches built from any
+# split of the rows combine into exactly the sketch of the union, and a
+# roll-up carries the same bound as a sketch built from the raw rows.
+def _gamma(relative_accuracy):
+    return (1 + relative_accuracy) / (1 - relative_accuracy)
+
+
+def bucket_keys(values, relative_accuracy=RELATIVE_ACCURACY):
+    values = np.asarray(values, dtype="float64")
+    if (values < 0).any():
+        raise ValueError("quantile sketches only accept non-negative values")
+
+    keys = np.full(len(values), ZERO_KEY, dtype=np.int64)
+    positive = values > 0
+    keys[positive] = np.ceil(
+        np.log(values[positive]) / np.log(_gamma(relative_accuracy))
+    )
+    return keys
+
+
+def bucket_values(keys, relative_accuracy=RELATIVE_ACCURACY):
+    """
+    Representative value of each bucket: within `relative_accuracy` of
+    every value the bucket holds.
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    gamma = _gamma(relative_accuracy)
+    values = 2 * np.power(gamma, keys.astype("float64")) / (gamma + 1)
+    return np.where(keys == ZERO_KEY, 0.0, values)
+
+
+def integral(values) -> bool:
+    """
+    True when every non-missing value is a whole number. Decided from the
+    values, not the dtype: integer columns with gaps are stored as floats.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iub":
+        return True
+    if values.dtype.kind != "f":
+        return False
+    return bool(np.array_equal(values, np.floor(values), equal_nan=True))
+
+
+def group_levels(sketch):
+    return [name for name in sketch.index.names if name != KEY_LEVEL]
+
+
+def _empty_sketch(levels):
+    return pd.Series(
+        [], dtype="int64", name="count",
+        index=pd.MultiIndex.from_arrays([[]] * (len(levels) + 1), names=[*levels, KEY_LEVEL]),
+    )
+
+
+def build_sketch(
+    groups, values, relative_accuracy=RELATIVE_ACCURACY, dropna=True
+) -> pd.Series:
+    """
+    Builds one sketch per group. `groups` is a named Series (one group
+    level) or a DataFrame (one level per column). Rows with a missing value
+    are skipped, and so are rows with a missing group unless `dropna` is
+    False (roll-ups drop missing labels of the levels they keep).
+    """
+    groups = groups.to_frame() if isinstance(groups, pd.Series) else groups
+    groups = groups.reset_index(drop=True)
+    values = pd.Series(values, dtype="float64").reset_index(drop=True)
+
+    valid = values.notna()
+    if dropna:
+        valid &= groups.notna().all(axis=1)
+    valid = valid.to_numpy()
+
+    frame = groups[valid].reset_index(drop=True)
+    levels = list(frame.columns)
+    frame[KEY_LEVEL] = bucket_keys(values[valid].to_numpy(), relative_accuracy)
+
+    return (
+        frame.groupby([*levels, KEY_LEVEL], observed=True, dropna=dropna)
+        .size()
+        .rename("count")
+    )
+
+
+def merge_sketches(*sketches) -> pd.Series:
+    """
+    Merges sketches with the same group levels and relative accuracy.
+    Groups present in several inputs are combined bucket by bucket.
+    """
+    sketches = [s for s in sketches if s is not None]
+    non_empty = [s for s in sketches if len(s)]
+    if not non_empty:
+        return sketches[0] if sketches else None
+
+    merged = pd.concat(non_empty)
+    return merged.groupby(level=list(merged.index.names), observed=True).sum().rename("count")
+
+
+def roll_up(sketch, levels=(), mapping=None) -> pd.Series:
+    """
+    Merges group sketches into coarser groups without touching rows:
+    keeps only the group `levels` listed (an empty list merges everything
+    into one sketch), after optionally relabelling them with
+    `mapping = {level: {old_label: new_label}}`.
+    """
+    levels = list(levels)
+    if not len(sketch):
+        return _empty_sketch(levels or ["all"])
+
+    keys = [
+        sketch.index.get_level_values(level).map(mapping[level])
+        if mapping and level in mapping
+        else sketch.index.get_level_values(level)
+        for level in levels
+    ]
+    if not keys:
+        keys = [np.full(len(sketch), "all", dtype=object)]
+        levels = ["all"]
+
+    keys.append(sketch.index.get_level_values(KEY_LEVEL))
+    return (
+        sketch.groupby(keys, observed=True).sum()
+        .rename_axis([*levels, KEY_LEVEL])
+        .rename("count")
+    )
+
+
+def sketch_quantiles(
+    sketch, q, relative_accuracy=RELATIVE_ACCURACY, integer=False
+) -> pd.Series:
+    """
+    Quantile `q` of every group in the sketch, indexed by the group levels,
+    interpolated like pandas' default. `integer` rounds the bucket values
+    first (for whole-number data). See the accuracy note at the top of this
+    module.
+    """
+    if sketch is None or not len(sketch):
+        return pd.Series([], dtype="float64")
+
+    sketch = sketch.sort_index()
+    counts = sketch.to_numpy()
+    keys = sketch.index.get_level_values(KEY_LEVEL).to_numpy()
+    group_codes, groups = pd.factorize(sketch.index.droplevel(KEY_LEVEL))
+
+    cumulative = np.cumsum(counts)
+    totals = np.bincount(group_codes, weights=counts).astype(np.int64)
+    group_starts = np.cumsum(totals) - totals
+
+    def bucket_at(ranks):
+        positions = np.searchsorted(cumulative, group_starts + ranks, side="right")
+        values = bucket_values(keys[positions], relative_accuracy)
+        return np.round(values) if integer else values
+
+    position = q * (totals - 1)
+    lower = np.floor(position).astype(np.int64)
+    low_values = bucket_at(lower)
+    high_values = bucket_at(np.ceil(position).astype(np.int64))
+    values = low_values + (high_values - low_values) * (position - lower)
+
+    return pd.Series(values, index=groups)
+
+
+def sketch_percentiles(sketch, qs, **kwargs) -> pd.DataFrame:
+    """
+    Several quantiles per group, one column per q.
+    """
+    return pd.DataFrame({q: sketch_quantiles(sketch, q, **kwargs) for q in qs})
+
+
+def sketch_totals(sketch) -> pd.Series:
+    """
+    Number of values summarized per group.
+    """
+    return sketch.groupby(level=group_levels(sketch), observed=True).sum()
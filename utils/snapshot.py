@@ -0,0 +1,186 @@
+import io
+import json
+import os
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from utils.binning import histogram
+from utils.box_stats import tier_box_stats
+from utils.concentration import concentration_tables, profiles_from_tables
+from utils.cube import cube_genre_metrics, cube_genre_yearly_totals
+from utils.feature_engineering import entity_metrics, yearly_coverage
+from utils.features import get_feature, with_features
+from utils.metrics import compute_overview_metrics
+from utils.profiling import profile_frame
+
+# Bumped whenever the set or shape of materialized tables changes
+SNAPSHOT_VERSION = 5
+
+# Histogram resolutions materialized for the overview page
+HISTOGRAM_BINS = (60,)
+
+MANIFEST = "manifest.json"
+
+
+# -------------------------
+# Materialized Page Aggregates
+# -------------------------
+def materialize(df) -> dict:
+    """
+    Runs every aggregate the six pages render, on the in-memory dataset.
+    Returns {"scalars": {...}, "tables": {name: DataFrame}}.
+    """
+    base = df
+    df = with_features(base, "primary_genre")
+    cube = get_feature(base, "cube")
+    genre_cube = get_feature(base, "genre_cube")
+    profile = profile_frame(base)
+
+    overview = compute_overview_metrics(df)
+    tables = {
+        "releases_by_year": overview.pop("releases_by_year").reset_index(name="games"),
+        "box_stats/pricing_type": tier_box_stats(df, "recommendations"),
+        "metrics/primary_genre": cube.metrics(["primary_genre"]),
+        "metrics/price_bucket": cube.metrics(["price_bucket"]),
+        "metrics/release_year": cube.metrics(["release_year"]),
+        "genre_metrics": cube_genre_metrics(genre_cube),
+        "genre_yearly_totals": cube_genre_yearly_totals(genre_cube),
+        "missing_value_summary": profile.missing_value_summary(),
+        "yearly_coverage": yearly_coverage(base),
+        "column_profile": profile.summary(),
+    }
+
+    entities = df.dropna(subset=["developer", "publisher", "recommendations"])
+    for column in ["publisher", "developer"]:
+        tables[f"metrics/{column}"] = entity_metrics(entities, column)
+
+    tables["concentration"], tables["lorenz"] = concentration_tables(
+        get_feature(base, "concentration")
+    )
+
+    for nbins in HISTOGRAM_BINS:
+        tables[f"histogram/{nbins}"] = histogram(df, "recommendations", nbins=nbins)
+
+    return {"scalars": overview, "tables": tables}
+
+
+# -------------------------
+# Snapshot File
+# -------------------------
+def _json_scalar(value):
+    if isinstance(value, np.floating):
+        # Shortest repr, so a rounded float32 reads back as displayed
+        return float(str(value))
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def write_snapshot(materialized, path, source=None):
+    """
+    Writes the materialized aggregates to one zip file: a JSON manifest
+    (scalars plus the source signature it was built from) and one Parquet
+    member per table. The file is replaced atomically.
+    """
+    manifest = {
+        "snapshot_version": SNAPSHOT_VERSION,
+        "source": source,
+        "scalars": {key: _json_scalar(value) for key, value in materialized["scalars"].items()},
+        "tables": sorted(materialized["tables"]),
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    # Parquet members are compressed already
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr(MANIFEST, json.dumps(manifest))
+        for name, table in materialized["tables"].items():
+            buffer = io.BytesIO()
+            table.to_parquet(buffer, index=False)
+            archive.writestr(f"{name}.parquet", buffer.getvalue())
+    os.replace(tmp_path, path)
+
+
+def read_manifest(path):
+    try:
+        with zipfile.ZipFile(path) as archive:
+            manifest = json.loads(archive.read(MANIFEST))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+    if manifest.get("snapshot_version") != SNAPSHOT_VERSION:
+        return None
+    return manifest
+
+
+def read_snapshot(path):
+    """
+    Loads a snapshot written by `write_snapshot`, or None if it is missing,
+    unreadable or from another snapshot version.
+    """
+    manifest = read_manifest(path)
+    if manifest is None:
+        return None
+
+    with zipfile.ZipFile(path) as archive:
+        tables = {
+            name: pd.read_parquet(io.BytesIO(archive.read(f"{name}.parquet")))
+            for name in manifest["tables"]
+        }
+    return Snapshot(manifest["scalars"], tables)
+
+
+class Snapshot:
+    """
+    Page aggregates read back from a snapshot file. Exposes the same
+    methods as StreamingAggregates, so pages render from either; values
+    match the in-memory pages: year, genre and tier medians come from the
+    cube's sketches (see utils/sketches.py for the bound), entity medians
+    are exact and box plots keep their sampled outliers.
+    """
+
+    def __init__(self, scalars, tables):
+        self.scalars = scalars
+        self.tables = tables
+
+    def _table(self, name):
+        return self.tables[name].copy()
+
+    def metrics(self, dimension) -> pd.DataFrame:
+        return self._table(f"metrics/{dimension}")
+
+    def box_stats(self, dimension) -> pd.DataFrame:
+        box = self._table(f"box_stats/{dimension}")
+        box["outliers"] = box["outliers"].map(np.asarray)
+        return box
+
+    def genre_metrics(self) -> pd.DataFrame:
+        return self._table("genre_metrics")
+
+    def genre_yearly_totals(self, genres=None) -> pd.DataFrame:
+        totals = self._table("genre_yearly_totals")
+        if genres is not None:
+            totals = totals[totals["genres"].isin(list(genres))]
+        return totals.reset_index(drop=True)
+
+    def overview_metrics(self) -> dict:
+        releases = self.tables["releases_by_year"]
+        return {
+            **self.scalars,
+            "releases_by_year": releases.set_index("release_year")["games"],
+        }
+
+    def concentration(self) -> dict:
+        return profiles_from_tables(self._table("concentration"), self._table("lorenz"))
+
+    def histogram(self, nbins=60) -> pd.DataFrame:
+        return self._table(f"histogram/{nbins}")
+
+    def missing_value_summary(self) -> pd.DataFrame:
+        return self._table("missing_value_summary")
+
+    def yearly_coverage(self) -> pd.DataFrame:
+        return self._table("yearly_coverage")
+
+    def column_profile(self) -> pd.DataFrame:
+        return self._table("column_profile")
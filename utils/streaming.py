@@ -0,0 +1,393 @@
+import numpy as np
+import pandas as pd
+
+from utils.feature_engineering import (
+    PRICE_TIERS,
+    PRICING_TYPES,
+    add_primary_genre,
+    assign_tiers,
+)
+from utils.concentration import CONCENTRATION_DIMENSIONS, concentration_profile
+from utils.genre_matrix import build_genre_matrix
+from utils.profiling import DatasetProfile
+from utils.sketches import (
+    bucket_values,
+    build_sketch,
+    integral,
+    merge_sketches,
+    sketch_percentiles,
+    sketch_quantiles,
+    sketch_totals,
+)
+
+CHUNK_ROWS = 250_000
+
+# Dimensions folded into partial aggregates
+DIMENSIONS = [
+    "release_year",
+    "primary_genre",
+    "price_bucket",
+    "pricing_type",
+    "publisher",
+    "developer",
+]
+
+# Rows behind each dimension's metrics, selected as on the in-memory path:
+# cube facts are the rows with a recommendations value, and the Developer &
+# Publisher page also drops rows missing either entity
+FACT_COLUMNS = ["recommendations"]
+ENTITY_FACT_COLUMNS = ["developer", "publisher", "recommendations"]
+ENTITY_DIMENSIONS = ("publisher", "developer")
+
+# Entity columns of the concentration profiles, which count every row
+# with a known entity
+CONCENTRATION_ENTITIES = sorted(
+    {entity for entity, _ in CONCENTRATION_DIMENSIONS.values() if entity is not None}
+)
+
+
+# -------------------------
+# Chunk Preparation
+# -------------------------
+def _prepare_chunk(chunk):
+    chunk = add_primary_genre(chunk)
+    chunk["price_bucket"] = assign_tiers(
+        chunk["price"], PRICE_TIERS["edges"], PRICE_TIERS["labels"]
+    )
+    chunk["pricing_type"] = assign_tiers(
+        chunk["price"], PRICING_TYPES["edges"], PRICING_TYPES["labels"]
+    )
+    return chunk
+
+
+def _group_partials(chunk, dimension):
+    return (
+        chunk.groupby(dimension, observed=True)
+        .agg(
+            game_count=("appid", "count"),
+            recommendation_count=("recommendations", "count"),
+            total_recommendations=("recommendations", "sum"),
+        )
+        .astype("float64")
+    )
+
+
+def _entity_totals(chunk, entity):
+    # Same totals as utils.concentration.entity_totals
+    return (
+        chunk.groupby(entity, observed=True)
+        .agg(
+            total_recommendations=("recommendations", "sum"),
+            games=("recommendations", "size"),
+        )
+        .astype("float64")
+    )
+
+
+def _add(acc, new):
+    if acc is None or new is None:
+        return new if acc is None else acc
+    return acc.add(new, fill_value=0)
+
+
+# -------------------------
+# Streaming Aggregates
+# -------------------------
+class StreamingAggregates:
+    """
+    Mergeable partial aggregates of the dataset.
+    Every field is a sum over rows (or a quantile sketch, which merges by
+    adding bucket counts), so partials from separate chunks, files or
+    processes combine with `merge` into the partials of the union.
+    Memory grows with the number of groups, not the number of rows.
+    """
+
+    def __init__(self):
+        self.row_count = 0
+        self.profile = DatasetProfile()
+        self.price_sum = 0.0
+        self.price_count = 0
+        self.free_count = 0
+
+        # Games (non-null appid) per release year, for the coverage table
+        self.yearly_games = None
+
+        self.partials = {dimension: None for dimension in DIMENSIONS}
+        self.sketches = {dimension: None for dimension in DIMENSIONS}
+        self.overall_sketch = None
+        self.entity_totals = {entity: None for entity in CONCENTRATION_ENTITIES}
+
+        # Whether every recommendations value seen is a whole number
+        self.integral = True
+
+        # Per-genre partials over engaged games (recommendations > 0)
+        self.genre_partials = None
+        self.genre_year_totals = None
+
+    # ---------- folding ----------
+    def fold(self, chunk):
+        """
+        Adds one raw CSV chunk to the partials.
+        """
+        chunk.columns = chunk.columns.str.lower()
+        self.row_count += len(chunk)
+        self.profile.fold(chunk)
+
+        chunk = _prepare_chunk(chunk)
+        self.price_sum += float(chunk["price"].sum())
+        self.price_count += int(chunk["price"].count())
+        self.free_count += int((chunk["price"] == 0).sum())
+        self.yearly_games = _add(
+            self.yearly_games, chunk.groupby("release_year")["appid"].count().astype("float64")
+        )
+
+        self.integral = self.integral and integral(chunk["recommendations"].to_numpy())
+
+        facts = chunk.dropna(subset=FACT_COLUMNS)
+        entity_facts = chunk.dropna(subset=ENTITY_FACT_COLUMNS)
+
+        for dimension in DIMENSIONS:
+            rows = entity_facts if dimension in ENTITY_DIMENSIONS else facts
+            self.partials[dimension] = _add(
+                self.partials[dimension], _group_partials(rows, dimension)
+            )
+            self.sketches[dimension] = merge_sketches(
+                self.sketches[dimension],
+                build_sketch(rows[dimension], rows["recommendations"]),
+            )
+
+        self.overall_sketch = merge_sketches(
+            self.overall_sketch,
+            build_sketch(pd.Series("all", index=chunk.index, name="all"), chunk["recommendations"]),
+        )
+
+        for entity in CONCENTRATION_ENTITIES:
+            self.entity_totals[entity] = _add(
+                self.entity_totals[entity], _entity_totals(chunk, entity)
+            )
+
+        self._fold_genres(chunk)
+        return self
+
+    def _fold_genres(self, chunk):
+        matrix = build_genre_matrix(chunk["genres"])
+        values = np.nan_to_num(chunk["recommendations"].to_numpy(dtype="float64"))
+        engaged = (values > 0).astype("float64")
+
+        genre_partials = pd.DataFrame(
+            {
+                "game_count": matrix.weighted_sum(engaged),
+                "total_recommendations": matrix.weighted_sum(values),
+            },
+            index=pd.Index(matrix.vocabulary, name="genres"),
+        )
+        self.genre_partials = _add(self.genre_partials, genre_partials)
+
+        year_codes, year_labels = pd.factorize(chunk["release_year"].to_numpy(), sort=True)
+        sums = matrix.cell_sums(
+            year_codes,
+            len(year_labels),
+            {"count": np.ones(len(values)), "recommendations": values},
+        )
+        year_ids, genre_ids = np.nonzero(sums["count"].T)
+        year_totals = pd.Series(
+            sums["recommendations"][genre_ids, year_ids],
+            index=pd.MultiIndex.from_arrays(
+                [year_labels[year_ids], matrix.vocabulary[genre_ids]],
+                names=["release_year", "genres"],
+            ),
+            name="recommendations",
+        )
+        self.genre_year_totals = _add(self.genre_year_totals, year_totals)
+
+    def merge(self, other):
+        """
+        Combines partials built from a disjoint set of rows.
+        """
+        merged = StreamingAggregates()
+        merged.row_count = self.row_count + other.row_count
+        merged.profile = self.profile.merge(other.profile)
+        merged.price_sum = self.price_sum + other.price_sum
+        merged.price_count = self.price_count + other.price_count
+        merged.free_count = self.free_count + other.free_count
+        merged.yearly_games = _add(self.yearly_games, other.yearly_games)
+        merged.integral = self.integral and other.integral
+
+        for dimension in DIMENSIONS:
+            merged.partials[dimension] = _add(
+                self.partials[dimension], other.partials[dimension]
+            )
+            merged.sketches[dimension] = merge_sketches(
+                self.sketches[dimension], other.sketches[dimension]
+            )
+
+        merged.overall_sketch = merge_sketches(self.overall_sketch, other.overall_sketch)
+        for entity in CONCENTRATION_ENTITIES:
+            merged.entity_totals[entity] = _add(
+                self.entity_totals[entity], other.entity_totals[entity]
+            )
+        merged.genre_partials = _add(self.genre_partials, other.genre_partials)
+        merged.genre_year_totals = _add(self.genre_year_totals, other.genre_year_totals)
+        return merged
+
+    # ---------- page aggregates ----------
+    def metrics(self, dimension) -> pd.DataFrame:
+        """
+        Same shape as `aggregate(df, [dimension])`; the median comes from
+        the dimension's quantile sketch.
+        """
+        partials = self.partials[dimension].sort_index()
+        result = partials.rename_axis(dimension).reset_index()
+        result["game_count"] = result["game_count"].astype("int64")
+        result["avg_recommendations"] = (
+            partials["total_recommendations"] / partials["recommendation_count"]
+        ).to_numpy()
+        result["median_recommendations"] = (
+            sketch_quantiles(self.sketches[dimension], 0.5, integer=self.integral)
+            .reindex(partials.index)
+            .to_numpy()
+        )
+        return result.drop(columns="recommendation_count")
+
+    def recommendation_quantiles(self, dimension, qs) -> pd.DataFrame:
+        """
+        Sketch quantiles of recommendations per group, one column per q.
+        """
+        return sketch_percentiles(self.sketches[dimension], qs, integer=self.integral)
+
+    def box_stats(self, dimension) -> pd.DataFrame:
+        """
+        Same columns as `box_stats_from_codes`, read from the sketches.
+        Whiskers are the Tukey fences clamped to the observed range, and no
+        outlier sample is kept.
+        """
+        quantiles = self.recommendation_quantiles(dimension, [0.0, 0.25, 0.5, 0.75, 1.0])
+        iqr = quantiles[0.75] - quantiles[0.25]
+
+        return pd.DataFrame(
+            {
+                "category": quantiles.index,
+                "count": sketch_totals(self.sketches[dimension]).reindex(quantiles.index).to_numpy(),
+                "lowerfence": np.maximum(quantiles[0.0], quantiles[0.25] - 1.5 * iqr).to_numpy(),
+                "q1": quantiles[0.25].to_numpy(),
+                "median": quantiles[0.5].to_numpy(),
+                "q3": quantiles[0.75].to_numpy(),
+                "upperfence": np.minimum(quantiles[1.0], quantiles[0.75] + 1.5 * iqr).to_numpy(),
+                "outliers": [np.empty(0)] * len(quantiles),
+            }
+        )
+
+    def genre_metrics(self) -> pd.DataFrame:
+        stats = self.genre_partials[self.genre_partials["game_count"] > 0]
+        stats = stats.reset_index()
+        stats["game_count"] = stats["game_count"].astype("int64")
+        stats["avg_recommendations"] = (
+            stats["total_recommendations"] / stats["game_count"]
+        )
+        return stats
+
+    def genre_yearly_totals(self, genres=None) -> pd.DataFrame:
+        totals = self.genre_year_totals.reset_index()
+        if genres is not None:
+            totals = totals[totals["genres"].isin(list(genres))]
+        return totals.reset_index(drop=True)
+
+    def overview_metrics(self) -> dict:
+        """
+        Same keys as `compute_overview_metrics`. `total_games` counts
+        non-null appids (ids are unique per row in the source), release
+        counts cover every row with a year, and `top_20_share` is read from
+        the recommendations sketch.
+        """
+        totals = self.partials["primary_genre"]["total_recommendations"]
+        releases_by_year = (
+            self.profile.value_counts("release_year")
+            .sort_index()
+            .astype("int64")
+            .rename_axis("release_year")
+        )
+
+        return {
+            "total_games": self.profile.row_count - self.profile.null_count("appid"),
+            "total_recommendations": int(totals.sum()),
+            "avg_price": round(self.price_sum / self.price_count, 2) if self.price_count else 0.0,
+            "free_pct": round(self.free_count / self.row_count * 100, 1) if self.row_count else 0.0,
+            "top_genre": totals.idxmax() if not totals.empty else "N/A",
+            "top_20_share": self._top_share(0.2),
+            "releases_by_year": releases_by_year,
+        }
+
+    def _top_share(self, fraction):
+        sketch = self.overall_sketch.sort_index(ascending=False)
+        counts = sketch.to_numpy()
+        values = bucket_values(sketch.index.get_level_values("key"))
+
+        top_n = int(counts.sum() * fraction)
+        # Take whole buckets from the top until `top_n` values are covered
+        taken = np.minimum(counts, np.maximum(top_n - (np.cumsum(counts) - counts), 0))
+        total = (values * counts).sum()
+        return round((values * taken).sum() / total * 100, 1) if total else 0.0
+
+    def concentration(self) -> dict:
+        """
+        Same profiles as `market_concentration`. Entity totals are summed
+        over every row with a known entity; the per-game distribution is the
+        recommendations sketch, each bucket weighted by the games it holds.
+        """
+        profiles = {}
+        for dimension, (entity, measure) in CONCENTRATION_DIMENSIONS.items():
+            if entity is None:
+                keys = self.overall_sketch.index.get_level_values("key")
+                profiles[dimension] = concentration_profile(
+                    bucket_values(keys), self.overall_sketch.to_numpy()
+                )
+            else:
+                column = "total_recommendations" if measure == "recommendations" else "games"
+                profiles[dimension] = concentration_profile(self.entity_totals[entity][column])
+        return profiles
+
+    def histogram(self, nbins=60) -> pd.DataFrame:
+        """
+        Fixed-width recommendation histogram, placing each sketch bucket in
+        the bin holding its representative value.
+        """
+        counts = self.overall_sketch.to_numpy()
+        values = bucket_values(self.overall_sketch.index.get_level_values("key"))
+
+        edges = np.linspace(0, values.max() if len(values) else 1, nbins + 1)
+        bins = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, nbins - 1)
+        return pd.DataFrame(
+            {
+                "bin_start": edges[:-1],
+                "bin_end": edges[1:],
+                "games": np.bincount(bins, weights=counts, minlength=nbins).astype("int64"),
+            }
+        )
+
+    def missing_value_summary(self) -> pd.DataFrame:
+        return self.profile.missing_value_summary()
+
+    def yearly_coverage(self) -> pd.DataFrame:
+        """
+        Same shape as `yearly_coverage(df)`: games with an appid per year.
+        """
+        return (
+            self.yearly_games.sort_index()
+            .astype("int64")
+            .rename_axis("release_year")
+            .reset_index(name="records")
+        )
+
+    def column_profile(self) -> pd.DataFrame:
+        return self.profile.summary()
+
+
+def stream_aggregates(path, chunk_rows=CHUNK_ROWS) -> StreamingAggregates:
+    """
+    Reads the CSV `chunk_rows` rows at a time and folds each chunk into
+    StreamingAggregates. Peak memory is one chunk plus the partials.
+    """
+    aggregates = StreamingAggregates()
+    for chunk in pd.read_csv(path, chunksize=chunk_rows):
+        aggregates.fold(chunk)
+    return aggregates